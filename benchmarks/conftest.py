@@ -0,0 +1,121 @@
+"""
+Offline fixtures for the benchmarks of :py:mod:`mlbids`.
+
+By default, the SFBB pages are synthesized in memory by :py:mod:`mlbids.tests.fixtures.generate`,
+at roughly the size of the live player ID map. Set ``MLBIDS_FIXTURES`` to a directory of pages
+recorded by :py:mod:`mlbids.tests.fixtures.record` to benchmark against real data instead.
+
+Install ``requirements-dev.txt`` and run ``pytest benchmarks``; a plain ``pytest`` run collects
+only the unit tests in ``mlbids/tests``. The peak memory traced during one call of each
+benchmarked function is reported after the timings.
+"""
+
+import io
+import os
+import tracemalloc
+import typing
+
+import bs4
+import pytest
+import requests
+import urllib3
+
+from mlbids import _sfbb
+from mlbids import playeridmap
+from mlbids.tests.fixtures import generate
+
+
+# Number of players in the synthesized player ID map
+PLAYERS = 3500
+
+_peak_memory: typing.Dict[str, int] = {}
+
+
+@pytest.fixture(scope="session")
+def pages() -> typing.Dict[str, bytes]:
+    """
+    :return: The body of each SFBB page, by fixture file name
+    """
+    directory = os.environ.get("MLBIDS_FIXTURES")
+    if not directory:
+        return generate.pages(PLAYERS)
+
+    bodies = {}
+    for name in [generate.TOOLS_FILE] + generate.FILES:
+        with open(os.path.join(directory, name), "rb") as file:
+            bodies[name] = file.read()
+    return bodies
+
+
+@pytest.fixture(scope="session")
+def urls(pages: typing.Dict[str, bytes]) -> _sfbb.SFBBTools.URLs:
+    """
+    :return: The redirect URLs linked by the Tools page
+    """
+    soup = bs4.BeautifulSoup(pages[generate.TOOLS_FILE], features="lxml")
+    return _sfbb.SFBBTools._parse_urls(soup)
+
+
+@pytest.fixture(scope="session")
+def data(pages: typing.Dict[str, bytes]):
+    """
+    :return: The formatted player ID map
+    """
+    return playeridmap.PlayerIDMap()._parse_data(pages["webview.html"])
+
+
+@pytest.fixture
+def offline(monkeypatch, pages: typing.Dict[str, bytes], urls: _sfbb.SFBBTools.URLs) -> dict:
+    """
+    Serves the SFBB pages to the shared session of :py:mod:`mlbids._sfbb`, and empties the
+    in-memory cache of the redirect URLs.
+
+    :return: Mapping of URLs to response bodies
+    """
+    bodies = {_sfbb.SFBBTools().base_address: pages[generate.TOOLS_FILE]}
+    bodies.update(zip(urls[1:], (pages[name] for name in generate.FILES)))
+
+    def get(url: str, **kwargs) -> requests.Response:
+        res = requests.Response()
+        res.url = url
+        res.status_code = 200
+        res.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(bodies[url]), preload_content=False, decode_content=False
+        )
+        if not kwargs.get("stream"):
+            res.content  # pylint: disable=pointless-statement
+        return res
+
+    monkeypatch.setattr(_sfbb.get_session(), "get", get)
+    monkeypatch.setattr(_sfbb.SFBBTools, "_url_cache", {})
+    return bodies
+
+
+@pytest.fixture
+def measure(request, benchmark) -> typing.Callable:
+    """
+    :return: Function which traces the peak memory of one call of a function, then benchmarks it
+    """
+    def run(func: typing.Callable, *args) -> typing.Any:
+        tracemalloc.start()
+        try:
+            func(*args)
+            _peak_memory[request.node.name] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory"] = _peak_memory[request.node.name]
+        return benchmark(func, *args)
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """
+    Reports the peak memory of each benchmark.
+    """
+    if not _peak_memory:
+        return
+    terminalreporter.section("peak memory")
+    width = max(len(name) for name in _peak_memory)
+    for name, peak in sorted(_peak_memory.items()):
+        terminalreporter.write_line(f"{name:<{width}}  {peak / 2 ** 20:10.2f} MiB")
@@ -0,0 +1,115 @@
+"""
+Benchmarks of the load pipeline of :py:mod:`mlbids`.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _htmltable
+from mlbids import _sfbb
+from mlbids import playeridmap
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_urls(offline: dict, measure):
+    """
+    Benchmark of a cold scrape of :py:attr:`mlbids._sfbb.SFBBTools.urls`.
+    """
+    def scrape():
+        _sfbb.SFBBTools._url_cache.clear()
+        return _sfbb.SFBBTools().urls
+
+    measure(scrape)
+
+
+def test_read_data(offline: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.read_data`.
+    """
+    measure(playeridmap.PlayerIDMap().read_data)
+
+
+def test_read_csv(offline: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.read_csv`.
+    """
+    measure(playeridmap.PlayerIDMap().read_csv)
+
+
+def test_read_changelog_data(offline: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.read_changelog_data`.
+    """
+    measure(playeridmap.PlayerIDMap().read_changelog_data)
+
+
+def test_read_changelog_csv(offline: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.read_changelog_csv`.
+    """
+    measure(playeridmap.PlayerIDMap().read_changelog_csv)
+
+
+def test_format_playeridmap_df(pages: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap._format_playeridmap_df`, including a
+    copy of the raw ``DataFrame``.
+    """
+    raw = pd.read_csv(io.BytesIO(pages["playeridmap.csv"]))
+    pid_map = playeridmap.PlayerIDMap()
+    measure(lambda: pid_map._format_playeridmap_df(raw.copy()))
+
+
+def test_format_changelog_df(pages: dict, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap._format_changelog_df`, including a copy
+    of the raw ``DataFrame``.
+    """
+    raw = pd.read_csv(io.BytesIO(pages["changelog.csv"]))
+    pid_map = playeridmap.PlayerIDMap()
+    measure(lambda: pid_map._format_changelog_df(raw.copy()))
+
+
+def test_read_table(pages: dict, measure):
+    """
+    Benchmark of :py:func:`mlbids._htmltable.read_table` on the web view.
+    """
+    measure(lambda: _htmltable.read_table(
+        io.BytesIO(pages["webview.html"]), header=0, skip_rows=(1,), skip_columns=(0,)
+    ))
+
+
+def test_read_html(pages: dict, measure):
+    """
+    Benchmark of ``pandas.read_html`` on the web view, the baseline of
+    :py:func:`mlbids._htmltable.read_table`.
+    """
+    measure(lambda: pd.read_html(io.BytesIO(pages["webview.html"]))[0])
+
+
+def test_pidmap(offline: dict, measure):
+    """
+    Benchmark of the construction and full load of :py:class:`mlbids.PIDMap`.
+    """
+    measure(lambda: mlbids.PIDMap().prefetch())
+
+
+def test_load_columnar(tmp_path, data: pd.DataFrame, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.load_columnar`, memory-mapped.
+    """
+    path = playeridmap.PlayerIDMap().save_columnar(str(tmp_path / "map"), data)
+    measure(lambda: playeridmap.PlayerIDMap.load_columnar(path))
+
+
+def test_load_columnar_ids(tmp_path, data: pd.DataFrame, measure):
+    """
+    Benchmark of :py:meth:`mlbids.playeridmap.PlayerIDMap.load_columnar` of two ID columns,
+    memory-mapped.
+    """
+    path = playeridmap.PlayerIDMap().save_columnar(str(tmp_path / "map"), data)
+    measure(lambda: playeridmap.PlayerIDMap.load_columnar(path, columns=["MLBID", "ESPNID"]))
@@ -0,0 +1,97 @@
+"""
+Benchmarks of lookup, translation and search throughput of :py:class:`mlbids.PIDMap`.
+"""
+
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import playeridmap
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def pidmap(monkeypatch, data: pd.DataFrame) -> mlbids.PIDMap:
+    """
+    :return: A :py:class:`mlbids.PIDMap` loaded with the formatted player ID map
+    """
+    monkeypatch.setattr(playeridmap.PlayerIDMap, "read_data", lambda self: data.copy())
+    pid_map = mlbids.PIDMap()
+    pid_map.data  # pylint: disable=pointless-statement
+    return pid_map
+
+
+def test_index(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of building the index over **MLBID**.
+    """
+    measure(lambda: mlbids.IDIndex(pidmap.data.loc[:, "MLBID"], integer=True))
+
+
+def test_translate(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of 1,000 calls of :py:meth:`mlbids.PIDMap.translate`.
+    """
+    values = pidmap.data.loc[:, "MLBID"].tolist()[:1000]
+    pidmap.index("MLBID")
+    measure(lambda: [pidmap.translate(v, from_="MLBID", to="FanGraphsID") for v in values])
+
+
+def test_translate_many(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of :py:meth:`mlbids.PIDMap.translate_many` over 100,000 IDs.
+    """
+    values = pidmap.data.loc[:, "FanGraphsID"].sample(100_000, replace=True, random_state=0)
+    pidmap.index("FanGraphsID")
+    measure(lambda: pidmap.translate_many(values, from_="FanGraphsID", to="MLBID"))
+
+
+def test_search_name(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of :py:meth:`mlbids.PIDMap.search_name`.
+    """
+    pidmap.name_index()
+    measure(lambda: pidmap.search_name("Jose Ramirez Jr."))
+
+
+def test_search_name_matches(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of :py:meth:`mlbids.PIDMap.search_name_matches`.
+    """
+    pidmap.name_index()
+    measure(lambda: pidmap.search_name_matches("Jose Ramirez Jr."))
+
+
+def test_search_names(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of :py:meth:`mlbids.PIDMap.search_names` over a 500-player roster.
+    """
+    roster = pidmap.data.loc[:, "LastFirstName"].sample(500, random_state=0)
+    pidmap.name_index()
+    measure(lambda: pidmap.search_names(roster))
+
+
+def test_filter_rows(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of 1,000 calls of :py:meth:`mlbids.PIDMap.filter_rows`.
+    """
+    teams = pidmap.data.loc[:, "Team"].dropna().unique().tolist()
+    pidmap.filter_index()
+    measure(lambda: [
+        pidmap.filter_rows(position="2B", team=teams[i % len(teams)], active=True)
+        for i in range(1000)
+    ])
+
+
+def test_resolve(pidmap: mlbids.PIDMap, measure):
+    """
+    Benchmark of :py:meth:`mlbids.PIDMap.resolve` over a 1,000,000-row feed, with a third of the
+    rows missing their **MLBID**.
+    """
+    feed = pidmap.data.loc[:, ["MLBID", "MLBName", "Birthdate", "LastFirstName", "Team"]]
+    feed = feed.sample(1_000_000, replace=True, random_state=0).reset_index(drop=True)
+    feed.loc[feed.index % 3 == 0, "MLBID"] = 0
+    keys = ["MLBID", ("MLBName", "Birthdate"), ("LastFirstName", "Team")]
+    pidmap.resolver()
+    measure(lambda: pidmap.resolve(feed, keys))
@@ -2,42 +2,164 @@
 
 """
 
+from concurrent import futures
 import datetime
+import threading
 import typing
 
+import numpy as np
 import pandas as pd
 
+from . import _diff
+from . import _instrument
+from . import _schema
+from ._async import AsyncPlayerIDMap
+from ._diff import ChangeSet
+from ._filter import FilterIndex
+from ._history import VersionStore
+from ._index import IDIndex
+from ._resolve import Resolver, Rule
+from ._search import Match, NameIndex
+from ._shared import SharedIDMap
+from ._snapshot import SnapshotStore
 from .playeridmap import PlayerIDMap
 
 
-def _site_property(columns: list[str]):
+# Columns of the per-site views of :py:class:`PIDMap`, by view name
+_SITE_COLUMNS = {
+    "baseballhq": ["BaseballHQID"],
+    "baseball_prospectus": ["BaseballProspectusID"],
+    "cbs": ["CBSID", "CBSName"],
+    "clay_davenport": ["ClayDavenportID"],
+    "draft_kings": ["DraftKingsName"],
+    "espn": ["ESPNID", "ESPNName"],
+    "fanduel": ["FanDuelID", "FanDuelName"],
+    "fangraphs": ["FanGraphsID", "FanGraphsName"],
+    "fantasy_pros": ["FantasyProsName"],
+    "fantrax": ["FantraxID", "FantraxName"],
+    "kffl": ["KFFLName"],
+    "masterball": ["MastersballName"],
+    "mlb": ["MLBID", "MLBName"],
+    "nfbc": ["NFBCID", "NFBCName", "NFBCLastFirstName"],
+    "ottoneu": ["OttoneuID"],
+    "razzball": ["RazzballName"],
+    "retrosheet": ["RetrosheetID"],
+    "rotowire": ["RotoWireID", "RotoWireName"],
+    "yahoo": ["YahooID", "YahooName"],
+}
+
+# Columns searched by :py:meth:`PIDMap.search_name`
+_NAME_COLUMNS = ["PlayerName", "LastFirstName"] + [
+    c for columns in _SITE_COLUMNS.values() for c in columns if c.endswith("Name")
+]
+
+# Columns of the player ID map in the results of :py:meth:`PIDMap.search_name`
+_SEARCH_RESULT_COLUMNS = ["PlayerID", "PlayerName", "Team", "Birthdate"]
+
+
+def _copy_on_write() -> bool:
+    """
+    :return: Whether ``pandas`` copy-on-write is enabled, so that a shallow copy of a
+        ``DataFrame`` cannot write to the data of the original
     """
+    version = tuple(int(p) for p in pd.__version__.split(".")[:2])
+    if version >= (3, 0):
+        return True
+    return version >= (2, 0) and pd.options.mode.copy_on_write is True
 
-    :param columns:
-    :return:
+
+def _site_property(site: str):
+    """
+    :param site: The name of the view, a key of ``_SITE_COLUMNS``
+    :return: A property which returns the general player information with the *site* columns
     """
     def getter(self):
-        general = self.__getattribute__("general")
-        data = self.__getattribute__("data")
-
-        if not isinstance(general, pd.DataFrame):
-            raise TypeError
-        if not isinstance(data, pd.DataFrame):
-            raise TypeError
+        return self._view(site, _SITE_COLUMNS[site])
 
-        return general.join(data.loc[:, columns])
-    
+    columns = ", ".join(_SITE_COLUMNS[site])
+    getter.__doc__ = f":return: The general player information, with {columns}"
     return property(getter)
 
 
 class PIDMap:
     """
+    The player ID map and its CHANGELOG are each downloaded on first access, so that reading only
+    :py:attr:`PIDMap.changelog` never downloads the player ID map, and vice versa. Call
+    :py:meth:`PIDMap.prefetch` to download both at once.
 
+    :param snapshot: Whether to keep an on-disk snapshot of the player ID map. Pass a directory
+        path to store the snapshot there, or ``True`` to use the default directory. The snapshot
+        is reused for as long as the CHANGELOG reports no newer version.
+    :param history: Whether to keep every downloaded version of the player ID map, for
+        :py:meth:`PIDMap.as_of`. Pass a directory path to store the history there, or ``True`` to
+        use the default directory.
+    :param compact: Whether to hold the player ID map in the compact schema of
+        ``playeridmap_schema.json``, which uses far less memory. **AllPositions** is then held as
+        a bitmask, decoded by :py:meth:`PIDMap.decode_positions`.
     """
-    def __init__(self):
+    class NameMatch(typing.NamedTuple):
+        """
+        Contains a match of :py:meth:`PIDMap.search_name_matches`
+
+        .. py:attribute:: row
+            The label of the player's row in :py:attr:`PIDMap.data`
+
+        .. py:attribute:: player_id
+            The player's **PlayerID**
+
+        .. py:attribute:: player_name
+            The player's **PlayerName**
+
+        .. py:attribute:: team
+            The player's **Team**
+
+        .. py:attribute:: birthdate
+            The player's **Birthdate**
+
+        .. py:attribute:: column
+            The label of the name column of the best matching name
+
+        .. py:attribute:: name
+            The best matching name
+
+        .. py:attribute:: score
+            The similarity of the best matching name to the query, from ``0`` to ``1``
+        """
+        row: typing.Hashable
+        player_id: str
+        player_name: str
+        team: typing.Optional[str]
+        birthdate: typing.Optional[pd.Timestamp]
+        column: str
+        name: str
+        score: float
+
+    def __init__(
+            self, snapshot: typing.Union[bool, str] = False, compact: bool = False,
+            history: typing.Union[bool, str] = False
+    ):
         self._pid_map = PlayerIDMap()
-        self._data = self.pid_map.read_data()
-        self._changelog = self.pid_map.read_changelog_data()
+
+        self._store = None
+        if snapshot:
+            self._store = SnapshotStore(None if snapshot is True else snapshot)
+        self._history = None
+        if history:
+            self._history = VersionStore(None if history is True else history)
+        self._compact = compact
+
+        self._data: typing.Optional[pd.DataFrame] = None
+        self._data_lock = threading.Lock()
+        self._changelog: typing.Optional[pd.DataFrame] = None
+        self._changelog_lock = threading.Lock()
+        self._indexes: typing.Dict[str, IDIndex] = {}
+        self._views: typing.Dict[str, typing.Tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self._name_index: typing.Optional[typing.Tuple[pd.DataFrame, NameIndex]] = None
+        self._search_columns: typing.Optional[
+            typing.Tuple[pd.DataFrame, pd.Index, typing.Dict[str, typing.Any]]
+        ] = None
+        self._filter_index: typing.Optional[typing.Tuple[pd.DataFrame, FilterIndex]] = None
+        self._resolver: typing.Optional[typing.Tuple[pd.DataFrame, Resolver]] = None
 
         self.__info = [
             "LastName", "FirstName", "PlayerName", "LastFirstName", "Birthdate", "PlayerID"
@@ -46,6 +168,190 @@ class PIDMap:
             "Bats", "Throws", "Team", "League", "Position", "AllPositions", "Active"
         ]
 
+    def _load_data(self) -> pd.DataFrame:
+        """
+        :return: The player ID map, read from the snapshot if it is up to date. Whether it is up to
+            date is checked by :py:meth:`PlayerIDMap.check_for_update` unless the CHANGELOG is
+            loaded, and the CHANGELOG of the snapshot is then used too.
+        """
+        if self._store is None:
+            data = self.pid_map.read_data()
+            if self._history is not None:
+                self._history.record(data, self.changelog)
+            return data
+
+        if self._changelog is not None:
+            stale = self._store.is_stale(self._changelog)
+        else:
+            version = self._store.version
+            stale = version is None or self.pid_map.check_for_update(since=version).updated
+        if not stale:
+            snapshot = self._store.load()
+            if snapshot is not None:
+                with self._changelog_lock:
+                    if self._changelog is None:
+                        self._changelog = snapshot.changelog
+                return snapshot.data
+
+        data = self.pid_map.read_data()
+        self._store.save(data, self.changelog)
+        if self._history is not None:
+            self._history.record(data, self.changelog)
+        return data
+
+    def prefetch(self, excel: bool = False) -> "PIDMap":
+        """
+        Downloads the player ID map and its CHANGELOG concurrently, if they are not loaded yet.
+
+        :param excel: Whether to read both from the Excel workbook in a single request instead,
+            see :py:meth:`PlayerIDMap.read_excel`, if neither is loaded and snapshots are disabled
+        :return: This :py:class:`PIDMap`
+        :raise ImportError: *excel* is ``True`` and no Excel engine is installed
+        """
+        if excel and self._store is None and not any(self.loaded):
+            with self._data_lock:
+                with self._changelog_lock:
+                    if self._data is None and self._changelog is None:
+                        data, self._changelog = self.pid_map.read_excel()
+                        if self._history is not None:
+                            self._history.record(data, self._changelog)
+                        self._data = _schema.compact(data) if self.compact else data
+
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            loads = [
+                executor.submit(lambda: self.data), executor.submit(lambda: self.changelog)
+            ]
+            for load in loads:
+                load.result()
+        return self
+
+    def refresh(self, force: bool = False) -> ChangeSet:
+        """
+        Downloads the CHANGELOG again and, if it reports a newer version of the player ID map than
+        the loaded one, downloads the player ID map and applies only its changed rows. Rows are
+        matched on **PlayerID**. The ID indexes built by :py:meth:`PIDMap.index` are updated in
+        place rather than rebuilt.
+
+        If the player ID map is not loaded yet, only the CHANGELOG is replaced, and the player ID
+        map is downloaded on next access as usual.
+
+        :param force: Whether to download the player ID map even if the CHANGELOG reports no newer
+            version
+        :return: The players added, removed and modified by the refresh
+        """
+        changelog = self.pid_map.read_changelog_data()
+        with self._data_lock:
+            with self._changelog_lock:
+                previous, self._changelog = self._changelog, changelog
+
+            if self._data is None:
+                return ChangeSet(added=[], removed=[], modified={})
+
+            if previous is not None:
+                version = SnapshotStore.latest(previous)
+            elif self._store is not None:
+                version = self._store.version
+            else:
+                version = None
+            if not force and version is not None and SnapshotStore.latest(changelog) <= version:
+                return ChangeSet(added=[], removed=[], modified={})
+
+            data = self.pid_map.read_data()
+            if self._store is not None:
+                self._store.save(data, changelog)
+            if self._history is not None:
+                self._history.record(data, changelog)
+            if self.compact:
+                data = _schema.compact(data)
+
+            changes = _diff.diff(self._data, data)
+            if changes.players:
+                patch = _diff.apply(self._data, data, changes)
+                for column, index in self._indexes.items():
+                    index.update(patch.data.loc[:, column], patch.remap, patch.rows)
+                self._data = patch.data
+                self._views.clear()
+            return changes
+
+    @property
+    def loaded(self) -> typing.Tuple[bool, bool]:
+        """
+        :return: Whether the player ID map and its CHANGELOG, respectively, are loaded
+        """
+        return self._data is not None, self._changelog is not None
+
+    @property
+    def compact(self) -> bool:
+        """
+        :return: Whether the player ID map is held in the compact schema
+        """
+        return self._compact
+
+    def decode_positions(self, masks: typing.Union[pd.Series, np.ndarray]) -> pd.Series:
+        """
+        :param masks: **AllPositions** bitmasks of the compact player ID map
+        :return: The list of positions of each bitmask
+        """
+        return _schema.PositionCodec(self.data.attrs["AllPositions"]).decode(masks)
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        :return: The memory usage of each column of the player ID map, before and after conversion
+            to the compact schema
+        """
+        return _schema.memory_report(self.data)
+
+    def share(self, name: typing.Optional[str] = None) -> SharedIDMap:
+        """
+        Publishes the ID columns of the player ID map to shared memory, for other processes to
+        attach with :py:meth:`SharedIDMap.attach`.
+
+        :param name: The name of the shared memory block. A unique name is chosen if ``None``.
+        :return: The published ID map. Close and unlink it once every worker is done.
+        """
+        with _instrument.stage("share", rows=len(self.data)) as stage:
+            shared = SharedIDMap.publish(self.data, name=name)
+            stage.set(bytes=shared.nbytes)
+        return shared
+
+    @property
+    def snapshot_store(self) -> typing.Optional[SnapshotStore]:
+        """
+        :return: The on-disk snapshot store, if snapshots are enabled
+        """
+        return self._store
+
+    @property
+    def history(self) -> typing.Optional[VersionStore]:
+        """
+        :return: The on-disk history of the player ID map, if it is kept
+        """
+        return self._history
+
+    def as_of(self, date: typing.Union[datetime.date, str]) -> "PIDMap":
+        """
+        Rebuilds the player ID map as it was on a date, from the nearest checkpoint of the history
+        and the deltas stored since. Only versions downloaded while the history was kept are
+        available.
+
+        :param date: The date, or its ISO format string
+        :return: A :py:class:`PIDMap` of the latest stored version on *date*, with the CHANGELOG
+            entries up to that version
+        :raise ValueError: The history is not kept, or no version was stored on or before *date*
+        """
+        if self._history is None:
+            raise ValueError("The history of the player ID map is not kept")
+        version = self._history.find(date).version
+        with _instrument.stage("history.as_of", version=version.isoformat()) as stage:
+            data = self._history.as_of(version)
+            stage.set(rows=len(data))
+
+        pid_map = PIDMap(compact=self.compact)
+        pid_map._data = _schema.compact(data) if self.compact else data
+        changelog = self._history.changelog
+        pid_map._changelog = changelog.loc[changelog["Date"] <= version].reset_index(drop=True)
+        return pid_map
+
     @property
     def pid_map(self) -> PlayerIDMap:
         """
@@ -57,54 +363,442 @@ class PIDMap:
     @property
     def data(self) -> pd.DataFrame:
         """
-
-        :return:
+        :return: The player ID map, downloaded on first access
         """
+        if self._data is None:
+            with self._data_lock:
+                if self._data is None:
+                    data = self._load_data()
+                    if self.compact:
+                        data = _schema.compact(data)
+                    self._data = data
         return self._data
 
     @property
     def changelog(self) -> pd.DataFrame:
         """
-
-        :return:
+        :return: The player ID map CHANGELOG, downloaded on first access
         """
+        if self._changelog is None:
+            with self._changelog_lock:
+                if self._changelog is None:
+                    self._changelog = self.pid_map.read_changelog_data()
         return self._changelog
 
+    def _view(self, name: str, columns: typing.Sequence[str] = ()) -> pd.DataFrame:
+        """
+        Views are selected once per version of the player ID map, as a single column selection,
+        which is kept private. Each access returns a copy of it, so that writes to a view never
+        reach :py:attr:`PIDMap.data` or later accesses. The copy is shallow if ``pandas``
+        copy-on-write is enabled, and deep otherwise.
+
+        :param name: The name of the view
+        :param columns: The columns following the general player information
+        :return: A copy of the memoized view
+        """
+        data = self.data
+        cached = self._views.get(name)
+        if cached is not None and cached[0] is data:
+            view = cached[1]
+        else:
+            labels = self.__info if name == "info" else self.__info + self.__general + list(columns)
+            view = data.loc[:, labels]
+            self._views[name] = (data, view)
+        return view.copy(deep=not _copy_on_write())
+
     @property
     def info(self) -> pd.DataFrame:
         """
-
-        :return:
+        :return: The names, birthdate and ID of each player
         """
-        return self.data.loc[:, self.__info]
+        return self._view("info")
 
     @property
     def general(self) -> pd.DataFrame:
         """
+        :return: The player information, with handedness, team, positions and status
+        """
+        return self._view("general")
 
-        :return:
+    baseballhq = _site_property("baseballhq")
+    baseball_prospectus = _site_property("baseball_prospectus")
+    cbs = _site_property("cbs")
+    clay_davenport = _site_property("clay_davenport")
+    draft_kings = _site_property("draft_kings")
+    espn = _site_property("espn")
+    fanduel = _site_property("fanduel")
+    fangraphs = _site_property("fangraphs")
+    fantasy_pros = _site_property("fantasy_pros")
+    fantrax = _site_property("fantrax")
+    kffl = _site_property("kffl")
+    masterball = _site_property("masterball")
+    mlb = _site_property("mlb")
+    nfbc = _site_property("nfbc")
+    ottoneu = _site_property("ottoneu")
+    razzball = _site_property("razzball")
+    retrosheet = _site_property("retrosheet")
+    rotowire = _site_property("rotowire")
+    yahoo = _site_property("yahoo")
+
+    def index(self, column: str) -> IDIndex:
+        """
+        Builds the hash index over an ID column on first use.
+
+        :param column: The ID column
+        :return: The index over the *column* IDs
+        :raise ValueError: *column* is not an ID column
+        """
+        index = self._indexes.get(column)
+        if index is None:
+            if column in PlayerIDMap._integer_columns:
+                integer = True
+            elif column in PlayerIDMap._string_id_columns:
+                integer = False
+            else:
+                raise ValueError(f"{column!r} is not an ID column")
+            with _instrument.stage("index.build", column=column, rows=len(self.data)):
+                index = self._indexes[column] = IDIndex(self.data.loc[:, column], integer)
+        return index
+
+    def translate(
+            self, value: typing.Any, from_: str = "MLBID", to: str = "FanGraphsID",
+            default: typing.Any = None
+    ) -> typing.Any:
+        """
+        Translates a player's ID on one site to their ID on another.
+
+        :param value: The player's ID in the *from_* column
+        :param from_: The ID column of *value*
+        :param to: The column to translate *value* to
+        :param default: Returned if no player has the ID *value*, or if the player has no *to* ID
+        :return: The *to* value of the first player with the *from_* ID *value*
+        :raise ValueError: *from_* is not an ID column
+        """
+        _instrument.count("translate")
+        position = self.index(from_).get(value)
+        if position is None:
+            return default
+
+        result = self.data[to].iat[position]
+        if to in PlayerIDMap._integer_columns and result == 0:
+            return default
+        if not isinstance(result, list) and pd.isna(result):
+            return default
+        return result
+
+    def translate_many(
+            self, values: typing.Union[pd.Series, np.ndarray, typing.Sequence],
+            from_: str = "MLBID", to: str = "FanGraphsID", missing: typing.Any = None
+    ) -> typing.Union[pd.Series, np.ndarray]:
+        """
+        Translates many players' IDs on one site to their IDs on another in one vectorized pass.
+
+        :param values: The players' IDs in the *from_* column
+        :param from_: The ID column of *values*
+        :param to: The column to translate *values* to
+        :param missing: Sentinel for the IDs which cannot be translated
+        :return: The *to* values aligned with *values*. A ``Series`` with the index of *values* if
+            *values* is a ``Series``, and an array otherwise.
+        :raise ValueError: *from_* is not an ID column
+        """
+        positions = self.index(from_).get_indexer(values)
+        found = positions >= 0
+        _instrument.count("translate_many.values", len(positions))
+        _instrument.count("translate_many.misses", int(len(positions) - found.sum()))
+
+        target = self.data[to]
+        if to in PlayerIDMap._integer_columns:
+            target_missing = (target == 0).to_numpy()
+        else:
+            target_missing = target.isna().to_numpy()
+        target = target.to_numpy()
+
+        result = np.empty(len(positions), dtype=target.dtype)
+        result[found] = target.take(positions[found])
+        mask = ~found
+        mask[found] = target_missing.take(positions[found])
+
+        if mask.any():
+            result = result.astype(np.result_type(result.dtype, np.asarray(missing).dtype))
+            result[mask] = missing
+
+        if isinstance(values, pd.Series):
+            return pd.Series(result, index=values.index, name=to, dtype=result.dtype)
+        return result
+
+    def name_index(self) -> NameIndex:
+        """
+        Builds the fuzzy search index over the name columns on first use, and again after the
+        player ID map is refreshed.
+
+        :return: The search index over the name columns
+        """
+        data = self.data
+        cached = self._name_index
+        if cached is None or cached[0] is not data:
+            with _instrument.stage("index.build", column="names", rows=len(data)):
+                index = NameIndex(
+                    data.loc[:, _NAME_COLUMNS], teams=data.loc[:, "Team"],
+                    birthdates=data.loc[:, "Birthdate"]
+                )
+            cached = self._name_index = (data, index)
+        return cached[1]
+
+    def filter_index(self) -> FilterIndex:
+        """
+        Builds the inverted indexes over **AllPositions**, **Team**, **League** and **Active** on
+        first use, and again after the player ID map is refreshed.
+
+        :return: The inverted indexes used by :py:meth:`PIDMap.filter`
+        """
+        data = self.data
+        cached = self._filter_index
+        if cached is None or cached[0] is not data:
+            with _instrument.stage("index.build", column="filter", rows=len(data)):
+                index = FilterIndex(
+                    data.loc[:, "AllPositions"], data.loc[:, "Team"], data.loc[:, "League"],
+                    data.loc[:, "Active"], vocabulary=data.attrs.get("AllPositions")
+                )
+            cached = self._filter_index = (data, index)
+        return cached[1]
+
+    def filter_rows(
+            self, position: typing.Any = None, team: typing.Any = None, league: typing.Any = None,
+            active: typing.Optional[bool] = None
+    ) -> np.ndarray:
+        """
+        Each argument is a single value or a collection of values, and is not filtered by if
+        ``None``. Positions, teams and leagues are matched case-insensitively.
+
+        :param position: The positions, any of which a player must be eligible at
+        :param team: The teams, one of which a player must be on
+        :param league: The leagues, one of which a player must be in
+        :param active: Whether a player must be active, or inactive
+        :return: The positions of the rows of :py:attr:`PIDMap.data` which match every argument
+        """
+        _instrument.count("filter")
+        return self.filter_index().rows(
+            position=position, team=team, league=league, active=active
+        )
+
+    def filter(
+            self, position: typing.Any = None, team: typing.Any = None, league: typing.Any = None,
+            active: typing.Optional[bool] = None
+    ) -> pd.DataFrame:
+        """
+        Selects players by eligibility, as by :py:meth:`PIDMap.filter_rows`. For example,
+        ``filter(position="2B", team="NYY", active=True)`` selects the active second basemen of
+        the Yankees.
+
+        :param position: The positions, any of which a player must be eligible at
+        :param team: The teams, one of which a player must be on
+        :param league: The leagues, one of which a player must be in
+        :param active: Whether a player must be active, or inactive
+        :return: The rows of :py:attr:`PIDMap.data` which match every argument
+        """
+        rows = self.filter_rows(position=position, team=team, league=league, active=active)
+        return self.data.iloc[rows]
+
+    def resolver(self) -> Resolver:
+        """
+        Builds the resolver of external datasets on first use, and again after the player ID map
+        is refreshed.
+
+        :return: The resolver used by :py:meth:`PIDMap.resolve`
+        """
+        data = self.data
+        cached = self._resolver
+        if cached is None or cached[0] is not data:
+            cached = self._resolver = (data, Resolver(data))
+        return cached[1]
+
+    def resolve(
+            self, df: pd.DataFrame,
+            keys: typing.Sequence[typing.Union[str, typing.Sequence[str], typing.Mapping[str, str]]]
+    ) -> pd.DataFrame:
+        """
+        Matches the rows of an external dataset, such as a vendor feed, to players by an ordered
+        chain of keys. For example, ``keys=["MLBID", ("MLBName", "Birthdate"),
+        ("LastFirstName", "Team")]`` matches rows on **MLBID**, then the rows it did not match on
+        **MLBName** and **Birthdate**, then the rest on **LastFirstName** and **Team**.
+
+        Each key is a vectorized hash join over the rows still unmatched. ID columns are compared
+        as by :py:meth:`PIDMap.translate_many`, **Birthdate** by day, and names and every other
+        column ignoring case, accents, punctuation, word order and generational suffixes. Keys
+        which occur in more than one row of :py:attr:`PIDMap.data` are ambiguous and never match.
+
+        :param df: The external dataset
+        :param keys: The keys, in order of preference. Each is a column, a sequence of columns, or
+            a mapping of the columns of *df* to the columns of :py:attr:`PIDMap.data` where their
+            names differ.
+        :return: The **PlayerID** each row of *df* matches, and the **MatchRule** which matched
+            it, the key's columns joined by ``+``, aligned with *df*. Unmatched rows have missing
+            values.
+        :raise ValueError: A column of a key is missing from :py:attr:`PIDMap.data` or *df*
+        """
+        _instrument.count("resolve.rows", len(df))
+        resolver = self.resolver()
+        rows, matched_by = resolver.resolve(df, keys)
+        names = np.array([Rule.parse(key).name for key in keys] + [None], dtype=object)
+        player_ids = np.append(self.data["PlayerID"].to_numpy(dtype=object), None)
+        _instrument.count("resolve.misses", int((rows < 0).sum()))
+        return pd.DataFrame(
+            {
+                "PlayerID": pd.Series(player_ids.take(rows), index=df.index, dtype=object),
+                "MatchRule": pd.Series(names.take(matched_by), index=df.index, dtype=object),
+            }
+        )
+
+    @staticmethod
+    def _name_columns(site: typing.Optional[str]) -> typing.Optional[typing.List[str]]:
+        """
+        :param site: The name of a per-site view, such as ``"espn"``, or ``None``
+        :return: The name columns of *site*, or ``None`` for every name column
+        :raise ValueError: *site* is not a per-site view with name columns
+        """
+        if site is None:
+            return None
+        columns = [c for c in _SITE_COLUMNS.get(site, ()) if c.endswith("Name")]
+        if not columns:
+            raise ValueError(f"{site!r} is not a site with player names")
+        return columns
+
+    def search_name(
+            self, query: str, site: typing.Optional[str] = None, limit: int = 5,
+            team: typing.Optional[str] = None,
+            birthdate: typing.Optional[typing.Union[datetime.date, str]] = None,
+            threshold: float = 0.5
+    ) -> pd.DataFrame:
+        """
+        Searches the name columns for a player's name, ignoring case, accents, punctuation, word
+        order and generational suffixes, and tolerating misspellings.
+
+        :param query: The name to search for
+        :param site: The name of a per-site view, such as ``"espn"``, to search only its name
+            columns. Every name column is searched if ``None``.
+        :param limit: The maximum number of players to return
+        :param team: If any candidate plays for *team*, only those candidates are returned
+        :param birthdate: If any candidate was born on *birthdate*, only those candidates are
+            returned
+        :param threshold: The minimum similarity, from ``0`` to ``1``, of a match
+        :return: The matching players, best first, indexed by their row in :py:attr:`PIDMap.data`,
+            with the matching name, its column and its similarity
+        :raise ValueError: *site* is not a per-site view with name columns
+        """
+        matches = self._search_name(query, site, limit, team, birthdate, threshold)
+        index, arrays = self._search_result_columns()
+        rows = np.fromiter((m.row for m in matches), dtype=np.intp, count=len(matches))
+        columns = {c: arrays[c].take(rows) for c in _SEARCH_RESULT_COLUMNS}
+        columns["Column"] = np.array([m.column for m in matches], dtype=object)
+        columns["Name"] = np.array([m.name for m in matches], dtype=object)
+        columns["Score"] = np.fromiter(
+            (m.score for m in matches), dtype=np.float64, count=len(matches)
+        )
+        return pd.DataFrame(columns, index=index.take(rows), copy=False)
+
+    def search_name_matches(
+            self, query: str, site: typing.Optional[str] = None, limit: int = 5,
+            team: typing.Optional[str] = None,
+            birthdate: typing.Optional[typing.Union[datetime.date, str]] = None,
+            threshold: float = 0.5
+    ) -> typing.List[NameMatch]:
+        """
+        Searches the name columns for a player's name as :py:meth:`PIDMap.search_name` does, but
+        returns plain tuples rather than a ``DataFrame``, which is far cheaper to build for a
+        handful of matches.
+
+        :param query: The name to search for
+        :param site: The name of a per-site view, such as ``"espn"``, to search only its name
+            columns. Every name column is searched if ``None``.
+        :param limit: The maximum number of players to return
+        :param team: If any candidate plays for *team*, only those candidates are returned
+        :param birthdate: If any candidate was born on *birthdate*, only those candidates are
+            returned
+        :param threshold: The minimum similarity, from ``0`` to ``1``, of a match
+        :return: The matching players, best first
+        :raise ValueError: *site* is not a per-site view with name columns
+        """
+        matches = self._search_name(query, site, limit, team, birthdate, threshold)
+        index, arrays = self._search_result_columns()
+        player_ids, names, teams, birthdates = (arrays[c] for c in _SEARCH_RESULT_COLUMNS)
+        return [
+            self.NameMatch(
+                row=index[m.row], player_id=player_ids[m.row], player_name=names[m.row],
+                team=None if pd.isna(teams[m.row]) else teams[m.row],
+                birthdate=None if pd.isna(birthdates[m.row]) else birthdates[m.row],
+                column=m.column, name=m.name, score=m.score
+            )
+            for m in matches
+        ]
+
+    def _search_name(
+            self, query: str, site: typing.Optional[str], limit: int, team: typing.Optional[str],
+            birthdate: typing.Optional[typing.Union[datetime.date, str]], threshold: float
+    ) -> typing.List[Match]:
+        """
+        :return: The matches of :py:meth:`NameIndex.search` for the arguments of
+            :py:meth:`PIDMap.search_name`
+        :raise ValueError: *site* is not a per-site view with name columns
+        """
+        _instrument.count("search_name")
+        return self.name_index().search(
+            query, limit=limit, columns=self._name_columns(site), team=team, birthdate=birthdate,
+            threshold=threshold
+        )
+
+    def _search_result_columns(self) -> typing.Tuple[pd.Index, typing.Dict[str, typing.Any]]:
+        """
+        The arrays are taken once per version of the player ID map, so that a search does not
+        pay for selecting the columns of :py:attr:`PIDMap.data` again.
+
+        :return: The row labels of :py:attr:`PIDMap.data`, and the arrays of the columns of
+            ``_SEARCH_RESULT_COLUMNS``
+        """
+        data = self.data
+        cached = self._search_columns
+        if cached is None or cached[0] is not data:
+            arrays = {c: data[c].array for c in _SEARCH_RESULT_COLUMNS}
+            cached = self._search_columns = (data, data.index, arrays)
+        return cached[1], cached[2]
+
+    def search_names(
+            self, queries: typing.Union[pd.Series, typing.Sequence[str]],
+            site: typing.Optional[str] = None,
+            teams: typing.Optional[typing.Sequence[typing.Optional[str]]] = None,
+            birthdates: typing.Optional[typing.Sequence[typing.Any]] = None,
+            threshold: float = 0.5
+    ) -> pd.DataFrame:
+        """
+        Resolves many names at once, such as a whole roster, to their best matching players.
+
+        :param queries: The names to search for
+        :param site: The name of a per-site view, such as ``"espn"``, to search only its name
+            columns. Every name column is searched if ``None``.
+        :param teams: The team of the player named by each query, if known
+        :param birthdates: The birthdate of the player named by each query, if known
+        :param threshold: The minimum similarity, from ``0`` to ``1``, of a match
+        :return: The **PlayerID**, matching name, its column and its similarity for each query,
+            aligned with *queries*. Queries without a match have missing values.
+        :raise ValueError: *site* is not a per-site view with name columns
         """
-        return self.info.join(self.data.loc[:, self.__general])
-
-    baseballhq = _site_property(["BaseballHQID"])
-    baseball_prospectus = _site_property(["BaseballProspectusID"])
-    cbs = _site_property(["CBSID", "CBSName"])
-    clay_davenport = _site_property(["ClayDavenportID"])
-    draft_kings = _site_property(["DraftKingsName"])
-    espn = _site_property(["ESPNID", "ESPNName"])
-    fanduel = _site_property(["FanduelID", "FanduelName"])
-    fangraphs = _site_property(["FanGraphsID", "FanGraphsName"])
-    fantasy_pros = _site_property(["FantasyProsName"])
-    fantrax = _site_property(["FantraxName"])
-    kffl = _site_property(["KFFLName"])
-    masterball = _site_property(["MasterballName"])
-    mlb = _site_property(["MLBID", "MLBName"])
-    nfbc = _site_property(["NFBCID", "NFBCName", "NFBCLastFirstName"])
-    ottoneu = _site_property(["OttoneuID"])
-    razzball = _site_property(["RazzballName"])
-    retrosheet = _site_property(["RetrosheetID"])
-    rotowire = _site_property(["RotowireID", "RotowireName"])
-    yahoo = _site_property(["YahooID", "YahooName"])
+        index = queries.index if isinstance(queries, pd.Series) else None
+        queries = list(queries)
+        _instrument.count("search_names.queries", len(queries))
+        matches = self.name_index().search_many(
+            queries, columns=self._name_columns(site), teams=teams, birthdates=birthdates,
+            threshold=threshold
+        )
+        player_ids = self.data.loc[:, "PlayerID"].to_numpy(dtype=object)
+        return pd.DataFrame(
+            {
+                "Query": queries,
+                "PlayerID": [None if m is None else player_ids[m.row] for m in matches],
+                "Column": [None if m is None else m.column for m in matches],
+                "Name": [None if m is None else m.name for m in matches],
+                "Score": [np.nan if m is None else m.score for m in matches],
+            },
+            index=index
+        )
 
     @property
     def last_update(self) -> datetime.datetime:
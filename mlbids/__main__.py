@@ -0,0 +1,54 @@
+"""
+Command-line interface of :py:mod:`mlbids`.
+
+Run ``python -m mlbids serve --help`` for the options of the lookup daemon.
+"""
+
+import argparse
+import logging
+import typing
+
+from . import _server
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """
+    :param argv: The command-line arguments. Read from ``sys.argv`` if ``None``.
+    """
+    parser = argparse.ArgumentParser(prog="python -m mlbids")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser(
+        "serve", help="Serve ID translation and name search over HTTP or a Unix socket"
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Address on which to listen")
+    serve.add_argument("--port", type=int, default=8765, help="Port on which to listen")
+    serve.add_argument(
+        "--unix-socket", metavar="PATH", help="Listen on a Unix domain socket instead of a port"
+    )
+    serve.add_argument(
+        "--refresh-interval", type=float, default=600, metavar="SECONDS",
+        help="Seconds between checks for a newer player ID map, or 0 to never check"
+    )
+    serve.add_argument(
+        "--snapshot", nargs="?", const=True, default=False, metavar="DIRECTORY",
+        help="Keep an on-disk snapshot of the player ID map, optionally in DIRECTORY"
+    )
+    serve.add_argument(
+        "--compact", action="store_true", help="Hold the player ID map in the compact schema"
+    )
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s"
+    )
+    _server.serve(
+        host=args.host, port=args.port, unix_socket=args.unix_socket,
+        refresh_interval=args.refresh_interval, snapshot=args.snapshot, compact=args.compact
+    )
+
+
+if __name__ == "__main__":
+    main()
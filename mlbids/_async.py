@@ -0,0 +1,211 @@
+"""
+Asynchronous counterpart of :py:class:`mlbids.playeridmap.PlayerIDMap`.
+
+HTTP requests to the origin are made with ``httpx`` if it is installed. Otherwise, or whenever
+another transport is set by :py:func:`mlbids._transport.set_transport`, they are made with the
+shared ``requests`` session of :py:mod:`mlbids._sfbb` in an executor. Parsing and formatting
+always run in an executor, so that the event loop is never blocked.
+"""
+
+import asyncio
+from concurrent import futures
+import io
+import typing
+
+import pandas as pd
+
+from . import _htmltable
+from . import _instrument
+from . import _sfbb
+from . import _transport
+from .playeridmap import PlayerIDMap
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncPlayerIDMap:
+    """
+    Concurrent calls share a single in-flight download: while the player ID map is loading, every
+    other caller of :py:meth:`AsyncPlayerIDMap.read_data` awaits the same load rather than
+    starting another. Loaded ``DataFrame`` objects are kept until
+    :py:meth:`AsyncPlayerIDMap.refresh` is called.
+
+    :param pid_map: Used for its URLs, parsing and formatting
+    :param executor: Executor in which blocking work runs. The event loop's default executor is
+        used if ``None``.
+    """
+    def __init__(
+            self, pid_map: typing.Optional[PlayerIDMap] = None,
+            executor: typing.Optional[futures.Executor] = None
+    ):
+        self._pid_map = PlayerIDMap() if pid_map is None else pid_map
+        self._executor = executor
+        self._client = None
+
+        self._loads: typing.Dict[str, asyncio.Future] = {}
+        self._results: typing.Dict[str, typing.Any] = {}
+
+    async def __aenter__(self) -> "AsyncPlayerIDMap":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def pid_map(self) -> PlayerIDMap:
+        """
+        :return: The :py:class:`PlayerIDMap` used for its URLs, parsing and formatting
+        """
+        return self._pid_map
+
+    async def close(self) -> None:
+        """
+        Closes the ``httpx`` client, if one was opened.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self, func: typing.Callable, *args) -> typing.Any:
+        """
+        :param func: A blocking function
+        :param args: Positional arguments for *func*
+        :return: The return value of *func*, called in the executor
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _get_text(self, url: str) -> str:
+        """
+        :param url: The URL to request
+        :return: The decoded body of the response to a GET request for *url*
+        """
+        if httpx is None or type(_transport.get_transport()) is not _transport.Transport:
+            res = await self._run(_sfbb.get, url)
+            return res.text
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=_sfbb.HEADERS, follow_redirects=True,
+                timeout=httpx.Timeout(_sfbb.TIMEOUT[1], connect=_sfbb.TIMEOUT[0]),
+                transport=httpx.AsyncHTTPTransport(retries=_sfbb.RETRY.total)
+            )
+        with _instrument.stage("http.get", url=url) as stage:
+            res = await self._client.get(url)
+            stage.set(status=res.status_code, length=res.headers.get("Content-Length"))
+        res.raise_for_status()
+        return res.text
+
+    async def _shared(
+            self, key: str, load: typing.Callable[[], typing.Awaitable], keep: bool = True
+    ) -> typing.Any:
+        """
+        :param key: Identifies the load
+        :param load: Coroutine function which performs the load
+        :param keep: Whether to keep the result for later callers once the load is done
+        :return: The result of the load, shared with every concurrent caller with the same *key*
+        """
+        if key in self._results:
+            return self._results[key]
+
+        future = self._loads.get(key)
+        if future is None:
+            async def run():
+                try:
+                    result = await load()
+                    if keep:
+                        self._results[key] = result
+                    return result
+                finally:
+                    del self._loads[key]
+
+            future = self._loads[key] = asyncio.ensure_future(run())
+
+        return await asyncio.shield(future)
+
+    async def urls(self) -> _sfbb.SFBBTools.URLs:
+        """
+        :return: The redirect URLs for viewing/downloading the player ID map
+        """
+        sfbb = self.pid_map.sfbb
+        urls = sfbb.cached_urls
+        if urls is not None:
+            return urls
+
+        async def load():
+            html = await self._get_text(sfbb.base_address)
+            return await self._run(sfbb.update_urls, html)
+
+        return await self._shared("urls", load, keep=False)
+
+    async def _read(
+            self, name: str, url: str, parse: typing.Callable[[str], pd.DataFrame],
+            csv_url: str, parse_csv: typing.Callable[[typing.TextIO], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Reads a web view, falling back to its CSV file if the web view has no table, as
+        :py:meth:`PlayerIDMap.read_data` and :py:meth:`PlayerIDMap.read_changelog_data` do.
+
+        :param name: The name of the instrumented stage, ``"read_data"`` or
+            ``"read_changelog_data"``. The CSV fallback is instrumented as ``"read_csv"`` or
+            ``"read_changelog_csv"``.
+        :param url: The URL of the web view
+        :param parse: Parses the HTML document of the web view
+        :param csv_url: The URL of the CSV file
+        :param parse_csv: Parses a file-like object which reads the CSV file
+        :return: The formatted ``DataFrame``
+        """
+        with _instrument.stage(name) as stage:
+            try:
+                html = await self._get_text(url)
+                df = await self._run(parse, html)
+                stage.set(source="web_view", rows=len(df))
+            except _htmltable.NoTableError:
+                with _instrument.stage(name.replace("_data", "_csv")) as csv_stage:
+                    text = await self._get_text(csv_url)
+                    df = await self._run(parse_csv, io.StringIO(text))
+                    csv_stage.set(rows=len(df))
+                stage.set(source="csv", rows=len(df))
+        return df
+
+    async def read_data(self) -> pd.DataFrame:
+        """
+        :return: The formatted player ID map, read from the CSV file if the web view has no table
+        """
+        async def load():
+            urls = await self.urls()
+            return await self._read(
+                "read_data", urls.web_view, self.pid_map._parse_data, urls.csv_download,
+                self.pid_map._parse_csv
+            )
+
+        return await self._shared("data", load)
+
+    async def read_changelog_data(self) -> pd.DataFrame:
+        """
+        :return: The formatted player ID map CHANGELOG, read from the CSV file if the web view has
+            no table
+        """
+        async def load():
+            urls = await self.urls()
+            return await self._read(
+                "read_changelog_data", urls.changelog_web_view,
+                self.pid_map._parse_changelog_data, urls.changelog_csv_download,
+                self.pid_map._parse_changelog_csv
+            )
+
+        return await self._shared("changelog", load)
+
+    async def refresh(self) -> typing.Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Discards the loaded ``DataFrame`` objects and downloads both again, concurrently.
+
+        :return: The formatted player ID map and its CHANGELOG
+        """
+        self._results.pop("data", None)
+        self._results.pop("changelog", None)
+        data, changelog = await asyncio.gather(self.read_data(), self.read_changelog_data())
+        return data, changelog
@@ -0,0 +1,246 @@
+"""
+Memory-mappable columnar files of the formatted player ID map.
+
+A columnar file is a directory holding one NumPy ``.npy`` file per column, along with
+``meta.json``, which records the kind and ``dtype`` of each column and the ``attrs`` of the
+``DataFrame``. Columns are stored as follows, by kind:
+
+- ``array``: Numeric, Boolean and ``datetime64`` columns, as they are
+- ``masked``: Nullable extension columns, such as ``boolean``, as their values and missing mask
+- ``category``: Categorical columns, as their codes, with the categories in ``meta.json``
+- ``lists``: ``object`` columns of lists of strings, such as **AllPositions**, as codes into the
+  distinct lists, which are kept in ``meta.json``
+- ``bools``: ``object`` columns of Booleans, as ``int8`` with ``-1`` for missing values
+- ``string``: ``object`` and string columns of strings, as fixed-width Unicode and a missing mask
+
+Columns of any other kind, such as ``object`` columns of mixed values, cannot be stored. Every
+file is a plain ``.npy`` array, and none is ever pickled.
+
+When loaded with *mmap*, the arrays of ``array`` and ``masked`` columns are memory-mapped
+read-only and back the ``DataFrame`` directly, so that loading them reads no data and only the
+pages that are touched are ever read from disk. The columns of every other kind are decoded into
+memory from their memory-mapped files when loaded, which reads those files in full, but never the
+files of the columns which are not loaded.
+"""
+
+import json
+import os
+import shutil
+import typing
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 2
+
+_META = "meta.json"
+_INDEX = "__index__"
+_MASKED_ARRAYS = (pd.arrays.BooleanArray, pd.arrays.IntegerArray, pd.arrays.FloatingArray)
+
+
+def _is_list_or_missing(value: typing.Any) -> bool:
+    """
+    :param value: A value of an ``object`` column
+    :return: Whether *value* is a list of strings or a missing value
+    """
+    if isinstance(value, list):
+        return all(isinstance(v, str) for v in value)
+    return not isinstance(value, (str, bytes)) and pd.isna(value)
+
+
+def _kind(values: pd.Series) -> str:
+    """
+    :param values: A column of the player ID map
+    :return: The kind by which *values* is stored
+    :raise ValueError: *values* is of no kind which can be stored
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        if pd.api.types.infer_dtype(dtype.categories, skipna=True) == "string":
+            return "category"
+        raise ValueError(f"The categories of column {values.name!r} are not strings")
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        return "array"
+    if isinstance(values.array, _MASKED_ARRAYS):
+        return "masked"
+
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred in ("string", "empty"):
+        return "string"
+    if inferred == "boolean":
+        return "bools"
+    if values.map(_is_list_or_missing).all():
+        return "lists"
+    raise ValueError(f"Column {values.name!r} of dtype {dtype} cannot be stored")
+
+
+def _encode(values: pd.Series) -> typing.Tuple[dict, typing.Dict[str, np.ndarray]]:
+    """
+    :param values: A column of the player ID map
+    :return: The description of *values* for ``meta.json``, and the arrays which hold it, by
+        file name suffix
+    :raise ValueError: *values* is of no kind which can be stored
+    """
+    kind = _kind(values)
+    spec: typing.Dict[str, typing.Any] = {"kind": kind, "dtype": str(values.dtype)}
+    missing = values.isna().to_numpy()
+
+    if kind == "array":
+        arrays = {"": values.to_numpy()}
+    elif kind == "masked":
+        numpy_dtype = values.dtype.numpy_dtype
+        spec["numpy_dtype"] = numpy_dtype.str
+        arrays = {
+            "": values.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0)), "mask": missing
+        }
+    elif kind == "category":
+        spec["categories"] = [str(c) for c in values.cat.categories]
+        spec["ordered"] = bool(values.cat.ordered)
+        arrays = {"": values.cat.codes.to_numpy()}
+    elif kind == "lists":
+        codes, uniques = pd.factorize(values.map(tuple, na_action="ignore"))
+        spec["lists"] = [list(u) for u in uniques]
+        arrays = {"": codes.astype(np.int32)}
+    elif kind == "bools":
+        codes = np.where(missing, -1, 0).astype(np.int8)
+        codes[~missing] = values[~missing].astype(bool).to_numpy()
+        arrays = {"": codes}
+    else:
+        strings = values.astype(object).where(~missing, "").to_numpy()
+        arrays = {"": strings.astype(str), "mask": missing}
+    return spec, arrays
+
+
+def _decode(spec: dict, arrays: typing.Dict[str, np.ndarray]) -> typing.Any:
+    """
+    :param spec: The description of a column in ``meta.json``
+    :param arrays: The arrays which hold the column, by file name suffix
+    :return: The values of the column
+    """
+    kind = spec["kind"]
+    values = arrays[""]
+    if kind == "array":
+        return values
+    if kind == "masked":
+        array_type = pd.api.types.pandas_dtype(spec["dtype"]).construct_array_type()
+        return array_type(np.asarray(values), np.asarray(arrays["mask"]))
+    if kind == "category":
+        return pd.Categorical.from_codes(
+            values, categories=spec["categories"], ordered=spec["ordered"]
+        )
+    if kind == "lists":
+        lists = spec["lists"]
+        # Filled element by element, so that lists of equal length are not stacked into 2-D
+        decoded = np.empty(len(values), dtype=object)
+        decoded[:] = [list(lists[c]) if c >= 0 else np.nan for c in values.tolist()]
+        return decoded
+    if kind == "bools":
+        decoded = values.astype(bool).astype(object)
+        decoded[values < 0] = np.nan
+        return decoded
+
+    decoded = values.astype(object)
+    decoded[np.asarray(arrays["mask"])] = np.nan
+    return decoded
+
+
+def _file(name: str, suffix: str) -> str:
+    """
+    :param name: The file name stem of a column
+    :param suffix: The file name suffix of one of the arrays of the column
+    :return: The file name of the array
+    """
+    return f"{name}.{suffix}.npy" if suffix else f"{name}.npy"
+
+
+def save(df: pd.DataFrame, path: str) -> str:
+    """
+    Writes a columnar file. The file is written to a temporary directory next to *path*, which
+    replaces *path* once complete.
+
+    :param df: The formatted player ID map
+    :param path: The directory to which the columnar file should be written
+    :return: The absolute path to the written directory
+    :raise ValueError: A column of *df* is of no kind which can be stored
+    """
+    path = os.path.abspath(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+
+    columns = [(_INDEX, df.index.to_series())] if not isinstance(df.index, pd.RangeIndex) else []
+    columns.extend(df.items())
+
+    meta: typing.Dict[str, typing.Any] = {
+        "format": FORMAT_VERSION, "rows": len(df), "index_name": df.index.name,
+        "attrs": df.attrs, "columns": []
+    }
+    try:
+        for i, (column, values) in enumerate(columns):
+            spec, arrays = _encode(values)
+            spec.update({"name": column, "file": str(i) if column != _INDEX else _INDEX})
+            spec["arrays"] = list(arrays)
+            for suffix, array in arrays.items():
+                np.save(
+                    os.path.join(temp_path, _file(spec["file"], suffix)), array, allow_pickle=False
+                )
+            meta["columns"].append(spec)
+
+        with open(os.path.join(temp_path, _META), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+        old_path = f"{path}.{os.getpid()}.old"
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(temp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    finally:
+        shutil.rmtree(temp_path, ignore_errors=True)
+    return path
+
+
+def load(
+        path: str, columns: typing.Optional[typing.Sequence[str]] = None, mmap: bool = True
+) -> pd.DataFrame:
+    """
+    :param path: The directory of a columnar file written by :py:func:`save`
+    :param columns: The columns to load, in order. Every column is loaded if ``None``.
+    :param mmap: Whether to memory-map the arrays read-only, instead of reading them into memory
+    :return: The player ID map
+    :raise FileNotFoundError: *path* is not a columnar file
+    :raise ValueError: *path* was written in another format version
+    :raise KeyError: A column of *columns* is not in the columnar file
+    """
+    with open(os.path.join(path, _META), "r", encoding="utf-8") as file:
+        meta = json.load(file)
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a columnar file of format version {FORMAT_VERSION}")
+
+    specs = {spec["name"]: spec for spec in meta["columns"]}
+    names = [n for n in specs if n != _INDEX] if columns is None else list(columns)
+    missing = [n for n in names if n not in specs or n == _INDEX]
+    if missing:
+        raise KeyError(f"Columns not in {path}: {missing}")
+
+    def read(spec: dict, index: typing.Optional[pd.Index]) -> pd.Series:
+        arrays = {}
+        for suffix in spec["arrays"]:
+            array = np.load(
+                os.path.join(path, _file(spec["file"], suffix)), allow_pickle=False,
+                mmap_mode="r" if mmap else None
+            )
+            arrays[suffix] = array.view(np.ndarray)
+        # The dtype is given, so that object columns of strings are not inferred as strings
+        return pd.Series(
+            _decode(spec, arrays), index=index, name=spec["name"], copy=False,
+            dtype=None if spec["kind"] == "array" else spec["dtype"]
+        )
+
+    index = pd.RangeIndex(meta["rows"])
+    if _INDEX in specs:
+        index = pd.Index(read(specs[_INDEX], index).array, name=meta["index_name"])
+    df = pd.DataFrame(
+        {name: read(specs[name], index) for name in names}, index=index, columns=names, copy=False
+    )
+    df.attrs.update(meta["attrs"])
+    return df
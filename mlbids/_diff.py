@@ -0,0 +1,168 @@
+"""
+Keyed diffs between two versions of the player ID map.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+class ChangeSet(typing.NamedTuple):
+    """
+    Contains the differences between two versions of the player ID map
+
+    .. py:attribute:: added
+        The IDs of the players in the new version only
+
+    .. py:attribute:: removed
+        The IDs of the players in the old version only
+
+    .. py:attribute:: modified
+        The IDs of the players in both versions whose rows differ, mapped to the labels of the
+        columns which differ
+    """
+    added: typing.List[str]
+    removed: typing.List[str]
+    modified: typing.Dict[str, typing.List[str]]
+
+    @property
+    def players(self) -> typing.Set[str]:
+        """
+        :return: The IDs of every added, removed or modified player
+        """
+        return set(self.added) | set(self.removed) | set(self.modified)
+
+
+class Patch(typing.NamedTuple):
+    """
+    Contains the result of applying a :py:class:`ChangeSet` to the old version of the player ID map
+
+    .. py:attribute:: data
+        The updated player ID map
+
+    .. py:attribute:: remap
+        The position in :py:attr:`Patch.data` of each row of the old version, or ``-1`` for
+        removed rows
+
+    .. py:attribute:: rows
+        The positions in :py:attr:`Patch.data` of the modified and added rows
+    """
+    data: pd.DataFrame
+    remap: np.ndarray
+    rows: np.ndarray
+
+
+def _differs(old: pd.Series, new: pd.Series) -> np.ndarray:
+    """
+    :param old: The values of a column in the old version
+    :param new: The values of the same column in the new version, aligned with *old*
+    :return: Whether each pair of values differs. Two missing values do not differ.
+    """
+    old_na, new_na = old.isna().to_numpy(), new.isna().to_numpy()
+    unequal = old.to_numpy(dtype=object) != new.to_numpy(dtype=object)
+    return np.where(old_na | new_na, old_na != new_na, unequal)
+
+
+def _first_positions(keys: pd.Series, values: typing.Sequence) -> np.ndarray:
+    """
+    :param keys: The keys of each row
+    :param values: The keys to look up
+    :return: The position of the first row with each key of *values*, or ``-1`` if there is none
+    """
+    first = np.flatnonzero(~keys.duplicated().to_numpy())
+    found = pd.Index(keys.iloc[first]).get_indexer(values)
+    return np.where(found >= 0, first[found], -1)
+
+
+def diff(old: pd.DataFrame, new: pd.DataFrame, key: str = "PlayerID") -> ChangeSet:
+    """
+    Compares two versions of the player ID map row by row, matching rows on *key*. If a key
+    occurs in several rows, only the first of them is compared.
+
+    :param old: The old version
+    :param new: The new version
+    :param key: The label of the column which identifies each player
+    :return: The players added, removed and modified between the versions
+    """
+    old_first = np.flatnonzero(~old[key].duplicated().to_numpy())
+    new_first = np.flatnonzero(~new[key].duplicated().to_numpy())
+    old_keys = pd.Index(old[key].iloc[old_first])
+    new_keys = pd.Index(new[key].iloc[new_first])
+
+    added = new_keys[~new_keys.isin(old_keys)].tolist()
+    removed = old_keys[~old_keys.isin(new_keys)].tolist()
+
+    in_old = new_keys.isin(old_keys)
+    common = new_keys[in_old]
+    new_positions = new_first[in_old]
+    old_positions = old_first[old_keys.get_indexer(common)]
+
+    columns = list(new.columns) + [c for c in old.columns if c not in new.columns]
+    changed = np.zeros((len(common), len(columns)), dtype=bool)
+    for j, column in enumerate(columns):
+        if column not in old.columns or column not in new.columns:
+            changed[:, j] = True
+            continue
+        changed[:, j] = _differs(
+            old[column].iloc[old_positions].reset_index(drop=True),
+            new[column].iloc[new_positions].reset_index(drop=True)
+        )
+
+    modified = {}
+    for i in np.flatnonzero(changed.any(axis=1)).tolist():
+        modified[common[i]] = [columns[j] for j in np.flatnonzero(changed[i]).tolist()]
+
+    return ChangeSet(added=added, removed=removed, modified=modified)
+
+
+def apply(old: pd.DataFrame, new: pd.DataFrame, changes: ChangeSet,
+          key: str = "PlayerID") -> Patch:
+    """
+    Updates a copy of the old version of the player ID map with the changed cells of the new
+    version. Removed rows are dropped, only the changed columns of modified rows are copied, and
+    added rows are appended, so that unchanged rows keep their relative order.
+
+    :param old: The old version
+    :param new: The new version
+    :param changes: The differences between *old* and *new*, as returned by :py:func:`diff`
+    :param key: The label of the column which identifies each player
+    :return: The updated player ID map, with the positions of its changed rows
+    """
+    keep = ~old[key].isin(changes.removed).to_numpy()
+    remap = np.full(len(old), -1, dtype=np.intp)
+    remap[keep] = np.arange(keep.sum(), dtype=np.intp)
+
+    data = old.loc[keep].reset_index(drop=True)
+    if list(data.columns) != list(new.columns):
+        data = data.reindex(columns=new.columns)
+
+    for label in data.columns:
+        if isinstance(data[label].dtype, pd.CategoricalDtype) and label in new.columns:
+            categories = pd.Index(new[label].dropna().unique())
+            missing = categories[~categories.isin(data[label].cat.categories)]
+            if len(missing):
+                data[label] = data[label].cat.add_categories(missing)
+
+    columns: typing.Dict[str, typing.List[str]] = {}
+    for player, labels in changes.modified.items():
+        for label in labels:
+            if label in data.columns:
+                columns.setdefault(label, []).append(player)
+    for label, players in columns.items():
+        rows = _first_positions(data[key], players)
+        values = new[label].iloc[_first_positions(new[key], players)]
+        data.iloc[rows, data.columns.get_loc(label)] = values.to_numpy()
+
+    modified_rows = _first_positions(data[key], list(changes.modified))
+    if changes.added:
+        added = new.iloc[_first_positions(new[key], changes.added)].astype({
+            label: data[label].dtype for label in data.columns
+            if isinstance(data[label].dtype, pd.CategoricalDtype)
+        })
+        data = pd.concat([data, added], ignore_index=True)
+    added_rows = np.arange(len(data) - len(changes.added), len(data), dtype=np.intp)
+
+    data.attrs = dict(new.attrs)
+    rows = np.sort(np.concatenate([modified_rows.astype(np.intp), added_rows]))
+    return Patch(data=data, remap=remap, rows=rows)
@@ -0,0 +1,149 @@
+"""
+Inverted indexes for filtering the player ID map by position, team, league and status.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ("position", "team", "league", "active")
+
+_Query = typing.Union[typing.Any, typing.Collection[typing.Any], None]
+
+
+def _key(field: str, value: typing.Any) -> typing.Hashable:
+    """
+    :param field: One of :py:data:`FIELDS`
+    :param value: A value of *field*
+    :return: The key of *value* in the index of *field*
+    """
+    if field == "active":
+        return bool(value)
+    return str(value).strip().upper()
+
+
+def _values(value: _Query) -> typing.List[typing.Any]:
+    """
+    :param value: A value, or a collection of values
+    :return: The values of *value*
+    """
+    if isinstance(value, (str, bytes, bool)) or not isinstance(value, typing.Iterable):
+        return [value]
+    return list(value)
+
+
+class FilterIndex:
+    """
+    Maps each position, team, league and status to the bitset of the rows of the player ID map
+    which have it, so that a filter is answered by intersecting a handful of bitsets instead of
+    scanning the rows. Bit *i* of a bitset, in little-endian bit order, is set if row *i* matches.
+
+    :param all_positions: The lists of positions of each player, or their bitmasks in the compact
+        schema
+    :param teams: The team of each player
+    :param leagues: The league of each player
+    :param active: Whether each player is active
+    :param vocabulary: The positions of the bitmasks of *all_positions*, in bit order, if it holds
+        bitmasks
+    """
+    def __init__(
+            self, all_positions: pd.Series, teams: pd.Series, leagues: pd.Series,
+            active: pd.Series, vocabulary: typing.Optional[typing.Sequence[str]] = None
+    ):
+        self._size = len(teams)
+        self._all = self._pack(np.arange(self._size))
+        self._bitsets: typing.Dict[str, typing.Dict[typing.Hashable, np.ndarray]] = {}
+
+        if vocabulary is not None:
+            masks = np.asarray(all_positions, dtype=np.uint64)
+            self._bitsets["position"] = {
+                _key("position", p): self._pack(np.flatnonzero(masks >> np.uint64(i) & 1))
+                for i, p in enumerate(vocabulary)
+            }
+        else:
+            exploded = all_positions.reset_index(drop=True).explode().dropna()
+            self._bitsets["position"] = self._group(
+                exploded.map(lambda p: _key("position", p)), exploded.index.to_numpy()
+            )
+
+        for field, values in (("team", teams), ("league", leagues), ("active", active)):
+            values = values.reset_index(drop=True).dropna()
+            self._bitsets[field] = self._group(
+                values.map(lambda v, f=field: _key(f, v)), values.index.to_numpy()
+            )
+
+    def _pack(self, rows: np.ndarray) -> np.ndarray:
+        """
+        :param rows: Row positions
+        :return: The bitset of *rows*
+        """
+        mask = np.zeros(self._size, dtype=bool)
+        mask[rows] = True
+        return np.packbits(mask, bitorder="little")
+
+    def _group(
+            self, keys: pd.Series, rows: np.ndarray
+    ) -> typing.Dict[typing.Hashable, np.ndarray]:
+        """
+        :param keys: The key of each of *rows*
+        :param rows: Row positions
+        :return: The bitset of the rows with each key
+        """
+        codes, uniques = pd.factorize(keys)
+        order = np.argsort(codes, kind="stable")
+        groups = np.split(rows[order], np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1])
+        return {key: self._pack(group) for key, group in zip(uniques.tolist(), groups)}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def keys(self, field: str) -> typing.List[typing.Hashable]:
+        """
+        :param field: One of :py:data:`FIELDS`
+        :return: The indexed values of *field*
+        :raise ValueError: *field* is not one of :py:data:`FIELDS`
+        """
+        if field not in self._bitsets:
+            raise ValueError(f"{field!r} is not one of {FIELDS}")
+        return list(self._bitsets[field])
+
+    def bitset(self, **query: _Query) -> np.ndarray:
+        """
+        :param query: Values of the fields of :py:data:`FIELDS` to filter by, each a single value
+            or a collection of values. Rows must match any value of each field and every field.
+            Fields which are ``None`` are not filtered by.
+        :return: The bitset of the matching rows
+        :raise ValueError: A field is not one of :py:data:`FIELDS`
+        """
+        result = self._all
+        for field, value in query.items():
+            if value is None:
+                continue
+            if field not in self._bitsets:
+                raise ValueError(f"{field!r} is not one of {FIELDS}")
+            bitsets = self._bitsets[field]
+            matched = [bitsets.get(_key(field, v)) for v in _values(value)]
+            matched = [b for b in matched if b is not None]
+            if not matched:
+                return np.zeros_like(self._all)
+            union = matched[0] if len(matched) == 1 else np.bitwise_or.reduce(matched)
+            result = union if result is self._all else np.bitwise_and(result, union)
+        return result.copy()
+
+    def rows(self, **query: _Query) -> np.ndarray:
+        """
+        :param query: Values of the fields to filter by, as by :py:meth:`FilterIndex.bitset`
+        :return: The positions of the matching rows, in order
+        :raise ValueError: A field is not one of :py:data:`FIELDS`
+        """
+        bitset = self.bitset(**query)
+        return np.flatnonzero(np.unpackbits(bitset, count=self._size, bitorder="little"))
+
+    def count(self, **query: _Query) -> int:
+        """
+        :param query: Values of the fields to filter by, as by :py:meth:`FilterIndex.bitset`
+        :return: The number of matching rows
+        :raise ValueError: A field is not one of :py:data:`FIELDS`
+        """
+        return int(np.unpackbits(self.bitset(**query)).sum())
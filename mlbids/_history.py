@@ -0,0 +1,272 @@
+"""
+On-disk history of the versions of the formatted player ID map, for point-in-time queries.
+
+Versions are keyed by the latest CHANGELOG date at the time they were downloaded. Every few
+versions, the full player ID map is stored as a checkpoint; every other version is stored as the
+:py:class:`mlbids._diff.ChangeSet` against the previous version along with only the rows of the
+added and modified players. A version is rebuilt by applying the deltas since the nearest
+checkpoint, with :py:func:`mlbids._diff.apply`.
+
+The directory contains a JSON manifest of the versions, one columnar file per version, see
+:py:mod:`mlbids._columnar`, along with a JSON file of the :py:class:`mlbids._diff.ChangeSet` of
+each delta, and the CHANGELOG of the latest version as a columnar file. Nothing is pickled, so
+that the history stays readable across versions of ``pandas`` and reading it runs no code.
+"""
+
+import bisect
+import datetime
+import json
+import os
+import shutil
+import typing
+
+import pandas as pd
+
+from . import _columnar
+from . import _diff
+from ._diff import ChangeSet
+from ._snapshot import SnapshotStore, default_directory
+
+
+FORMAT_VERSION = 2
+
+
+class Version(typing.NamedTuple):
+    """
+    Contains the manifest entry of a stored version
+
+    .. py:attribute:: version
+        The latest CHANGELOG date at the time the version was downloaded
+
+    .. py:attribute:: checkpoint
+        Whether the full player ID map is stored, rather than a delta against the previous version
+
+    .. py:attribute:: rows
+        The number of rows stored: every row for a checkpoint, and the added and modified rows for
+        a delta
+    """
+    version: datetime.datetime
+    checkpoint: bool
+    rows: int
+
+
+class VersionStore:
+    """
+    Reads and writes the history of the player ID map.
+
+    :param directory: Directory in which the history is stored. A ``history`` directory in the
+        default snapshot directory is used if ``None``.
+    :param checkpoint_every: The number of versions stored as deltas between two checkpoints
+    """
+    def __init__(self, directory: typing.Optional[str] = None, checkpoint_every: int = 10):
+        if directory is None:
+            directory = os.path.join(default_directory(), "history")
+        self._directory = directory
+        self._checkpoint_every = checkpoint_every
+        self._cached: typing.Optional[typing.Tuple[datetime.datetime, pd.DataFrame]] = None
+
+    @property
+    def directory(self) -> str:
+        """
+        :return: Directory in which the history is stored
+        """
+        return self._directory
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, "versions.json")
+
+    @property
+    def _changelog_path(self) -> str:
+        return os.path.join(self.directory, "changelog")
+
+    def _version_path(self, version: datetime.datetime) -> str:
+        return os.path.join(self.directory, f"{version:%Y%m%dT%H%M%S}")
+
+    def _changes_path(self, version: datetime.datetime) -> str:
+        return f"{self._version_path(version)}.changes.json"
+
+    @staticmethod
+    def _write(path: str, write: typing.Callable[[str], None]) -> None:
+        """
+        :param path: The path of the file to replace
+        :param write: Writes the contents of the file to the path it is passed
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        write(temp_path)
+        os.replace(temp_path, path)
+
+    @property
+    def versions(self) -> typing.List[Version]:
+        """
+        :return: The stored versions, oldest first
+        """
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return []
+        if manifest.get("format") != FORMAT_VERSION:
+            return []
+        return [
+            Version(
+                version=datetime.datetime.fromisoformat(v["version"]),
+                checkpoint=v["checkpoint"], rows=v["rows"]
+            )
+            for v in manifest["versions"]
+        ]
+
+    def _write_manifest(self, versions: typing.List[Version]) -> None:
+        """
+        :param versions: The stored versions, oldest first
+        """
+        manifest = {
+            "format": FORMAT_VERSION,
+            "versions": [
+                {"version": v.version.isoformat(), "checkpoint": v.checkpoint, "rows": v.rows}
+                for v in versions
+            ],
+        }
+
+        def write(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(manifest, file)
+
+        self._write(self._manifest_path, write)
+
+    @property
+    def changelog(self) -> typing.Optional[pd.DataFrame]:
+        """
+        :return: The CHANGELOG of the latest stored version, or ``None`` if none is stored or it is
+            unreadable
+        """
+        try:
+            return _columnar.load(self._changelog_path, mmap=False)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def record(self, data: pd.DataFrame, changelog: pd.DataFrame) -> typing.Optional[Version]:
+        """
+        Stores a downloaded version of the player ID map, unless a version at least as new is
+        already stored. The version is written before the manifest, so that an interrupted write
+        leaves the history as it was.
+
+        :param data: The formatted player ID map
+        :param changelog: The formatted player ID map CHANGELOG
+        :return: The stored version, or ``None`` if it was not stored
+        """
+        version = SnapshotStore.latest(changelog)
+        versions = self.versions
+        if versions and versions[-1].version >= version:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+
+        since = next(
+            (i for i, v in enumerate(reversed(versions)) if v.checkpoint), len(versions)
+        )
+        previous = None
+        if versions and since < self._checkpoint_every:
+            try:
+                previous = self.as_of(versions[-1].version)
+            except ValueError:
+                previous = None
+
+        if previous is None:
+            entry = Version(version=version, checkpoint=True, rows=len(data))
+            _columnar.save(data, self._version_path(version))
+        else:
+            changes = _diff.diff(previous, data)
+            players = pd.Index(changes.added + list(changes.modified))
+            rows = data.loc[data["PlayerID"].isin(players)]
+            entry = Version(version=version, checkpoint=False, rows=len(rows))
+            _columnar.save(rows, self._version_path(version))
+
+            def write(path: str) -> None:
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump(changes._asdict(), file)
+
+            self._write(self._changes_path(version), write)
+
+        _columnar.save(changelog, self._changelog_path)
+        self._write_manifest(versions + [entry])
+        self._cached = (version, data)
+        return entry
+
+    @staticmethod
+    def _position(
+            versions: typing.List[Version], date: typing.Union[datetime.date, str]
+    ) -> int:
+        """
+        :param versions: The stored versions, oldest first
+        :param date: The date, or its ISO format string
+        :return: The position in *versions* of the latest version on *date*
+        :raise ValueError: No version was stored on or before *date*
+        """
+        date = pd.Timestamp(date).to_pydatetime()
+        position = bisect.bisect_right([v.version for v in versions], date) - 1
+        if position < 0:
+            raise ValueError(f"No version of the player ID map is stored on or before {date}")
+        return position
+
+    def find(self, date: typing.Union[datetime.date, str]) -> Version:
+        """
+        :param date: The date, or its ISO format string
+        :return: The latest stored version on *date*
+        :raise ValueError: No version was stored on or before *date*
+        """
+        versions = self.versions
+        return versions[self._position(versions, date)]
+
+    def as_of(self, date: typing.Union[datetime.date, str]) -> pd.DataFrame:
+        """
+        :param date: The date, or its ISO format string
+        :return: The latest stored version of the player ID map on *date*
+        :raise ValueError: No version was stored on or before *date*, or a stored version needed to
+            rebuild it is unreadable
+        """
+        versions = self.versions
+        position = self._position(versions, date)
+        version = versions[position].version
+        if self._cached is not None and self._cached[0] == version:
+            return self._cached[1]
+
+        start = position
+        while not versions[start].checkpoint:
+            start -= 1
+        data = self._read(versions[start])
+        for entry in versions[start + 1:position + 1]:
+            rows = self._read(entry)
+            try:
+                with open(self._changes_path(entry.version), "r", encoding="utf-8") as file:
+                    changes = ChangeSet(**json.load(file))
+            except (OSError, ValueError, TypeError) as error:
+                raise ValueError(f"Version {entry.version} of the history is unreadable") from error
+            data = _diff.apply(data, rows, changes).data
+
+        self._cached = (version, data)
+        return data
+
+    def _read(self, entry: Version) -> pd.DataFrame:
+        """
+        :param entry: A stored version
+        :return: The rows stored for *entry*: every row for a checkpoint, and the added and
+            modified rows for a delta
+        :raise ValueError: The rows are unreadable
+        """
+        try:
+            return _columnar.load(self._version_path(entry.version), mmap=False)
+        except (OSError, ValueError, KeyError) as error:
+            raise ValueError(f"Version {entry.version} of the history is unreadable") from error
+
+    def clear(self) -> None:
+        """
+        Removes the stored history.
+        """
+        versions = self.versions
+        for path in [self._version_path(v.version) for v in versions] + [self._changelog_path]:
+            shutil.rmtree(path, ignore_errors=True)
+        paths = [self._changes_path(v.version) for v in versions] + [self._manifest_path]
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self._cached = None
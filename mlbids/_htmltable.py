@@ -0,0 +1,176 @@
+"""
+Streaming extractor for the first table of an HTML document.
+
+:py:func:`read_table` produces the same cells as ``pandas.read_html(...)[0]``, but parses the
+document incrementally with ``lxml.etree.iterparse``: each row is reduced to a list of strings as
+soon as it is closed, header and skipped rows are handled as they arrive, and parsing stops at the
+end of the first table instead of building a DOM for the whole document.
+"""
+
+import io
+import typing
+
+from lxml import etree
+import numpy as np
+import pandas as pd
+
+
+# Strings which ``pandas`` parses as ``NaN`` by default
+NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+class NoTableError(ValueError):
+    """
+    Raised when an HTML document contains no table rows
+    """
+
+
+def _span(element: etree._Element, attribute: str) -> int:
+    """
+    :param element: A table cell
+    :param attribute: ``"colspan"`` or ``"rowspan"``
+    :return: The number of columns or rows spanned by *element*
+    """
+    value = element.get(attribute)
+    if value is None:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def _text(element: etree._Element) -> str:
+    """
+    :param element: A table cell
+    :return: The text of *element*, with whitespace collapsed
+    """
+    text = (element.text or "") if len(element) == 0 else "".join(element.itertext())
+    return " ".join(text.split())
+
+
+def iter_rows(source: typing.Union[str, bytes, typing.BinaryIO],
+              encoding: typing.Optional[str] = None) -> typing.Iterator[typing.List[str]]:
+    """
+    Yields the body rows of the first table of an HTML document. Header rows (in ``thead``) are
+    not yielded. Cells spanning several columns or rows are repeated in each of them, and
+    whitespace is collapsed, as by ``pandas.read_html``.
+
+    Only the opening and closing of tables and rows reach Python: the cells of a row are read in
+    one pass once it is closed, after which the row is discarded.
+
+    :param source: The HTML document, or a file-like object which reads it
+    :param encoding: The character encoding of *source*, if it is not declared by the document
+    :return: The text of each cell of each row
+    """
+    if isinstance(source, str):
+        source, encoding = io.BytesIO(source.encode("utf-8")), "utf-8"
+    elif isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    events = etree.iterparse(
+        source, events=("start", "end"), tag=("table", "thead", "tr"), html=True,
+        encoding=encoding, recover=True
+    )
+
+    depth = 0
+    in_thead = False
+    spans: typing.Dict[int, typing.Tuple[str, int]] = {}
+
+    for event, element in events:
+        tag = element.tag
+        if tag == "table":
+            depth += 1 if event == "start" else -1
+            if event == "end" and depth == 0:
+                return
+        elif depth != 1:
+            continue
+        elif tag == "thead":
+            in_thead = event == "start"
+        elif event == "end":
+            row = [
+                (_text(cell), _span(cell, "colspan"), _span(cell, "rowspan"))
+                for cell in element if cell.tag in ("td", "th")
+            ]
+            cells, spans = _expand(row, spans)
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            if not in_thead:
+                yield cells
+
+
+def _expand(
+        row: typing.List[typing.Tuple[str, int, int]],
+        spans: typing.Dict[int, typing.Tuple[str, int]]
+) -> typing.Tuple[typing.List[str], typing.Dict[int, typing.Tuple[str, int]]]:
+    """
+    :param row: The text, column span and row span of each cell of a row
+    :param spans: Cells of previous rows which span into this row, by column
+    :return: The text of each column of the row, and the cells which span into the next row
+    """
+    cells: typing.List[str] = []
+    remaining: typing.Dict[int, typing.Tuple[str, int]] = {}
+    queue = iter(row)
+    while True:
+        column = len(cells)
+        if column in spans:
+            text, rows = spans[column]
+            cells.append(text)
+            if rows > 1:
+                remaining[column] = (text, rows - 1)
+            continue
+        cell = next(queue, None)
+        if cell is None:
+            break
+        text, colspan, rowspan = cell
+        for _ in range(colspan):
+            if rowspan > 1:
+                remaining[len(cells)] = (text, rowspan - 1)
+            cells.append(text)
+
+    for column, span in spans.items():
+        if column >= len(cells):
+            remaining[column] = span
+    return cells, remaining
+
+
+def read_table(
+        source: typing.Union[str, bytes, typing.BinaryIO], header: typing.Optional[int] = None,
+        skip_rows: typing.Collection[int] = (), skip_columns: typing.Collection[int] = (),
+        encoding: typing.Optional[str] = None
+) -> pd.DataFrame:
+    """
+    :param source: The HTML document, or a file-like object which reads it
+    :param header: The position of the body row holding the column labels. The columns are
+        labelled by position if ``None``.
+    :param skip_rows: The positions of the body rows to drop
+    :param skip_columns: The positions of the columns to drop
+    :param encoding: The character encoding of *source*, if it is not declared by the document
+    :return: The cells of the first table of the document. Cells which ``pandas`` would parse as
+        missing are ``NaN``, and all others are strings.
+    :raise NoTableError: The document contains no table rows
+    """
+    labels = None
+    rows = []
+    for i, cells in enumerate(iter_rows(source, encoding)):
+        if i in skip_rows:
+            continue
+        cells = [c for j, c in enumerate(cells) if j not in skip_columns] if skip_columns else cells
+        if i == header:
+            labels = cells
+        else:
+            rows.append([np.nan if c in NA_VALUES else c for c in cells])
+
+    if labels is None and not rows:
+        raise NoTableError("No table rows found")
+
+    width = max([len(labels or ())] + [len(r) for r in rows])
+    rows = [r + [np.nan] * (width - len(r)) for r in rows]
+    if labels is not None:
+        labels = labels + [np.nan] * (width - len(labels))
+
+    return pd.DataFrame(rows, columns=labels, dtype=object)
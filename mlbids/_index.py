@@ -0,0 +1,279 @@
+"""
+Hash indexes over the ID columns of the player ID map.
+"""
+
+import bisect
+import math
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+def _to_str(value: typing.Any) -> str:
+    """
+    :param value: A string ID, possibly parsed as a number
+    :return: The string representation of *value*
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def normalize(values: pd.Series, integer: bool, vectorized: bool = False) -> pd.Series:
+    """
+    Converts the values of an ID column to index keys. Missing IDs, including the ``0`` used for
+    missing integer IDs, become ``NaN``.
+
+    :param values: The values of the ID column
+    :param integer: Whether the ID column holds integer IDs
+    :param vectorized: Whether to convert string IDs with a single ``astype`` call instead of
+        element by element. Floats in columns of mixed type then keep their ``.0`` suffix, and
+        surrounding whitespace is not stripped.
+    :return: The index keys
+    """
+    if integer:
+        keys = pd.to_numeric(values, errors="coerce").astype("float64")
+        keys = keys.where((keys != 0) & (keys == keys.round()) & np.isfinite(keys))
+        return keys.astype("Int64")
+
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        keys = pd.to_numeric(values, errors="coerce").astype("Int64").astype(str)
+    elif vectorized:
+        keys = values.astype(str)
+    else:
+        keys = values.map(_to_str, na_action="ignore")
+    keys = keys.astype(object).where(values.notna().to_numpy())
+    if not vectorized:
+        keys = keys.str.strip()
+    return keys.where(keys != "")
+
+
+def _to_integer(value: typing.Any) -> typing.Optional[int]:
+    """
+    Converts a single integer ID as :py:func:`normalize` does: integral numbers and numeric
+    strings such as ``"592450.0"`` are accepted, and fractional, non-finite and non-numeric values
+    are not.
+
+    :param value: The ID
+    :return: The integer ID, or ``None`` if *value* is not an integral, non-zero number
+    """
+    if isinstance(value, (int, np.integer)):
+        key = int(value)
+    else:
+        if isinstance(value, str):
+            value = value.strip()
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        if not math.isfinite(number) or not number.is_integer():
+            return None
+        key = int(number)
+    return key if key != 0 else None
+
+
+def normalize_key(value: typing.Any, integer: bool) -> typing.Optional[typing.Hashable]:
+    """
+    Converts a single ID to an index key, as :py:func:`normalize` converts a column of them.
+
+    :param value: The ID
+    :param integer: Whether the ID belongs to an integer ID column
+    :return: The index key, or ``None`` if *value* is a missing ID
+    """
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if integer:
+        return _to_integer(value)
+    key = _to_str(value).strip()
+    return key if key else None
+
+
+class IDIndex:
+    """
+    Maps the IDs in one column of the player ID map to the row positions at which they occur.
+
+    Missing IDs are not indexed. If an ID occurs in several rows, :py:meth:`IDIndex.get` returns
+    the first of them and :py:meth:`IDIndex.get_all` returns every one.
+
+    :param values: The values of the ID column
+    :param integer: Whether the ID column holds integer IDs
+    """
+    def __init__(self, values: pd.Series, integer: bool):
+        self._integer = integer
+
+        keys = normalize(values, integer)
+        mask = keys.notna().to_numpy()
+        keys = keys[mask]
+        positions = np.flatnonzero(mask)
+
+        self._row_keys = np.full(len(values), None, dtype=object)
+        self._row_keys[positions] = keys.tolist()
+
+        self._rows: typing.Dict[typing.Hashable, typing.List[int]] = {}
+        self._mapping: typing.Dict[typing.Hashable, int] = {}
+        self._duplicates: typing.Dict[typing.Hashable, typing.List[int]] = {}
+
+        first = ~keys.duplicated(keep="first").to_numpy()
+        for key, position in zip(keys[first].tolist(), positions[first].tolist()):
+            self._rows[key] = [position]
+            self._mapping[key] = position
+
+        repeated = keys.duplicated(keep=False).to_numpy()
+        for key, position in zip(keys[repeated].tolist(), positions[repeated].tolist()):
+            self._duplicates.setdefault(key, []).append(position)
+        for key, rows in self._duplicates.items():
+            self._rows[key] = list(rows)
+
+        self._build_keys()
+
+    def _build_keys(self) -> None:
+        """
+        Rebuilds the arrays searched by :py:meth:`IDIndex.get_indexer` from the mapping of IDs to
+        their first positions.
+        """
+        dtype = "int64" if self.integer else object
+        self._keys = pd.Index(np.fromiter(self._mapping.keys(), dtype=dtype), dtype=dtype)
+        self._positions = np.fromiter(
+            self._mapping.values(), dtype=np.intp, count=len(self._mapping)
+        )
+
+    def update(self, values: pd.Series, remap: np.ndarray, rows: np.ndarray) -> None:
+        """
+        Updates the index in place after rows of the player ID map are removed, modified or
+        added. Only the IDs of the removed and changed rows are normalized and re-hashed; the
+        positions of every other row are shifted by *remap*.
+
+        :param values: The values of the ID column after the update
+        :param remap: The new position of each row before the update, or ``-1`` for removed rows
+        :param rows: The new positions of the modified and added rows
+        """
+        remap = np.asarray(remap, dtype=np.intp)
+        rows = np.asarray(rows, dtype=np.intp)
+
+        changed = np.zeros(len(values), dtype=bool)
+        changed[rows] = True
+        kept = remap >= 0
+        stale = ~kept
+        stale[kept] = changed[remap[kept]]
+
+        affected = set()
+        for position in np.flatnonzero(stale).tolist():
+            key = self._row_keys[position]
+            if key is not None:
+                self._rows[key].remove(position)
+                affected.add(key)
+
+        row_keys = np.full(len(values), None, dtype=object)
+        row_keys[remap[kept]] = self._row_keys[kept]
+        shifted = not np.array_equal(remap[kept], np.flatnonzero(kept))
+        if shifted:
+            lookup = remap.tolist()
+            self._rows = {
+                key: [lookup[p] for p in positions]
+                for key, positions in self._rows.items() if positions
+            }
+
+        keys = normalize(values.iloc[rows], self.integer)
+        for position, key in zip(rows.tolist(), keys.tolist()):
+            if pd.isna(key):
+                continue
+            row_keys[position] = key
+            bisect.insort(self._rows.setdefault(key, []), position)
+            affected.add(key)
+        self._row_keys = row_keys
+
+        if shifted:
+            affected = set(self._rows)
+            self._mapping.clear()
+            self._duplicates.clear()
+        for key in affected:
+            positions = self._rows.get(key)
+            if not positions:
+                self._rows.pop(key, None)
+                self._mapping.pop(key, None)
+                self._duplicates.pop(key, None)
+                continue
+            self._mapping[key] = positions[0]
+            if len(positions) > 1:
+                self._duplicates[key] = list(positions)
+            else:
+                self._duplicates.pop(key, None)
+
+        self._build_keys()
+
+    @property
+    def integer(self) -> bool:
+        """
+        :return: Whether the indexed column holds integer IDs
+        """
+        return self._integer
+
+    @property
+    def duplicates(self) -> typing.Dict[typing.Hashable, typing.List[int]]:
+        """
+        :return: The IDs which occur in more than one row, mapped to the positions of those rows
+        """
+        return self._duplicates
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __contains__(self, value: typing.Any) -> bool:
+        return normalize_key(value, self.integer) in self._mapping
+
+    def get(self, value: typing.Any) -> typing.Optional[int]:
+        """
+        :param value: The ID to look up
+        :return: The position of the first row with the ID, or ``None`` if there is no such row
+        """
+        return self._mapping.get(normalize_key(value, self.integer))
+
+    def get_all(self, value: typing.Any) -> typing.List[int]:
+        """
+        :param value: The ID to look up
+        :return: The positions of every row with the ID
+        """
+        key = normalize_key(value, self.integer)
+        if key in self._duplicates:
+            return list(self._duplicates[key])
+        position = self._mapping.get(key)
+        return [] if position is None else [position]
+
+    def get_indexer(
+            self, values: typing.Union[pd.Series, np.ndarray, typing.Sequence]
+    ) -> np.ndarray:
+        """
+        Looks up every ID of *values* in one vectorized pass. The IDs are factorized first, so that
+        only the distinct IDs need to be normalized.
+
+        :param values: The IDs to look up
+        :return: The position of the first row with each ID, or ``-1`` where there is no such row
+        """
+        codes, uniques = pd.factorize(pd.Series(values, copy=False))
+        keys = normalize(pd.Series(uniques), self.integer, vectorized=True)
+
+        found = np.full(len(keys), -1, dtype=np.intp)
+        mask = keys.notna().to_numpy()
+        if mask.any():
+            found[mask] = self._keys.get_indexer(
+                keys[mask].to_numpy(dtype="int64" if self.integer else object)
+            )
+
+        # The IDs which were not found are normalized again one by one, as by
+        # normalize_key, so that floats of mixed columns and padded IDs still match
+        retry = mask & (found < 0)
+        if not self.integer and retry.any():
+            retried = [normalize_key(v, False) for v in np.asarray(uniques, dtype=object)[retry]]
+            found[retry] = self._keys.get_indexer(np.array(retried, dtype=object))
+
+        positions = np.full(len(keys), -1, dtype=np.intp)
+        hit = found >= 0
+        positions[hit] = self._positions.take(found[hit])
+
+        indexer = np.full(len(codes), -1, dtype=np.intp)
+        present = codes >= 0
+        indexer[present] = positions.take(codes[present])
+        return indexer
@@ -0,0 +1,198 @@
+"""
+Instrumentation of the hot paths of :py:mod:`mlbids`.
+
+Each stage of a load (the Tools page scrape, each download, each parse and format, and index
+builds) is timed by :py:func:`stage`, together with attributes such as byte and row counts.
+Finished stages are reported to the callbacks registered with :py:func:`add_hook`, logged at
+``DEBUG`` level to the ``"mlbids"`` logger, and recorded as spans by the tracer passed to
+:py:func:`enable_tracing`. Lookups are tallied by :py:func:`count`.
+
+Nothing is timed, counted or allocated unless a hook is registered, tracing is enabled, or the
+``"mlbids"`` logger is enabled for ``DEBUG``.
+"""
+
+import logging
+import threading
+import time
+import typing
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+
+logger = logging.getLogger("mlbids")
+
+
+class Event(typing.NamedTuple):
+    """
+    Contains the measurements of a finished stage
+
+    .. py:attribute:: stage
+        The name of the stage
+
+    .. py:attribute:: duration
+        The wall-clock duration of the stage, in seconds
+
+    .. py:attribute:: attributes
+        The attributes of the stage, such as byte and row counts
+    """
+    stage: str
+    duration: float
+    attributes: typing.Dict[str, typing.Any]
+
+
+_hooks: typing.List[typing.Callable[[Event], None]] = []
+_tracer: typing.Any = None
+_counters: typing.Dict[str, int] = {}
+_counters_lock = threading.Lock()
+
+
+def add_hook(hook: typing.Callable[[Event], None]) -> None:
+    """
+    :param hook: Called with the :py:class:`Event` of each finished stage
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: typing.Callable[[Event], None]) -> None:
+    """
+    :param hook: A callback registered with :py:func:`add_hook`
+    """
+    _hooks.remove(hook)
+
+
+def enable_tracing(tracer: typing.Any = None) -> None:
+    """
+    Records each stage as a span.
+
+    :param tracer: An OpenTelemetry tracer, or any object with a compatible
+        ``start_as_current_span`` method. The tracer of the installed ``opentelemetry`` package is
+        used if ``None``.
+    :raise ImportError: *tracer* is ``None`` and ``opentelemetry`` is not installed
+    """
+    global _tracer  # pylint: disable=global-statement
+    if tracer is None:
+        if trace is None:
+            raise ImportError("opentelemetry is not installed")
+        tracer = trace.get_tracer("mlbids")
+    _tracer = tracer
+
+
+def disable_tracing() -> None:
+    """
+    Stops recording stages as spans.
+    """
+    global _tracer  # pylint: disable=global-statement
+    _tracer = None
+
+
+def enabled() -> bool:
+    """
+    :return: Whether stages are measured and lookups counted
+    """
+    return bool(_hooks) or _tracer is not None or logger.isEnabledFor(logging.DEBUG)
+
+
+class Stage:
+    """
+    Measures one stage. Use :py:func:`stage` to create one.
+
+    :param name: The name of the stage
+    :param attributes: The attributes known when the stage starts
+    """
+    def __init__(self, name: str, attributes: typing.Dict[str, typing.Any]):
+        self._name = name
+        self._attributes = attributes
+        self._start = 0.0
+        self._context = None
+        self._span = None
+
+    def set(self, **attributes) -> None:
+        """
+        :param attributes: Attributes learned during the stage, such as byte and row counts
+        """
+        self._attributes.update(attributes)
+
+    def __enter__(self) -> "Stage":
+        if _tracer is not None:
+            self._context = _tracer.start_as_current_span(self._name)
+            self._span = self._context.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        duration = time.perf_counter() - self._start
+        if exc_type is not None:
+            self._attributes["error"] = exc_type.__name__
+
+        if self._context is not None:
+            self._span.set_attributes({
+                k: v for k, v in self._attributes.items()
+                if isinstance(v, (str, bool, int, float))
+            })
+            self._context.__exit__(exc_type, exc_value, traceback)
+            self._context = self._span = None
+
+        event = Event(stage=self._name, duration=duration, attributes=self._attributes)
+        logger.debug("%s took %.6fs %s", event.stage, event.duration, event.attributes)
+        for hook in list(_hooks):
+            hook(event)
+
+
+class _NullStage:
+    """
+    Stands in for :py:class:`Stage` while instrumentation is disabled.
+    """
+    def set(self, **attributes) -> None:
+        """
+        :param attributes: Ignored
+        """
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, **attributes) -> typing.Union[Stage, _NullStage]:
+    """
+    :param name: The name of the stage, such as ``"http.get"``
+    :param attributes: The attributes known when the stage starts
+    :return: A context manager which measures the stage, if instrumentation is enabled
+    """
+    if not enabled():
+        return _NULL_STAGE
+    return Stage(name, attributes)
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    :param name: The name of the counter, such as ``"translate"``
+    :param n: The amount by which to increment the counter
+    """
+    if not enabled():
+        return
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def counters() -> typing.Dict[str, int]:
+    """
+    :return: The value of each counter incremented by :py:func:`count`
+    """
+    with _counters_lock:
+        return dict(_counters)
+
+
+def reset_counters() -> None:
+    """
+    Sets every counter back to zero.
+    """
+    with _counters_lock:
+        _counters.clear()
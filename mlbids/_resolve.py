@@ -0,0 +1,300 @@
+"""
+Resolution of the rows of external datasets to players of the player ID map by an ordered chain
+of key rules.
+
+Each rule is a vectorized hash join. The keys of both sides are factorized, so that only their
+distinct values are normalized and hashed, and the values of a rule with several columns are
+combined into a single integer code one column at a time. Only the rows which are still
+unmatched are joined on the next rule.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import _instrument
+from ._index import normalize
+from ._search import fold
+from .playeridmap import PlayerIDMap
+
+_KeySpec = typing.Union[str, typing.Sequence[str], typing.Mapping[str, str]]
+
+
+class Rule(typing.NamedTuple):
+    """
+    Contains a key rule of :py:class:`Resolver`
+
+    .. py:attribute:: name
+        The name of the rule, the columns of the player ID map joined by ``+``
+
+    .. py:attribute:: columns
+        The columns of the player ID map which make up the key
+
+    .. py:attribute:: feed_columns
+        The columns of the external dataset which are matched to *columns*
+    """
+    name: str
+    columns: typing.Tuple[str, ...]
+    feed_columns: typing.Tuple[str, ...]
+
+    @classmethod
+    def parse(cls, key: _KeySpec) -> "Rule":
+        """
+        :param key: A column of the player ID map, a sequence of its columns, or a mapping of the
+            columns of the external dataset to the columns of the player ID map. The external
+            dataset has the same column names unless *key* is a mapping.
+        :return: The rule of *key*
+        :raise ValueError: *key* names no columns
+        """
+        if isinstance(key, str):
+            feed_columns, columns = (key,), (key,)
+        elif isinstance(key, typing.Mapping):
+            feed_columns, columns = tuple(key.keys()), tuple(key.values())
+        else:
+            feed_columns = columns = tuple(key)
+        if not columns:
+            raise ValueError("A key must name at least one column")
+        return cls("+".join(columns), columns, feed_columns)
+
+
+def _kind(column: str) -> str:
+    """
+    :param column: A column of the player ID map
+    :return: How the values of *column* are normalized: ``"integer"`` or ``"string"`` for ID
+        columns, ``"date"`` for **Birthdate** and ``"name"`` otherwise
+    """
+    if column in PlayerIDMap._integer_columns:
+        return "integer"
+    if column in PlayerIDMap._string_id_columns:
+        return "string"
+    if column == "Birthdate":
+        return "date"
+    return "name"
+
+
+def _fold(value: typing.Any) -> typing.Any:
+    """
+    :param value: A name, team or other text value
+    :return: *value* folded by :py:func:`mlbids._search.fold`, or ``None`` if it is missing or
+        folds to nothing
+    """
+    if not isinstance(value, str):
+        if pd.isna(value):
+            return None
+        value = str(value)
+    return fold(value) or None
+
+
+def _normalize(values: pd.Series, kind: str) -> pd.Series:
+    """
+    :param values: Distinct values of a key column
+    :param kind: The kind of the key column, as by :py:func:`_kind`
+    :return: The keys of *values*, missing where *values* is missing
+    """
+    if kind in ("integer", "string"):
+        return normalize(values, kind == "integer")
+    if kind == "date":
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            values = pd.to_datetime(values, errors="coerce")
+        return values.dt.normalize().astype("datetime64[ns]")
+    return values.map(_fold)
+
+
+def _encode(values: pd.Series, kind: str) -> typing.Tuple[np.ndarray, pd.Index]:
+    """
+    :param values: The values of a key column
+    :param kind: The kind of the key column, as by :py:func:`_kind`
+    :return: The code of the key of each value, or ``-1`` where the key is missing, and the
+        distinct keys in order of their codes
+    """
+    codes, uniques = pd.factorize(values)
+    keys = _normalize(pd.Series(np.asarray(uniques, dtype=object), dtype=object), kind)
+    key_codes, key_uniques = pd.factorize(keys)
+    result = np.full(len(codes), -1, dtype=np.intp)
+    present = codes >= 0
+    result[present] = key_codes.take(codes[present])
+    return result, pd.Index(key_uniques)
+
+
+def _combine(codes: np.ndarray, other: np.ndarray, radix: int) -> np.ndarray:
+    """
+    :param codes: Key codes
+    :param other: The key codes of another column, each less than *radix*
+    :param radix: The number of distinct keys of the other column
+    :return: A code for each pair of codes, or ``-1`` where either is ``-1``
+    """
+    combined = np.full(len(codes), -1, dtype=np.int64)
+    present = (codes >= 0) & (other >= 0)
+    combined[present] = codes[present].astype(np.int64) * radix + other[present]
+    return combined
+
+
+def _factorize(combined: np.ndarray) -> typing.Tuple[np.ndarray, pd.Index]:
+    """
+    :param combined: Combined key codes, as by :py:func:`_combine`
+    :return: A dense code for each of *combined*, or ``-1`` where it is ``-1``, and the distinct
+        combined codes in order of their dense codes
+    """
+    codes = np.full(len(combined), -1, dtype=np.intp)
+    present = combined >= 0
+    dense, uniques = pd.factorize(combined[present])
+    codes[present] = dense
+    return codes, pd.Index(uniques)
+
+
+def _lookup(index: pd.Index, keys: np.ndarray) -> np.ndarray:
+    """
+    :param index: Distinct keys
+    :param keys: Key codes, or ``-1`` where the key is missing
+    :return: The position of each of *keys* in *index*, or ``-1`` where it is missing or absent
+    """
+    codes = np.full(len(keys), -1, dtype=np.intp)
+    present = keys >= 0
+    codes[present] = index.get_indexer(keys[present])
+    return codes
+
+
+class _Join(typing.NamedTuple):
+    """
+    The player ID map side of the hash join of a rule
+
+    .. py:attribute:: steps
+        For each column after the first, the number of its distinct keys and the distinct
+        combined codes of the columns up to it
+
+    .. py:attribute:: rows
+        The row with each combined key code, or ``-1`` if several rows have it
+    """
+    steps: typing.List[typing.Tuple[int, pd.Index]]
+    rows: np.ndarray
+
+
+class Resolver:
+    """
+    Resolves the rows of external datasets to rows of the player ID map. The keys of the player ID
+    map are normalized and hashed once per column and rule, and reused for every dataset.
+
+    ID columns are normalized as by :py:class:`mlbids._index.IDIndex`, **Birthdate** is compared
+    by day, and every other column, such as the names and **Team**, is folded as by
+    :py:func:`mlbids._search.fold`. Keys which occur in several rows of the player ID map are
+    ambiguous and match nothing.
+
+    :param data: The player ID map
+    """
+    def __init__(self, data: pd.DataFrame):
+        self._data = data
+        self._columns: typing.Dict[str, typing.Tuple[np.ndarray, pd.Index]] = {}
+        self._joins: typing.Dict[typing.Tuple[str, ...], _Join] = {}
+
+    def _column(self, column: str) -> typing.Tuple[np.ndarray, pd.Index]:
+        """
+        :param column: A column of the player ID map
+        :return: The key codes of *column*, as by :py:func:`_encode`
+        :raise ValueError: *column* is not a column of the player ID map
+        """
+        encoded = self._columns.get(column)
+        if encoded is None:
+            if column not in self._data.columns:
+                raise ValueError(f"{column!r} is not a column of the player ID map")
+            encoded = self._columns[column] = _encode(self._data[column], _kind(column))
+        return encoded
+
+    def _join(self, columns: typing.Tuple[str, ...]) -> _Join:
+        """
+        :param columns: The columns of a rule
+        :return: The player ID map side of the hash join on *columns*
+        :raise ValueError: A column is not a column of the player ID map
+        """
+        join = self._joins.get(columns)
+        if join is not None:
+            return join
+
+        codes, uniques = self._column(columns[0])
+        size = len(uniques)
+        steps = []
+        for column in columns[1:]:
+            other, other_uniques = self._column(column)
+            combined = _combine(codes, other, len(other_uniques))
+            codes, combined_uniques = _factorize(combined)
+            steps.append((len(other_uniques), combined_uniques))
+            size = len(combined_uniques)
+
+        present = codes >= 0
+        counts = np.bincount(codes[present], minlength=size)
+        rows = np.full(size, -1, dtype=np.intp)
+        unique = present.copy()
+        unique[present] = counts.take(codes[present]) == 1
+        rows[codes[unique]] = np.flatnonzero(unique)
+
+        join = self._joins[columns] = _Join(steps, rows)
+        return join
+
+    def _feed_codes(self, df: pd.DataFrame, rule: Rule) -> np.ndarray:
+        """
+        :param df: Rows of the external dataset
+        :param rule: The rule to join on
+        :return: The combined key code of each row of *df* in the code space of the player ID
+            map, or ``-1`` where the key is missing or absent from the player ID map
+        """
+        join = self._join(rule.columns)
+        codes = None
+        for i, (column, feed_column) in enumerate(zip(rule.columns, rule.feed_columns)):
+            _, uniques = self._column(column)
+            feed_codes, feed_uniques = _encode(df[feed_column], _kind(column))
+            translated = uniques.get_indexer(feed_uniques)
+            other = np.full(len(feed_codes), -1, dtype=np.intp)
+            present = feed_codes >= 0
+            other[present] = translated.take(feed_codes[present])
+            if i == 0:
+                codes = other
+            else:
+                radix, combined_uniques = join.steps[i - 1]
+                codes = _lookup(combined_uniques, _combine(codes, other, radix))
+        return codes
+
+    def match(self, df: pd.DataFrame, rule: Rule) -> np.ndarray:
+        """
+        :param df: Rows of the external dataset
+        :param rule: The rule to join on
+        :return: The position of the row of the player ID map which each row of *df* matches,
+            or ``-1`` where it matches no row or several rows
+        :raise ValueError: A column of *rule* is missing from the player ID map or from *df*
+        """
+        missing = [c for c in rule.feed_columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"{missing} are not columns of the dataset")
+        codes = self._feed_codes(df, rule)
+        rows = np.full(len(codes), -1, dtype=np.intp)
+        present = codes >= 0
+        rows[present] = self._join(rule.columns).rows.take(codes[present])
+        return rows
+
+    def resolve(
+            self, df: pd.DataFrame, keys: typing.Sequence[_KeySpec]
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Joins the rows of *df* on each rule of *keys* in turn. Only the rows which no earlier rule
+        matched are joined on a rule.
+
+        :param df: The external dataset
+        :param keys: The key rules, in order of preference, as by :py:meth:`Rule.parse`
+        :return: The position of the row of the player ID map which each row of *df* matches, or
+            ``-1``, and the index in *keys* of the rule which matched it, or ``-1``
+        :raise ValueError: A column of a rule is missing from the player ID map or from *df*
+        """
+        rules = [Rule.parse(key) for key in keys]
+        rows = np.full(len(df), -1, dtype=np.intp)
+        matched_by = np.full(len(df), -1, dtype=np.intp)
+        pending = np.arange(len(df))
+        for i, rule in enumerate(rules):
+            if not len(pending):
+                break
+            with _instrument.stage("resolve.rule", rule=rule.name, rows=len(pending)) as stage:
+                found = self.match(df.iloc[pending], rule)
+                hit = found >= 0
+                rows[pending[hit]] = found[hit]
+                matched_by[pending[hit]] = i
+                pending = pending[~hit]
+                stage.set(matched=int(hit.sum()))
+        return rows, matched_by
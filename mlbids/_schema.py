@@ -0,0 +1,210 @@
+"""
+Compact, memory-lean ``DataFrame`` schema for the player ID map.
+
+The schema is read from ``playeridmap_schema.json``, which assigns one of the following kinds to
+every column of ``playeridmap_columns.json``:
+
+- ``string``: Arrow-backed strings if ``pyarrow`` is installed, and ``object`` otherwise
+- ``category``: Categorical, for low-cardinality columns
+- ``id``: ``int32`` (or ``int64`` if the IDs do not fit), with ``0`` for missing IDs
+- ``boolean``: Nullable Boolean
+- ``datetime``: ``datetime64``
+- ``positions``: Bitmask of the positions in each list, see :py:class:`PositionCodec`
+"""
+
+import json
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # pylint: disable=unused-import
+except ImportError:
+    pyarrow = None
+
+
+class Schema(typing.NamedTuple):
+    """
+    Contains the compact schema of the player ID map
+
+    .. py:attribute:: dtypes
+        Mapping of each column label to its kind
+
+    .. py:attribute:: positions
+        The positions which are assigned the lowest bits of the **AllPositions** bitmask
+    """
+    dtypes: typing.Dict[str, str]
+    positions: typing.List[str]
+
+
+def load_schema(
+        schema_path: str = os.path.join("mlbids", "data", "playeridmap_schema.json"),
+        columns_path: str = os.path.join("mlbids", "data", "playeridmap_columns.json")
+) -> Schema:
+    """
+    :param schema_path: Path to JSON file containing the compact schema
+    :param columns_path: Path to JSON file containing the ``DataFrame`` column labels
+    :return: The compact schema of the player ID map
+    :raise ValueError: The schema does not cover exactly the column labels
+    """
+    with open(schema_path, "r", encoding="utf-8") as file:
+        schema = json.load(file)
+    with open(columns_path, "r", encoding="utf-8") as file:
+        columns = json.load(file)
+
+    if set(schema["dtypes"]) != set(columns):
+        raise ValueError(f"{schema_path} does not match {columns_path}")
+    return Schema(
+        dtypes={column: schema["dtypes"][column] for column in columns},
+        positions=schema["positions"]
+    )
+
+
+class PositionCodec:
+    """
+    Encodes the lists of positions of the **AllPositions** column as bitmasks, with bit *i* set
+    if a player is eligible at the *i*-th position of :py:attr:`PositionCodec.vocabulary`.
+    Missing lists are encoded as ``0``.
+
+    :param vocabulary: The positions, in bit order
+    """
+    def __init__(self, vocabulary: typing.Sequence[str]):
+        self._vocabulary = tuple(vocabulary)
+        if len(self._vocabulary) > 64:
+            raise ValueError("At most 64 positions can be encoded")
+        self._bits = {position: i for i, position in enumerate(self._vocabulary)}
+
+    @classmethod
+    def fit(cls, all_positions: pd.Series, base: typing.Sequence[str] = ()) -> "PositionCodec":
+        """
+        :param all_positions: The lists of positions of each player
+        :param base: The positions to assign the lowest bits, in order
+        :return: A codec whose vocabulary is *base* followed by any other positions in
+            *all_positions*, sorted
+        """
+        seen = set(all_positions.explode().dropna().unique())
+        return cls(list(base) + sorted(seen.difference(base)))
+
+    @property
+    def vocabulary(self) -> typing.Tuple[str, ...]:
+        """
+        :return: The positions, in bit order
+        """
+        return self._vocabulary
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        :return: The smallest unsigned integer type that holds every bitmask
+        """
+        return np.dtype(np.uint32 if len(self.vocabulary) <= 32 else np.uint64)
+
+    def bit(self, position: str) -> int:
+        """
+        :param position: A position
+        :return: The bitmask of the single *position*
+        :raise KeyError: *position* is not in the vocabulary
+        """
+        return 1 << self._bits[position]
+
+    def encode(self, all_positions: pd.Series) -> np.ndarray:
+        """
+        :param all_positions: The lists of positions of each player
+        :return: The bitmask of each player
+        :raise KeyError: A position is not in the vocabulary
+        """
+        exploded = all_positions.reset_index(drop=True).explode().dropna()
+        bits = exploded.map(self._bits)
+        if bits.isna().any():
+            raise KeyError(f"Unknown positions: {sorted(set(exploded[bits.isna()]))}")
+
+        masks = np.zeros(len(all_positions), dtype=self.dtype)
+        flags = np.left_shift(self.dtype.type(1), bits.to_numpy(dtype=self.dtype))
+        np.bitwise_or.at(masks, exploded.index.to_numpy(), flags)
+        return masks
+
+    def decode(self, masks: typing.Union[pd.Series, np.ndarray]) -> pd.Series:
+        """
+        :param masks: The bitmask of each player
+        :return: The list of positions of each player, in vocabulary order, or ``NaN`` where the
+            bitmask is ``0``
+        """
+        masks = pd.Series(masks, copy=False)
+        decoded = {
+            mask: [p for i, p in enumerate(self.vocabulary) if mask >> i & 1] or np.nan
+            for mask in masks.unique().tolist()
+        }
+        return masks.map(decoded).astype(object)
+
+
+def _string_dtype() -> typing.Any:
+    """
+    :return: The ``dtype`` of the compact string columns
+    """
+    return object if pyarrow is None else pd.StringDtype("pyarrow")
+
+
+def compact(df: pd.DataFrame, schema: typing.Optional[Schema] = None) -> pd.DataFrame:
+    """
+    Converts a formatted player ID map to the compact schema. The position vocabulary is stored
+    in ``df.attrs["AllPositions"]``.
+
+    :param df: The formatted player ID map
+    :param schema: The compact schema. Loaded from ``playeridmap_schema.json`` by default.
+    :return: The player ID map in the compact schema
+    """
+    schema = load_schema() if schema is None else schema
+
+    columns = {}
+    attrs = {}
+    for column in df.columns:
+        kind = schema.dtypes.get(column)
+        values = df[column]
+        if kind == "string":
+            values = values.astype(_string_dtype())
+        elif kind == "category":
+            values = values.astype("category")
+        elif kind == "id":
+            values = pd.to_numeric(values).fillna(0).astype(np.int64)
+            info = np.iinfo(np.int32)
+            if values.empty or (values.min() >= info.min and values.max() <= info.max):
+                values = values.astype(np.int32)
+        elif kind == "boolean":
+            values = values.astype("boolean")
+        elif kind == "datetime":
+            values = pd.to_datetime(values)
+        elif kind == "positions" and not pd.api.types.is_integer_dtype(values.dtype):
+            codec = PositionCodec.fit(values, schema.positions)
+            values = pd.Series(codec.encode(values), index=values.index, name=column)
+            attrs[column] = list(codec.vocabulary)
+        columns[column] = values
+
+    result = pd.DataFrame(columns, index=df.index)
+    result.attrs.update(df.attrs)
+    result.attrs.update(attrs)
+    return result
+
+
+def memory_report(df: pd.DataFrame, schema: typing.Optional[Schema] = None) -> pd.DataFrame:
+    """
+    :param df: The formatted player ID map
+    :param schema: The compact schema. Loaded from ``playeridmap_schema.json`` by default.
+    :return: The ``dtype`` and memory usage in bytes of each column of *df*, before and after
+        conversion to the compact schema, with the totals in the last row
+    """
+    compacted = compact(df, schema)
+
+    report = pd.DataFrame(
+        {
+            "dtype": df.dtypes.astype(str),
+            "bytes": df.memory_usage(index=False, deep=True),
+            "compact_dtype": compacted.dtypes.astype(str),
+            "compact_bytes": compacted.memory_usage(index=False, deep=True),
+        }
+    )
+    totals = report.loc[:, ["bytes", "compact_bytes"]].sum()
+    report.loc["Total", ["bytes", "compact_bytes"]] = totals
+    report.loc[:, "saving"] = 1 - report.loc[:, "compact_bytes"] / report.loc[:, "bytes"]
+    return report
@@ -0,0 +1,251 @@
+"""
+Fuzzy search index over the name columns of the player ID map.
+
+Names are folded to lowercase ASCII tokens, with accents, punctuation and generational suffixes
+removed, and each folded name is broken into character trigrams. A query is scored against every
+indexed name at once by counting shared trigrams over the posting lists, and ranked by the Dice
+coefficient of the two trigram sets.
+"""
+
+import collections
+import datetime
+import re
+import typing
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+
+_PUNCTUATION = re.compile(r"['.’]")
+_TOKEN = re.compile(r"[a-z0-9]+")
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv"})
+
+
+def fold(name: str) -> str:
+    """
+    Normalizes a name for comparison, so that ``"Ronald Acuña Jr."``, ``"Ronald Acuna"`` and
+    ``"Acuna, Ronald"`` all fold to ``"acuna ronald"``.
+
+    :param name: The name
+    :return: The lowercase, accent-free tokens of *name*, without generational suffixes, in sorted
+        order
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    tokens = _TOKEN.findall(_PUNCTUATION.sub("", text))
+    tokens = [t for t in tokens if t not in _SUFFIXES] or tokens
+    return " ".join(sorted(tokens))
+
+
+def trigrams(folded: str) -> typing.Set[str]:
+    """
+    :param folded: A name folded by :py:func:`fold`
+    :return: The character trigrams of each token of *folded*, padded with a space on each side
+    """
+    grams = set()
+    for token in folded.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class Match(typing.NamedTuple):
+    """
+    Contains the best matching name of a player for a query
+
+    .. py:attribute:: row
+        The position of the player's row in the player ID map
+
+    .. py:attribute:: column
+        The label of the column holding the matching name
+
+    .. py:attribute:: name
+        The matching name
+
+    .. py:attribute:: score
+        The similarity of the folded query and name, from ``0`` to ``1``
+    """
+    row: int
+    column: str
+    name: str
+    score: float
+
+
+class NameIndex:
+    """
+    Trigram index over the name columns of the player ID map. Names of a player which fold to the
+    same tokens are indexed once, with the set of columns in which they occur.
+
+    :param names: The name columns of the player ID map
+    :param teams: The team of each player, used to break ties between namesakes
+    :param birthdates: The birthdate of each player, used to break ties between namesakes
+    """
+    def __init__(
+            self, names: pd.DataFrame, teams: typing.Optional[pd.Series] = None,
+            birthdates: typing.Optional[pd.Series] = None
+    ):
+        self._columns = list(names.columns)
+        if len(self._columns) > 63:
+            raise ValueError("At most 63 name columns can be indexed")
+
+        entries: typing.Dict[typing.Tuple[int, str], int] = {}
+        rows, masks, sizes = [], [], []
+        postings: typing.Dict[str, typing.List[int]] = collections.defaultdict(list)
+        folded: typing.Dict[str, typing.Tuple[str, typing.Set[str]]] = {}
+
+        for j, column in enumerate(self._columns):
+            for row, value in enumerate(names[column].to_numpy(dtype=object).tolist()):
+                if not isinstance(value, str):
+                    continue
+                if value not in folded:
+                    key = fold(value)
+                    folded[value] = (key, trigrams(key))
+                key, grams = folded[value]
+                if not grams:
+                    continue
+
+                entry = entries.get((row, key))
+                if entry is not None:
+                    masks[entry] |= 1 << j
+                    continue
+                entry = entries[(row, key)] = len(rows)
+                rows.append(row)
+                masks.append(1 << j)
+                sizes.append(len(grams))
+                for gram in grams:
+                    postings[gram].append(entry)
+
+        self._rows = np.array(rows, dtype=np.intp)
+        self._masks = np.array(masks, dtype=np.uint64)
+        self._sizes = np.array(sizes, dtype=np.float64)
+        self._names = names.to_numpy(dtype=object)
+        self._postings = {g: np.array(p, dtype=np.intp) for g, p in postings.items()}
+
+        self._teams = None if teams is None else teams.to_numpy(dtype=object)
+        self._birthdates = None if birthdates is None else \
+            pd.to_datetime(birthdates).to_numpy(dtype="datetime64[ns]")
+
+    @property
+    def columns(self) -> typing.List[str]:
+        """
+        :return: The labels of the indexed name columns
+        """
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _column_bits(self, columns: typing.Optional[typing.Collection[str]]) -> int:
+        """
+        :param columns: The labels of the name columns to search, or ``None`` for every column
+        :return: The bitmask of the positions of *columns*
+        :raise ValueError: A column of *columns* is not indexed
+        """
+        if columns is None:
+            return (1 << len(self._columns)) - 1
+        unknown = [c for c in columns if c not in self._columns]
+        if unknown:
+            raise ValueError(f"Columns are not indexed: {unknown}")
+        return sum(1 << self._columns.index(c) for c in set(columns))
+
+    def search(
+            self, query: str, limit: int = 5,
+            columns: typing.Optional[typing.Collection[str]] = None,
+            team: typing.Optional[str] = None,
+            birthdate: typing.Optional[typing.Union[datetime.date, str]] = None,
+            threshold: float = 0.5
+    ) -> typing.List[Match]:
+        """
+        :param query: The name to search for
+        :param limit: The maximum number of players to return
+        :param columns: The labels of the name columns to search, or ``None`` for every column
+        :param team: If any candidate plays for *team*, only those candidates are returned
+        :param birthdate: If any candidate was born on *birthdate*, only those candidates are
+            returned
+        :param threshold: The minimum score of a match
+        :return: The best matching name of each matching player, best first
+        :raise ValueError: A column of *columns* is not indexed
+        """
+        return self._search(query, limit, self._column_bits(columns), team, birthdate, threshold)
+
+    def _search(
+            self, query: str, limit: int, bits: int, team: typing.Optional[str],
+            birthdate: typing.Optional[typing.Union[datetime.date, str]], threshold: float
+    ) -> typing.List[Match]:
+        """
+        :param bits: The bitmask of the positions of the name columns to search
+
+        See :py:meth:`NameIndex.search` for the other parameters.
+        """
+        grams = trigrams(fold(query))
+        arrays = [self._postings[g] for g in grams if g in self._postings]
+        if not arrays:
+            return []
+
+        shared = np.bincount(np.concatenate(arrays), minlength=len(self._rows))
+        scores = 2 * shared / (len(grams) + self._sizes)
+        mask = (self._masks & np.uint64(bits)) != 0
+        candidates = np.flatnonzero((scores >= threshold) & mask)
+        if not len(candidates):
+            return []
+
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        _, first = np.unique(self._rows[order], return_index=True)
+        order = order[np.sort(first)]
+
+        if team is not None and self._teams is not None:
+            on_team = self._teams[self._rows[order]] == team
+            if on_team.any():
+                order = order[on_team]
+        if birthdate is not None and self._birthdates is not None:
+            born = self._birthdates[self._rows[order]] == np.datetime64(pd.Timestamp(birthdate))
+            if born.any():
+                order = order[born]
+
+        matches = []
+        for entry in order[:limit].tolist():
+            row, matched = int(self._rows[entry]), int(self._masks[entry]) & bits
+            column = (matched & -matched).bit_length() - 1
+            matches.append(Match(
+                row=row, column=self._columns[column], name=self._names[row, column],
+                score=float(scores[entry])
+            ))
+        return matches
+
+    def search_many(
+            self, queries: typing.Sequence[str],
+            columns: typing.Optional[typing.Collection[str]] = None,
+            teams: typing.Optional[typing.Sequence[typing.Optional[str]]] = None,
+            birthdates: typing.Optional[typing.Sequence[typing.Any]] = None,
+            threshold: float = 0.5
+    ) -> typing.List[typing.Optional[Match]]:
+        """
+        Resolves many names at once, such as a whole roster. Repeated queries are searched once.
+
+        :param queries: The names to search for
+        :param columns: The labels of the name columns to search, or ``None`` for every column
+        :param teams: The team of each query, or ``None``
+        :param birthdates: The birthdate of each query, or ``None``
+        :param threshold: The minimum score of a match
+        :return: The best match for each query, or ``None`` where there is no match
+        :raise ValueError: A column of *columns* is not indexed
+        """
+        bits = self._column_bits(columns)
+        teams = [None] * len(queries) if teams is None else list(teams)
+        birthdates = [None] * len(queries) if birthdates is None else list(birthdates)
+
+        results: typing.Dict[typing.Tuple, typing.Optional[Match]] = {}
+        matches = []
+        for query, team, birthdate in zip(queries, teams, birthdates):
+            if not isinstance(query, str):
+                matches.append(None)
+                continue
+            team = None if pd.isna(team) else team
+            birthdate = None if pd.isna(birthdate) else birthdate
+            key = (fold(query), team, birthdate)
+            if key not in results:
+                found = self._search(query, 1, bits, team, birthdate, threshold)
+                results[key] = found[0] if found else None
+            matches.append(results[key])
+        return matches
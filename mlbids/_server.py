@@ -0,0 +1,509 @@
+"""
+A local lookup daemon, which loads the player ID map once and answers batched ID translation and
+name search requests over HTTP/1.1, on a TCP port or a Unix domain socket. Start it with
+``python -m mlbids serve``.
+
+Endpoints:
+
+- ``POST /translate``: ``{"from": "MLBID", "to": "FanGraphsID", "ids": [...]}``. *to* may also be
+  a list of columns. Answers ``{"results": [...]}``, or ``{"results": {column: [...]}}`` for a
+  list of columns, aligned with *ids*, with ``null`` for IDs which cannot be translated.
+  ``GET /translate?from=...&to=...&id=...&id=...`` answers the same for a single *to* column.
+- ``POST /search``: ``{"names": [...], "site": null, "threshold": 0.5}``. Answers
+  ``{"results": [{"PlayerID": ..., "Name": ..., "Column": ..., "Score": ...}, ...]}``, aligned
+  with *names*. ``GET /search?q=...&limit=5`` answers the best matches of one name.
+- ``GET /stats``: Request, item and latency counters of each endpoint.
+- ``GET /health``: The status and version of the loaded player ID map.
+
+The player ID map is refreshed in the background: whenever
+:py:meth:`mlbids.playeridmap.PlayerIDMap.check_for_update` reports a newer version, a new
+:py:class:`mlbids.PIDMap` is loaded and its indexes are built, and then it replaces the old one in
+a single assignment, so that every request is answered from one consistent version.
+"""
+
+import collections
+import datetime
+from http import server
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+import typing
+import urllib.parse
+
+import numpy as np
+import pandas as pd
+
+from . import PIDMap
+from .playeridmap import PlayerIDMap
+
+logger = logging.getLogger("mlbids.server")
+
+
+class Stats:
+    """
+    Counts the requests, items and latencies of each endpoint.
+
+    :param window: The number of latest requests of each endpoint from which the latency
+        percentiles are computed
+    """
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._requests: typing.Dict[str, int] = collections.Counter()
+        self._errors: typing.Dict[str, int] = collections.Counter()
+        self._items: typing.Dict[str, int] = collections.Counter()
+        self._seconds: typing.Dict[str, float] = collections.Counter()
+        self._latencies: typing.Dict[str, typing.Deque[float]] = collections.defaultdict(
+            lambda: collections.deque(maxlen=window)
+        )
+
+    def record(self, endpoint: str, seconds: float, items: int = 0, error: bool = False) -> None:
+        """
+        :param endpoint: The path of the endpoint
+        :param seconds: The time taken to answer the request
+        :param items: The number of IDs or names in the request
+        :param error: Whether the request failed
+        """
+        with self._lock:
+            self._requests[endpoint] += 1
+            self._errors[endpoint] += error
+            self._items[endpoint] += items
+            self._seconds[endpoint] += seconds
+            self._latencies[endpoint].append(seconds)
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """
+        :return: The counters of each endpoint, with the mean, median, 99th percentile and
+            maximum latency in milliseconds of its latest requests
+        """
+        with self._lock:
+            uptime = time.time() - self._started
+            endpoints = {}
+            for endpoint, count in self._requests.items():
+                latencies = np.array(self._latencies[endpoint]) * 1000
+                endpoints[endpoint] = {
+                    "requests": count,
+                    "errors": self._errors[endpoint],
+                    "items": self._items[endpoint],
+                    "requests_per_second": count / uptime if uptime else 0.0,
+                    "mean_ms": self._seconds[endpoint] * 1000 / count,
+                    "p50_ms": float(np.percentile(latencies, 50)),
+                    "p99_ms": float(np.percentile(latencies, 99)),
+                    "max_ms": float(latencies.max()),
+                }
+        return {"uptime": uptime, "endpoints": endpoints}
+
+
+class BadRequest(ValueError):
+    """
+    Raised for a request which cannot be answered, and answered with ``400 Bad Request``.
+    """
+
+
+def _json_values(values: typing.Union[pd.Series, np.ndarray]) -> list:
+    """
+    :param values: Translated IDs, with ``None`` for IDs which cannot be translated, or the lists
+        of a list-valued column such as **AllPositions**
+    :return: The IDs as JSON values
+    """
+    values = pd.Series(values, dtype=object)
+    return [
+        list(v) if isinstance(v, (list, tuple, np.ndarray))
+        else None if pd.isna(v) else v.item() if isinstance(v, np.generic) else v
+        for v in values.tolist()
+    ]
+
+
+def _aligned_list(request: typing.Dict[str, typing.Any], key: str, length: int) -> typing.Any:
+    """
+    :param request: A request of :py:meth:`Service.search`
+    :param key: The key of an optional list which is aligned with the ``names`` of *request*
+    :param length: The number of ``names``
+    :return: The list, or ``None`` if it is not given
+    :raise BadRequest: The value is not a list of *length* items
+    """
+    value = request.get(key)
+    if value is not None and (not isinstance(value, list) or len(value) != length):
+        raise BadRequest(f"'{key}' must be a list with an item for each name")
+    return value
+
+
+class Service:
+    """
+    Answers the requests of the daemon from a :py:class:`mlbids.PIDMap`, which is replaced
+    atomically when a newer player ID map is published.
+
+    :param factory: Creates a :py:class:`mlbids.PIDMap`, which is loaded by the service
+    :param refresh_interval: The number of seconds between checks for a newer player ID map, or
+        ``0`` to never check
+    """
+    def __init__(
+            self, factory: typing.Callable[[], PIDMap] = PIDMap, refresh_interval: float = 600
+    ):
+        self._factory = factory
+        self._refresh_interval = refresh_interval
+        self._pid_map: typing.Optional[PIDMap] = None
+        self._refresh_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._columns: typing.FrozenSet[str] = frozenset()
+        self._poller: typing.Optional[PlayerIDMap] = None
+        self._searched = False
+        self._refreshed: typing.Optional[float] = None
+        self.stats = Stats()
+
+    @property
+    def pid_map(self) -> PIDMap:
+        """
+        :return: The loaded player ID map, loaded on first access
+        """
+        pid_map = self._pid_map
+        if pid_map is None:
+            with self._refresh_lock:
+                if self._pid_map is None:
+                    self._pid_map = self._load()
+                    self._poller = self._pid_map.pid_map
+                    self._refreshed = time.time()
+                pid_map = self._pid_map
+        return pid_map
+
+    def _load(self) -> PIDMap:
+        """
+        :return: A new, fully loaded, player ID map, with the indexes used so far already built
+        """
+        pid_map = self._factory().prefetch()
+        for column in self._columns:
+            pid_map.index(column)
+        if self._searched:
+            pid_map.name_index()
+        return pid_map
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Loads a new player ID map, if a newer version has been published, and replaces the
+        current one with it. The checks are made by the :py:class:`mlbids.playeridmap.PlayerIDMap`
+        of the first player ID map loaded, so that each is conditional on the validators of the
+        previous one.
+
+        :param force: Whether to load a new player ID map even if no newer version is published
+        :return: Whether the player ID map was replaced
+        """
+        current = self.pid_map
+        if not force:
+            status = self._poller.check_for_update(since=current.last_update)
+            if not status.updated:
+                return False
+
+        with self._refresh_lock:
+            pid_map = self._load()
+            if not force and pid_map.last_update <= current.last_update:
+                return False
+            self._pid_map = pid_map
+            self._refreshed = time.time()
+        logger.info("Loaded the player ID map of %s", pid_map.last_update)
+        return True
+
+    def _refresh_forever(self) -> None:
+        """
+        Checks for a newer player ID map every *refresh_interval* seconds, until
+        :py:meth:`Service.stop` is called.
+        """
+        while not self._stopped.wait(self._refresh_interval):
+            try:
+                self.refresh()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to refresh the player ID map")
+
+    def start(self) -> "Service":
+        """
+        Loads the player ID map and starts refreshing it in a background thread.
+
+        :return: This :py:class:`Service`
+        """
+        self.pid_map  # pylint: disable=pointless-statement
+        if self._refresh_interval > 0 and self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._refresh_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops refreshing the player ID map.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def translate(self, request: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """
+        :param request: The ``from`` and ``to`` columns and the ``ids`` to translate
+        :return: The translated IDs
+        :raise BadRequest: The request is malformed, or names an unknown column
+        """
+        from_ = request.get("from", "MLBID")
+        to = request.get("to", "FanGraphsID")
+        ids = request.get("ids")
+        if not isinstance(from_, str):
+            raise BadRequest("'from' must be a column")
+        if not isinstance(ids, list) or not all(
+                i is None or isinstance(i, (str, int, float)) for i in ids
+        ):
+            raise BadRequest("'ids' must be a list of IDs")
+        columns = [to] if isinstance(to, str) else to
+        if not isinstance(columns, list) or not all(isinstance(c, str) for c in columns):
+            raise BadRequest("'to' must be a column or a list of columns")
+
+        pid_map = self.pid_map
+        if any(c not in pid_map.data.columns for c in columns):
+            raise BadRequest(f"Unknown columns: {[c for c in columns if c not in pid_map.data]}")
+        try:
+            pid_map.index(from_)
+        except ValueError as error:
+            raise BadRequest(str(error)) from error
+        if from_ not in self._columns:
+            # The set is replaced rather than mutated, so that it can be iterated by a refresh. A
+            # column lost to a concurrent replacement is added again by its next translation.
+            self._columns = self._columns | {from_}
+
+        results = {c: _json_values(pid_map.translate_many(ids, from_, c)) for c in columns}
+        return {"results": results[to] if isinstance(to, str) else results}
+
+    def search(self, request: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """
+        :param request: The ``names`` to search for, and optionally the ``site``, ``teams``,
+            ``birthdates`` and ``threshold`` of :py:meth:`mlbids.PIDMap.search_names`
+        :return: The best match of each name
+        :raise BadRequest: The request is malformed, or names an unknown site
+        """
+        names = request.get("names")
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            raise BadRequest("'names' must be a list of names")
+        site = request.get("site")
+        if site is not None and not isinstance(site, str):
+            raise BadRequest("'site' must be the name of a per-site view")
+        teams = _aligned_list(request, "teams", len(names))
+        birthdates = _aligned_list(request, "birthdates", len(names))
+        threshold = request.get("threshold", 0.5)
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not (
+                0 <= threshold <= 1
+        ):
+            raise BadRequest("'threshold' must be a number from 0 to 1")
+
+        self._searched = True
+        try:
+            df = self.pid_map.search_names(
+                names, site=site, teams=teams, birthdates=birthdates, threshold=threshold
+            )
+        except ValueError as error:
+            raise BadRequest(str(error)) from error
+        df = df.astype(object).where(df.notna(), None)
+        return {"results": df.to_dict(orient="records")}
+
+    def search_one(self, query: str, limit: int = 5) -> typing.Dict[str, typing.Any]:
+        """
+        :param query: The name to search for
+        :param limit: The maximum number of matches
+        :return: The best matches of *query*
+        :raise BadRequest: *limit* is not positive
+        """
+        if limit < 1:
+            raise BadRequest("'limit' must be positive")
+        self._searched = True
+        matches = self.pid_map.search_name_matches(query, limit=limit)
+        return {
+            "results": [
+                {
+                    "PlayerID": m.player_id, "PlayerName": m.player_name, "Team": m.team,
+                    "Birthdate": None if m.birthdate is None else f"{m.birthdate:%Y-%m-%d}",
+                    "Column": m.column, "Name": m.name, "Score": float(m.score),
+                }
+                for m in matches
+            ]
+        }
+
+    def health(self) -> typing.Dict[str, typing.Any]:
+        """
+        :return: The status and version of the loaded player ID map
+        """
+        pid_map = self.pid_map
+        return {
+            "status": "ok",
+            "rows": len(pid_map.data),
+            "last_update": pid_map.last_update.isoformat(),
+            "loaded": datetime.datetime.fromtimestamp(self._refreshed).isoformat(),
+        }
+
+
+class _Handler(server.BaseHTTPRequestHandler):
+    """
+    Answers the requests of the daemon with :py:attr:`_Handler.server.service`.
+    """
+    protocol_version = "HTTP/1.1"
+    server_version = "mlbids"
+
+    def address_string(self) -> str:
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: int, body: typing.Dict[str, typing.Any]) -> None:
+        """
+        :param status: The status code
+        :param body: The JSON body
+        """
+        content = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _answer(self, method: str) -> None:
+        """
+        :param method: The HTTP method of the request
+        """
+        start = time.perf_counter()
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        service: Service = self.server.service
+        items, error = 0, False
+
+        try:
+            if method == "POST":
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError as exc:
+                    raise BadRequest("The body is not valid JSON") from exc
+                if not isinstance(request, dict):
+                    raise BadRequest("The body must be a JSON object")
+            else:
+                request = {}
+
+            if url.path == "/translate":
+                if method == "GET":
+                    request = {
+                        "from": query.get("from", ["MLBID"])[0],
+                        "to": query.get("to", ["FanGraphsID"])[0], "ids": query.get("id", [])
+                    }
+                items = len(request.get("ids") or ())
+                status, body = 200, service.translate(request)
+            elif url.path == "/search" and method == "POST":
+                items = len(request.get("names") or ())
+                status, body = 200, service.search(request)
+            elif url.path == "/search":
+                if "q" not in query:
+                    raise BadRequest("'q' is required")
+                items = 1
+                try:
+                    limit = int(query.get("limit", ["5"])[0])
+                except ValueError as exc:
+                    raise BadRequest("'limit' must be an integer") from exc
+                status, body = 200, service.search_one(query["q"][0], limit=limit)
+            elif url.path == "/stats" and method == "GET":
+                status, body = 200, service.stats.snapshot()
+            elif url.path == "/health" and method == "GET":
+                status, body = 200, service.health()
+            else:
+                status, body = 404, {"error": f"No endpoint {method} {url.path}"}
+        except BadRequest as exc:
+            status, body, error = 400, {"error": str(exc)}, True
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Failed to answer %s %s", method, self.path)
+            status, body, error = 500, {"error": str(exc)}, True
+
+        self._send(status, body)
+        service.stats.record(url.path, time.perf_counter() - start, items=items, error=error)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self._answer("GET")
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self._answer("POST")
+
+
+class HTTPServer(server.ThreadingHTTPServer):
+    """
+    Serves the daemon on a TCP port.
+
+    :param address: The host and port on which to listen
+    :param service: The service which answers the requests
+    """
+    daemon_threads = True
+
+    def __init__(self, address: typing.Tuple[str, int], service: Service):
+        super().__init__(address, _Handler)
+        self.service = service
+
+
+class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Serves the daemon on a Unix domain socket.
+
+    :param path: The path of the socket, which is replaced if it exists
+    :param service: The service which answers the requests
+    """
+    daemon_threads = True
+
+    def __init__(self, path: str, service: Service):
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, _Handler)
+        self.service = service
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def make_server(
+        service: Service, host: str = "127.0.0.1", port: int = 8765,
+        unix_socket: typing.Optional[str] = None
+) -> socketserver.BaseServer:
+    """
+    :param service: The service which answers the requests
+    :param host: The address on which to listen
+    :param port: The port on which to listen. A free port is chosen if ``0``.
+    :param unix_socket: The path of a Unix domain socket on which to listen instead of a port
+    :return: The server, which is not serving yet
+    """
+    if unix_socket is not None:
+        return UnixHTTPServer(unix_socket, service)
+    return HTTPServer((host, port), service)
+
+
+def serve(
+        host: str = "127.0.0.1", port: int = 8765, unix_socket: typing.Optional[str] = None,
+        refresh_interval: float = 600, snapshot: typing.Union[bool, str] = False,
+        compact: bool = False
+) -> None:
+    """
+    Loads the player ID map and serves lookups until interrupted.
+
+    :param host: The address on which to listen
+    :param port: The port on which to listen
+    :param unix_socket: The path of a Unix domain socket on which to listen instead of a port
+    :param refresh_interval: The number of seconds between checks for a newer player ID map, or
+        ``0`` to never check
+    :param snapshot: The *snapshot* parameter of :py:class:`mlbids.PIDMap`
+    :param compact: The *compact* parameter of :py:class:`mlbids.PIDMap`
+    """
+    service = Service(
+        lambda: PIDMap(snapshot=snapshot, compact=compact), refresh_interval=refresh_interval
+    ).start()
+    httpd = make_server(service, host=host, port=port, unix_socket=unix_socket)
+    logger.info("Serving the player ID map on %s", unix_socket or f"http://{host}:{port}/")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.stop()
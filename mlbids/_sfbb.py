@@ -5,24 +5,124 @@ Utilities for scraping the `Smart Fantasy Baseball`_ website.
 """
 
 import collections
+import json
+import os
+import threading
+import time
 import typing
 
 import bs4
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import _instrument
+from . import _transport
 
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 }
 
+# (connect, read) timeouts in seconds
+TIMEOUT = (5, 30)
+
+RETRY = Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"})
+)
+
+_session: typing.Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    :return: The ``requests.Session`` shared by every request made by :py:mod:`mlbids`, which
+        keeps connections alive and retries failed requests with exponential backoff
+    """
+    global _session  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    :param url: The URL to request
+    :param kwargs: Keyword arguments for ``requests.Session.get``
+    :return: The response to a GET request for *url*, made with the shared session through the
+        transport of :py:func:`mlbids._transport.get_transport`
+    :raise requests.HTTPError: The response has an error status
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    with _instrument.stage("http.get", url=url) as stage:
+        res = _transport.get_transport().get(url, get_session(), **kwargs)
+        stage.set(status=res.status_code, length=res.headers.get("Content-Length"))
+    res.raise_for_status()
+    return res
+
+
+def body(res: requests.Response) -> typing.BinaryIO:
+    """
+    :param res: A response requested with ``stream=True``
+    :return: A file-like object which reads the decoded body of *res* as it arrives
+    """
+    res.raw.decode_content = True
+    return res.raw
+
+
+def charset(res: requests.Response) -> typing.Optional[str]:
+    """
+    :param res: A response
+    :return: The character encoding declared by the ``Content-Type`` header of *res*, if any
+    """
+    content_type = res.headers.get("Content-Type", "")
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    return None
+
+
+def download(url: str, path: str, chunk_size: int = 1 << 16) -> str:
+    """
+    Streams the body of the response to a GET request for *url* to disk, one chunk at a time. The
+    body is written to a temporary file next to *path*, which replaces *path* once complete.
+
+    :param url: The URL to request
+    :param path: Location to which the body should be written
+    :param chunk_size: Number of bytes to read from the response at a time
+    :return: The absolute file path to the written file
+    """
+    path = os.path.abspath(path)
+    temp_path = f"{path}.{os.getpid()}.part"
+    try:
+        with _instrument.stage("download", url=url) as stage:
+            size = 0
+            with get(url, stream=True) as res, open(temp_path, "wb") as file:
+                for chunk in res.iter_content(chunk_size=chunk_size):
+                    size += file.write(chunk)
+            stage.set(bytes=size)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
 
 def get_soup(url: str) -> bs4.BeautifulSoup:
     """
     :param url: The URL of the webpage to scrape
     :return: A `BeautifulSoup` object for the passed URL
     """
-    res = requests.get(url, headers=HEADERS)
-    res.raise_for_status()
+    res = get(url)
     soup = bs4.BeautifulSoup(res.text, features="lxml")
     return soup
 
@@ -31,10 +131,24 @@ class SFBBTools:
     """
     Web scraper for the `Tools`_ page of the Smart Fantasy Baseball website.
 
+    The redirect URLs scraped from the page are cached for *ttl* seconds. The cache is shared by
+    every instance in the process with the same :py:attr:`SFBBTools.base_address`, and is
+    optionally persisted to the JSON file at *cache_path*, so that a warm start does not need to
+    scrape the page at all.
+
     .. _Tools: https://www.smartfantasybaseball.com/tools/
+
+    :param ttl: Number of seconds for which the scraped URLs are considered fresh
+    :param cache_path: Location of the JSON file in which the scraped URLs are persisted
     """
-    def __init__(self):
+    _url_cache: typing.Dict[str, typing.Tuple["SFBBTools.URLs", float]] = {}
+    _url_cache_lock = threading.Lock()
+    _urls_css = "div.entry-content > div > table tr:nth-child(2) > td:first-child"
+
+    def __init__(self, ttl: float = 3600, cache_path: typing.Optional[str] = None):
         self._base_address = "https://www.smartfantasybaseball.com/tools/"
+        self._ttl = ttl
+        self._cache_path = cache_path
 
     class URLs(typing.NamedTuple):
         """
@@ -80,18 +194,50 @@ class SFBBTools:
     def _element(self) -> bs4.Tag:
         """
         :return: The HTML tag corresponding to the element containing the redirect URLs
+        :raise ValueError: The `Tools` page has no such element
+        """
+        return self._select_element(self._soup)
+
+    @classmethod
+    def _select_element(cls, soup: bs4.BeautifulSoup) -> bs4.Tag:
+        """
+        :param soup: The parsed HTML document of the `Tools` page
+        :return: The HTML tag corresponding to the element containing the redirect URLs
+        :raise ValueError: *soup* has no such element
         """
-        css = "div.entry-content > div > table tr:nth-child(2) > td:first-child"
-        element = self._soup.select_one(css)
+        element = soup.select_one(cls._urls_css)
+        if element is None:
+            raise ValueError(f"No element matching {cls._urls_css!r} on the Tools page")
         return element
 
     @property
-    def urls(self) -> URLs:
+    def ttl(self) -> float:
+        """
+        :return: Number of seconds for which the scraped URLs are considered fresh
         """
+        return self._ttl
+
+    @property
+    def cache_path(self) -> typing.Optional[str]:
+        """
+        :return: Location of the JSON file in which the scraped URLs are persisted
+        """
+        return self._cache_path
+
+    @classmethod
+    def _parse_urls(cls, soup: bs4.BeautifulSoup) -> URLs:
+        """
+        :param soup: The parsed HTML document of the `Tools` page
         :return: The redirect URLs for viewing/downloading the player ID map
+        :raise ValueError: *soup* does not contain the redirect URLs
         """
         data = collections.defaultdict()
-        hrefs = [e.attrs.get("href") for e in self._element.select("a")]
+        hrefs = [e.attrs.get("href") for e in cls._select_element(soup).select("a")]
+        if len(hrefs) != len(cls.URLs._fields):
+            raise ValueError(
+                f"Expected {len(cls.URLs._fields)} redirect URLs on the Tools page, "
+                f"found {len(hrefs)}"
+            )
 
         (
             data["excel_download"],
@@ -101,4 +247,116 @@ class SFBBTools:
             data["changelog_csv_download"]
         ) = hrefs
 
-        return self.URLs(**data)
+        return cls.URLs(**data)
+
+    def _scrape_urls(self) -> URLs:
+        """
+        :return: The redirect URLs scraped from the `Tools` page
+        """
+        return self._parse_urls(self._soup)
+
+    def _read_cache_file(self) -> typing.Optional[typing.Tuple[URLs, float]]:
+        """
+        :return: The URLs stored in :py:attr:`SFBBTools.cache_path` and the time they were scraped
+        """
+        if self.cache_path is None:
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+            if cache["base_address"] != self.base_address:
+                return None
+            return self.URLs(**cache["urls"]), float(cache["timestamp"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache_file(self, urls: URLs, timestamp: float) -> None:
+        """
+        :param urls: The scraped URLs
+        :param timestamp: The time at which the URLs were scraped
+        """
+        if self.cache_path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"base_address": self.base_address, "timestamp": timestamp, "urls": urls._asdict()},
+                file
+            )
+        os.replace(temp_path, self.cache_path)
+
+    @property
+    def urls(self) -> URLs:
+        """
+        :return: The redirect URLs for viewing/downloading the player ID map
+        """
+        with _instrument.stage("sfbb.urls") as stage, self._url_cache_lock:
+            urls = self._cached_urls()
+            stage.set(cached=urls is not None)
+            if urls is None:
+                urls = self._scrape_urls()
+                self._store_urls(urls)
+            return urls
+
+    @property
+    def cached_urls(self) -> typing.Optional[URLs]:
+        """
+        :return: The cached redirect URLs, or ``None`` if they have expired or were never scraped
+        """
+        with self._url_cache_lock:
+            return self._cached_urls()
+
+    def update_urls(self, html: str) -> URLs:
+        """
+        Parses and caches the redirect URLs from a separately downloaded copy of the `Tools` page.
+
+        :param html: The HTML document of the `Tools` page
+        :return: The redirect URLs for viewing/downloading the player ID map
+        :raise ValueError: *html* does not contain the redirect URLs
+        """
+        urls = self._parse_urls(bs4.BeautifulSoup(html, features="lxml"))
+        with self._url_cache_lock:
+            self._store_urls(urls)
+        return urls
+
+    def _cached_urls(self) -> typing.Optional[URLs]:
+        """
+        Must be called with :py:attr:`SFBBTools._url_cache_lock` held.
+
+        :return: The cached redirect URLs, or ``None`` if they have expired or were never scraped
+        """
+        now = time.time()
+
+        cached = self._url_cache.get(self.base_address)
+        if cached is not None and now - cached[1] < self.ttl:
+            return cached[0]
+
+        cached = self._read_cache_file()
+        if cached is not None and now - cached[1] < self.ttl:
+            self._url_cache[self.base_address] = cached
+            return cached[0]
+
+        return None
+
+    def _store_urls(self, urls: URLs) -> None:
+        """
+        Must be called with :py:attr:`SFBBTools._url_cache_lock` held.
+
+        :param urls: The scraped redirect URLs
+        """
+        now = time.time()
+        self._url_cache[self.base_address] = (urls, now)
+        self._write_cache_file(urls, now)
+
+    def invalidate(self) -> None:
+        """
+        Discards the cached redirect URLs, in memory and on disk, so that the next access of
+        :py:attr:`SFBBTools.urls` scrapes the `Tools` page again.
+        """
+        with self._url_cache_lock:
+            self._url_cache.pop(self.base_address, None)
+            if self.cache_path is not None and os.path.exists(self.cache_path):
+                os.remove(self.cache_path)
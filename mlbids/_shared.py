@@ -0,0 +1,350 @@
+"""
+The ID columns of the player ID map, published to shared memory for multi-process workers.
+
+One process loads the player ID map and calls :py:meth:`SharedIDMap.publish`, which packs every ID
+column, and a sorted index over each of them, into a single ``multiprocessing.shared_memory``
+block. Every other process calls :py:meth:`SharedIDMap.attach` with the name of the block, which
+maps the arrays read-only without copying them, so that attaching is near-instant and memory does
+not grow with the number of workers.
+
+The block starts with the length of a JSON header, as a little-endian unsigned 64-bit integer,
+followed by the header itself, which gives the dtype, shape and offset of each array. The arrays
+follow the header, each aligned to 64 bytes.
+"""
+
+import json
+import os
+import struct
+import sys
+import typing
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from . import _index
+from .playeridmap import PlayerIDMap
+
+_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 64
+_VERSION = 1
+
+# Names of the blocks published by this process and not yet unlinked
+_published: typing.Set[str] = set()
+
+
+def _owns_tracker() -> bool:
+    """
+    :return: Whether the ``multiprocessing`` resource tracker of this process was, or will be,
+        started by this process, rather than inherited from the process which started it. Forked,
+        spawned and forkserver children all share the tracker of their parent.
+    """
+    # pylint: disable=protected-access
+    tracker = resource_tracker._resource_tracker
+    if tracker._fd is None:
+        return True
+    # The tracker is a child process of the process which started it
+    if tracker._pid is None:
+        return False
+    try:
+        os.waitpid(tracker._pid, os.WNOHANG)
+    except ChildProcessError:
+        return False
+    return True
+
+
+def _align(offset: int) -> int:
+    """
+    :param offset: A byte offset
+    :return: The first offset at or after *offset* which is aligned for any array
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pack_column(values: pd.Series, integer: bool) -> typing.Dict[str, np.ndarray]:
+    """
+    :param values: The values of an ID column
+    :param integer: Whether the ID column holds integer IDs
+    :return: The normalized IDs, with ``0`` or ``b""`` for missing IDs, the IDs sorted, and the
+        position of the row with each sorted ID
+    """
+    keys = _index.normalize(values, integer)
+    present = keys.notna().to_numpy()
+    if integer:
+        ids = keys.fillna(0).to_numpy(dtype=np.int64)
+    else:
+        encoded = [k.encode("utf-8") if isinstance(k, str) else b"" for k in keys.tolist()]
+        ids = np.array(encoded, dtype="S")
+
+    rows = np.flatnonzero(present)
+    order = np.argsort(ids[rows], kind="stable")
+    return {"ids": ids, "keys": ids[rows][order], "rows": rows[order].astype(np.int64)}
+
+
+class SharedIDMap:
+    """
+    The ID columns of the player ID map, and a sorted index over each of them, held in one
+    ``multiprocessing.shared_memory`` block. Use :py:meth:`SharedIDMap.publish` to create the
+    block and :py:meth:`SharedIDMap.attach` to map an existing one.
+
+    The arrays are read-only views of the block. Release every array taken from
+    :py:meth:`SharedIDMap.column` before calling :py:meth:`SharedIDMap.close`.
+
+    :param shm: The shared memory block
+    :param owner: Whether this process created the block, and so should unlink it
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+
+        (length,) = _LENGTH.unpack_from(shm.buf, 0)
+        header = json.loads(bytes(shm.buf[_LENGTH.size:_LENGTH.size + length]).decode("utf-8"))
+        start = _align(_LENGTH.size + length)
+        if header.get("version") != _VERSION:
+            raise ValueError(f"{shm.name!r} is not a shared player ID map")
+
+        self._rows = header["rows"]
+        self._integer: typing.Dict[str, bool] = header["columns"]
+        self._arrays: typing.Dict[str, np.ndarray] = {}
+        for name, spec in header["arrays"].items():
+            array = np.ndarray(
+                tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=shm.buf,
+                offset=start + spec["offset"]
+            )
+            array.flags.writeable = False
+            self._arrays[name] = array
+
+    @classmethod
+    def publish(
+            cls, data: pd.DataFrame, name: typing.Optional[str] = None
+    ) -> "SharedIDMap":
+        """
+        Packs the ID columns of the player ID map into a new shared memory block.
+
+        :param data: The player ID map
+        :param name: The name of the block. A unique name is chosen if ``None``.
+        :return: The published ID map, which owns the block
+        """
+        columns = {c: True for c in PlayerIDMap._integer_columns if c in data.columns}
+        columns.update({c: False for c in PlayerIDMap._string_id_columns if c in data.columns})
+
+        arrays = {}
+        for column, integer in columns.items():
+            for kind, array in _pack_column(data.loc[:, column], integer).items():
+                arrays[f"{column}.{kind}"] = array
+
+        specs, size = {}, 0
+        for array_name, array in arrays.items():
+            specs[array_name] = {
+                "dtype": array.dtype.str, "shape": list(array.shape), "offset": size
+            }
+            size = _align(size + array.nbytes)
+        header = json.dumps(
+            {"version": _VERSION, "rows": len(data), "columns": columns, "arrays": specs}
+        ).encode("utf-8")
+        start = _align(_LENGTH.size + len(header))
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=start + size)
+        _LENGTH.pack_into(shm.buf, 0, len(header))
+        shm.buf[_LENGTH.size:_LENGTH.size + len(header)] = header
+        for array_name, array in arrays.items():
+            spec = specs[array_name]
+            target = np.ndarray(
+                array.shape, dtype=array.dtype, buffer=shm.buf, offset=start + spec["offset"]
+            )
+            target[...] = array
+            del target
+        _published.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedIDMap":
+        """
+        Maps a block published by another process, without copying it. The block is not tracked
+        by the ``multiprocessing`` resource tracker of this process, so that it outlives this
+        process. A tracker shared with the publisher, as by a child of the publisher, is left as
+        it is, since it tracks the block on behalf of the publisher.
+
+        :param name: The name of the block
+        :return: The published ID map
+        :raise FileNotFoundError: There is no block named *name*
+        """
+        if sys.version_info >= (3, 13):
+            # pylint: disable-next=unexpected-keyword-arg
+            return cls(shared_memory.SharedMemory(name=name, track=False), owner=False)
+
+        owns_tracker = _owns_tracker()
+        shm = shared_memory.SharedMemory(name=name)
+        if owns_tracker and shm.name not in _published:
+            # pylint: disable-next=protected-access
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    def __enter__(self) -> "SharedIDMap":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def name(self) -> str:
+        """
+        :return: The name of the shared memory block, to pass to :py:meth:`SharedIDMap.attach`
+        """
+        return self._shm.name
+
+    @property
+    def owner(self) -> bool:
+        """
+        :return: Whether this process published the block
+        """
+        return self._owner
+
+    @property
+    def columns(self) -> typing.List[str]:
+        """
+        :return: The ID columns held in the block
+        """
+        return list(self._integer)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: The size of the shared memory block, in bytes
+        """
+        return self._shm.size
+
+    def _integer_column(self, column: str) -> bool:
+        """
+        :param column: An ID column
+        :return: Whether *column* holds integer IDs
+        :raise ValueError: *column* is not an ID column held in the block
+        """
+        integer = self._integer.get(column)
+        if integer is None:
+            raise ValueError(f"{column!r} is not an ID column")
+        return integer
+
+    def column(self, column: str) -> np.ndarray:
+        """
+        :param column: An ID column
+        :return: The normalized IDs of *column*, as a read-only view of the block. Missing IDs are
+            ``0`` in integer ID columns and ``b""`` in string ID columns, whose IDs are UTF-8
+            encoded.
+        :raise ValueError: *column* is not an ID column held in the block
+        """
+        self._integer_column(column)
+        return self._arrays[f"{column}.ids"]
+
+    def _keys(self, column: str, values: pd.Series) -> np.ndarray:
+        """
+        :param column: An ID column
+        :param values: IDs in *column*
+        :return: The normalized *values*, in the dtype of the sorted IDs of *column*
+        """
+        integer = self._integer_column(column)
+        keys = _index.normalize(values, integer, vectorized=integer)
+        if integer:
+            return keys.fillna(0).to_numpy(dtype=np.int64)
+        return np.array(
+            [k.encode("utf-8") if isinstance(k, str) else b"" for k in keys.tolist()], dtype="S"
+        )
+
+    def get_indexer(
+            self, values: typing.Union[pd.Series, np.ndarray, typing.Sequence], column: str
+    ) -> np.ndarray:
+        """
+        :param values: IDs in *column*
+        :param column: The ID column of *values*
+        :return: The position of the first row with each ID, or ``-1`` where there is no such row
+        :raise ValueError: *column* is not an ID column held in the block
+        """
+        keys = self._keys(column, pd.Series(values, copy=False))
+        sorted_keys = self._arrays[f"{column}.keys"]
+        rows = self._arrays[f"{column}.rows"]
+
+        found = np.searchsorted(sorted_keys, keys, side="left")
+        hit = found < len(sorted_keys)
+        hit[hit] = sorted_keys[found[hit]] == keys[hit]
+
+        indexer = np.full(len(keys), -1, dtype=np.intp)
+        indexer[hit] = rows.take(found[hit])
+        return indexer
+
+    def translate(
+            self, value: typing.Any, from_: str = "MLBID", to: str = "FanGraphsID",
+            default: typing.Any = None
+    ) -> typing.Any:
+        """
+        Translates a player's ID on one site to their ID on another.
+
+        :param value: The player's ID in the *from_* column
+        :param from_: The ID column of *value*
+        :param to: The ID column to translate *value* to
+        :param default: Returned if no player has the ID *value*, or if the player has no *to* ID
+        :return: The *to* ID of the first player with the *from_* ID *value*
+        :raise ValueError: *from_* or *to* is not an ID column held in the block
+        """
+        result = self.translate_many([value], from_=from_, to=to, missing=default)
+        return result[0]
+
+    def translate_many(
+            self, values: typing.Union[pd.Series, np.ndarray, typing.Sequence],
+            from_: str = "MLBID", to: str = "FanGraphsID", missing: typing.Any = None
+    ) -> typing.Union[pd.Series, np.ndarray]:
+        """
+        Translates many players' IDs on one site to their IDs on another in one vectorized pass,
+        as by :py:meth:`mlbids.PIDMap.translate_many`.
+
+        :param values: The players' IDs in the *from_* column
+        :param from_: The ID column of *values*
+        :param to: The ID column to translate *values* to
+        :param missing: Sentinel for the IDs which cannot be translated
+        :return: The *to* IDs aligned with *values*. A ``Series`` with the index of *values* if
+            *values* is a ``Series``, and an array otherwise.
+        :raise ValueError: *from_* or *to* is not an ID column held in the block
+        """
+        integer = self._integer_column(to)
+        positions = self.get_indexer(values, from_)
+        target = self.column(to)
+
+        found = positions >= 0
+        taken = target.take(positions[found])
+        mask = ~found
+        if integer:
+            result = np.empty(len(positions), dtype=np.int64)
+            result[found] = taken
+            mask[found] = taken == 0
+        else:
+            result = np.empty(len(positions), dtype=object)
+            result[found] = [t.decode("utf-8") for t in taken.tolist()]
+            mask[found] = taken == b""
+
+        if mask.any():
+            result = result.astype(np.result_type(result.dtype, np.asarray(missing).dtype))
+            result[mask] = missing
+
+        if isinstance(values, pd.Series):
+            return pd.Series(result, index=values.index, name=to, dtype=result.dtype)
+        return result
+
+    def close(self) -> None:
+        """
+        Unmaps the block from this process. The arrays of the block must no longer be in use.
+        """
+        self._arrays.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Frees the block once every process has closed it. Only the publishing process should call
+        this.
+        """
+        self._shm.unlink()
+        _published.discard(self._shm.name)
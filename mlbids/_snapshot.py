@@ -0,0 +1,164 @@
+"""
+On-disk snapshots of the formatted player ID map and CHANGELOG.
+
+A snapshot directory contains the pickled ``DataFrame`` objects returned by
+:py:meth:`mlbids.playeridmap.PlayerIDMap.read_data` and
+:py:meth:`mlbids.playeridmap.PlayerIDMap.read_changelog_data`, along with a JSON version stamp
+recording the latest CHANGELOG date at the time the snapshot was taken.
+"""
+
+import datetime
+import json
+import os
+import pickle
+import time
+import typing
+
+import pandas as pd
+
+
+FORMAT_VERSION = 1
+
+
+def default_directory() -> str:
+    """
+    :return: The directory in which snapshots are stored by default. Set by the
+        ``MLBIDS_CACHE_DIR`` environment variable, and ``~/.cache/mlbids`` otherwise.
+    """
+    return os.environ.get(
+        "MLBIDS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "mlbids")
+    )
+
+
+class Snapshot(typing.NamedTuple):
+    """
+    Contains the contents of a snapshot
+
+    .. py:attribute:: data
+        The formatted player ID map
+
+    .. py:attribute:: changelog
+        The formatted player ID map CHANGELOG
+
+    .. py:attribute:: version
+        The latest CHANGELOG date at the time the snapshot was taken
+    """
+    data: pd.DataFrame
+    changelog: pd.DataFrame
+    version: datetime.datetime
+
+
+class SnapshotStore:
+    """
+    Reads and writes snapshots of the player ID map.
+
+    :param directory: Directory in which the snapshot is stored
+    """
+    def __init__(self, directory: typing.Optional[str] = None):
+        self._directory = default_directory() if directory is None else directory
+
+    @property
+    def directory(self) -> str:
+        """
+        :return: Directory in which the snapshot is stored
+        """
+        return self._directory
+
+    @property
+    def _stamp_path(self) -> str:
+        return os.path.join(self.directory, "version.json")
+
+    @property
+    def _data_path(self) -> str:
+        return os.path.join(self.directory, "playeridmap.pkl")
+
+    @property
+    def _changelog_path(self) -> str:
+        return os.path.join(self.directory, "changelog.pkl")
+
+    @staticmethod
+    def latest(changelog: pd.DataFrame) -> datetime.datetime:
+        """
+        :param changelog: The formatted player ID map CHANGELOG
+        :return: The date of the most recent CHANGELOG entry
+        """
+        return pd.Timestamp(changelog.loc[:, "Date"].max()).to_pydatetime()
+
+    @property
+    def version(self) -> typing.Optional[datetime.datetime]:
+        """
+        :return: The version stamp of the stored snapshot, or ``None`` if no usable snapshot exists
+        """
+        try:
+            with open(self._stamp_path, "r", encoding="utf-8") as file:
+                stamp = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if stamp.get("format") != FORMAT_VERSION:
+            return None
+        return datetime.datetime.fromisoformat(stamp["version"])
+
+    def is_stale(self, changelog: pd.DataFrame) -> bool:
+        """
+        :param changelog: The current player ID map CHANGELOG
+        :return: Whether the stored snapshot predates the latest entry of *changelog*
+        """
+        version = self.version
+        return version is None or version < self.latest(changelog)
+
+    def load(self) -> typing.Optional[Snapshot]:
+        """
+        :return: The stored snapshot, or ``None`` if no usable snapshot exists. A snapshot which
+            cannot be unpickled, such as one written by another version of ``pandas``, is not
+            usable.
+        """
+        version = self.version
+        if version is None:
+            return None
+        try:
+            data = pd.read_pickle(self._data_path)
+            changelog = pd.read_pickle(self._changelog_path)
+        except (
+                OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                IndexError, KeyError, TypeError
+        ):
+            return None
+        if not isinstance(data, pd.DataFrame) or not isinstance(changelog, pd.DataFrame):
+            return None
+        return Snapshot(data=data, changelog=changelog, version=version)
+
+    def save(self, data: pd.DataFrame, changelog: pd.DataFrame) -> Snapshot:
+        """
+        Writes a snapshot, replacing the stored one. The version stamp is written last, so that an
+        interrupted write leaves no snapshot rather than an inconsistent one.
+
+        :param data: The formatted player ID map
+        :param changelog: The formatted player ID map CHANGELOG
+        :return: The written snapshot
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.clear()
+
+        version = self.latest(changelog)
+        for frame, path in ((data, self._data_path), (changelog, self._changelog_path)):
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            frame.to_pickle(temp_path)
+            os.replace(temp_path, path)
+
+        temp_path = f"{self._stamp_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"format": FORMAT_VERSION, "version": version.isoformat(), "saved": time.time()},
+                file
+            )
+        os.replace(temp_path, self._stamp_path)
+
+        return Snapshot(data=data, changelog=changelog, version=version)
+
+    def clear(self) -> None:
+        """
+        Removes the stored snapshot.
+        """
+        for path in (self._stamp_path, self._data_path, self._changelog_path):
+            if os.path.exists(path):
+                os.remove(path)
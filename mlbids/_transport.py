@@ -0,0 +1,284 @@
+"""
+Pluggable transports for the HTTP requests of :py:mod:`mlbids`.
+
+Every request made through :py:func:`mlbids._sfbb.get` goes through the transport set by
+:py:func:`set_transport`. By default, requests go to the origin (the Smart Fantasy Baseball website
+and the pages it links to). A :py:class:`MirrorTransport` sends them to a mirror or CDN instead, and
+a :py:class:`DirectoryTransport` serves them from files on disk. :py:class:`StandInServer` serves
+such a directory over HTTP, as a local stand-in for the origin.
+
+Mirrors and directories hold each page under the key :py:func:`key` of its origin URL. The
+``MLBIDS_MIRROR`` environment variable, if set to a mirror URL or a directory path, selects the
+default transport.
+"""
+
+from http import server
+import os
+import threading
+import typing
+import urllib.parse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+import urllib3
+
+
+def key(url: str) -> str:
+    """
+    :param url: The origin URL of a page
+    :return: The name of the page in a mirror or directory
+    """
+    return urllib.parse.quote(url, safe="")
+
+
+class Transport:
+    """
+    Sends the requests for origin URLs to the origin.
+    """
+    def get(self, url: str, session: requests.Session, **kwargs) -> requests.Response:
+        """
+        :param url: The origin URL to request
+        :param session: The session with which HTTP requests are made
+        :param kwargs: Keyword arguments for ``requests.Session.get``
+        :return: The response to a GET request for *url*
+        """
+        return session.get(url, **kwargs)
+
+
+class MirrorTransport(Transport):
+    """
+    Sends the requests for origin URLs to a mirror, which serves each page at *base_url* followed
+    by the :py:func:`key` of its origin URL.
+
+    :param base_url: The URL of the mirror
+    :param fallback: Whether to request the origin if the mirror does not have the page or cannot
+        be reached
+    """
+    def __init__(self, base_url: str, fallback: bool = False):
+        self._base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+        self._fallback = fallback
+
+    @property
+    def base_url(self) -> str:
+        """
+        :return: The URL of the mirror
+        """
+        return self._base_url
+
+    @property
+    def fallback(self) -> bool:
+        """
+        :return: Whether the origin is requested if the mirror does not have the page
+        """
+        return self._fallback
+
+    def url(self, url: str) -> str:
+        """
+        :param url: An origin URL
+        :return: The URL of the page in the mirror
+        """
+        return f"{self.base_url}{key(url)}"
+
+    def get(self, url: str, session: requests.Session, **kwargs) -> requests.Response:
+        try:
+            res = session.get(self.url(url), **kwargs)
+        except requests.ConnectionError:
+            if not self.fallback:
+                raise
+            return session.get(url, **kwargs)
+        if self.fallback and res.status_code == 404:
+            res.close()
+            return session.get(url, **kwargs)
+        return res
+
+
+class DirectoryTransport(Transport):
+    """
+    Serves the requests for origin URLs from files, each named by the :py:func:`key` of its
+    origin URL. Missing files are served as ``404 Not Found`` responses.
+
+    :param directory: The directory holding the files
+    """
+    def __init__(self, directory: str):
+        self._directory = os.path.abspath(directory)
+
+    @property
+    def directory(self) -> str:
+        """
+        :return: The directory holding the files
+        """
+        return self._directory
+
+    def path(self, url: str) -> str:
+        """
+        :param url: An origin URL
+        :return: The path to the file which holds the page
+        """
+        return os.path.join(self.directory, key(url))
+
+    def get(self, url: str, session: requests.Session, **kwargs) -> requests.Response:
+        res = requests.Response()
+        res.url = url
+        res.headers = CaseInsensitiveDict()
+        try:
+            file = open(self.path(url), "rb")  # pylint: disable=consider-using-with
+        except FileNotFoundError:
+            res.status_code, res.reason = 404, "Not Found"
+            res.raw = urllib3.HTTPResponse(body=b"", status=404, preload_content=False)
+            return res
+
+        size = os.fstat(file.fileno()).st_size
+        res.status_code, res.reason = 200, "OK"
+        res.headers["Content-Length"] = str(size)
+        res.raw = urllib3.HTTPResponse(
+            body=file, status=200, headers={"Content-Length": str(size)}, preload_content=False,
+            decode_content=False
+        )
+        if not kwargs.get("stream"):
+            res.content  # pylint: disable=pointless-statement
+            file.close()
+        return res
+
+
+class _Handler(server.BaseHTTPRequestHandler):
+    """
+    Serves the files of :py:attr:`StandInServer.directory`, by :py:func:`key`.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def _file(self) -> typing.Optional[str]:
+        """
+        :return: The path to the requested file, or ``None`` if it does not exist
+        """
+        name = urllib.parse.urlsplit(self.path).path.lstrip("/")
+        if not name or "/" in name or name in (".", ".."):
+            return None
+        path = os.path.join(self.server.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def _send_headers(self) -> typing.Optional[str]:
+        """
+        :return: The path to the requested file, or ``None`` if a ``404`` was sent
+        """
+        path = self._file()
+        if path is None:
+            self.send_error(404)
+            return None
+        self.send_response(200)
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.end_headers()
+        return path
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        path = self._send_headers()
+        if path is not None:
+            with open(path, "rb") as file:
+                self.copyfile(file, self.wfile)
+
+    def copyfile(self, source: typing.BinaryIO, destination: typing.BinaryIO) -> None:
+        """
+        :param source: The requested file
+        :param destination: The response stream
+        """
+        while True:
+            chunk = source.read(1 << 16)
+            if not chunk:
+                break
+            destination.write(chunk)
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        self._send_headers()
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+
+class StandInServer:
+    """
+    Local HTTP server which stands in for the origin, serving the files of a directory laid out
+    for :py:class:`DirectoryTransport`. Point a :py:class:`MirrorTransport` at
+    :py:attr:`StandInServer.url` to use it.
+
+    :param directory: The directory holding the files
+    :param host: The address on which to listen
+    :param port: The port on which to listen. A free port is chosen if ``0``.
+    """
+    def __init__(self, directory: str, host: str = "127.0.0.1", port: int = 0):
+        self._server = server.ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.directory = os.path.abspath(directory)
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """
+        :return: The base URL of the server
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StandInServer":
+        """
+        Starts serving in a background thread.
+
+        :return: This :py:class:`StandInServer`
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Stops serving and closes the listening socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+def from_location(location: str, fallback: bool = False) -> Transport:
+    """
+    :param location: The URL of a mirror, or the path to a directory
+    :param fallback: Whether a mirror falls back to the origin, as by :py:class:`MirrorTransport`
+    :return: The transport for *location*
+    """
+    if urllib.parse.urlsplit(location).scheme in ("http", "https"):
+        return MirrorTransport(location, fallback=fallback)
+    return DirectoryTransport(location)
+
+
+_transport: typing.Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """
+    :return: The transport through which every request is made. Unless set by
+        :py:func:`set_transport`, it is chosen by the ``MLBIDS_MIRROR`` environment variable, and
+        requests go to the origin if that is unset.
+    """
+    global _transport  # pylint: disable=global-statement
+    with _transport_lock:
+        if _transport is None:
+            location = os.environ.get("MLBIDS_MIRROR")
+            _transport = Transport() if not location else from_location(location, fallback=True)
+        return _transport
+
+
+def set_transport(transport: typing.Optional[Transport]) -> None:
+    """
+    :param transport: The transport through which every request is made, or ``None`` to choose
+        it again as by :py:func:`get_transport`
+    """
+    global _transport  # pylint: disable=global-statement
+    with _transport_lock:
+        _transport = transport
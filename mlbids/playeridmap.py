@@ -2,31 +2,89 @@
 
 """
 
+import csv
 import datetime
+import io
 import json
-import math
 import os
 import typing
 
-import numpy as np
 import pandas as pd
-import requests
 
-from ._sfbb import HEADERS
+from . import _columnar
+from . import _htmltable
+from . import _instrument
+from . import _sfbb
 from ._sfbb import SFBBTools
 
+try:
+    import python_calamine  # pylint: disable=unused-import
+except ImportError:
+    python_calamine = None
+
+try:
+    import openpyxl  # pylint: disable=unused-import
+except ImportError:
+    openpyxl = None
+
 
 class PlayerIDMap:
     """
 
     """
     _integer_columns = [
-        "BaseballHQID", "BaseballProspectusID", "CBSID", "ESPNID", "FanduelID",
-        "MLBID", "NFBCID", "OttoneuID", "RotowireID", "YahooID"
+        "BaseballHQID", "BaseballProspectusID", "CBSID", "ESPNID", "FanDuelID",
+        "MLBID", "NFBCID", "OttoneuID", "RotoWireID", "YahooID"
+    ]
+    _string_id_columns = [
+        "PlayerID", "BaseballReferenceID", "ClayDavenportID", "FanGraphsID", "FantraxID",
+        "RetrosheetID"
     ]
 
-    def __init__(self):
-        self._sfbb = SFBBTools()
+    def __init__(self, sfbb: typing.Optional[SFBBTools] = None):
+        self._sfbb = SFBBTools() if sfbb is None else sfbb
+        self._last_check: typing.Optional[PlayerIDMap.UpdateStatus] = None
+
+    class UpdateStatus(typing.NamedTuple):
+        """
+        Contains the result of :py:meth:`PlayerIDMap.check_for_update`
+
+        .. py:attribute:: updated
+            Whether the player ID map was updated after the *since* date, or since the previous
+            check if no date was given
+
+        .. py:attribute:: last_update
+            The date of the latest CHANGELOG entry, or ``None`` if the CHANGELOG is empty
+
+        .. py:attribute:: not_modified
+            Whether the server reported the CHANGELOG unchanged since the previous check, so that
+            nothing was downloaded
+
+        .. py:attribute:: etag
+            The ``ETag`` of the CHANGELOG, sent as ``If-None-Match`` by the next check
+
+        .. py:attribute:: last_modified
+            The ``Last-Modified`` date of the CHANGELOG, sent as ``If-Modified-Since`` by the next
+            check
+        """
+        updated: bool
+        last_update: typing.Optional[datetime.datetime]
+        not_modified: bool
+        etag: typing.Optional[str]
+        last_modified: typing.Optional[str]
+
+    class ExcelData(typing.NamedTuple):
+        """
+        Contains the result of :py:meth:`PlayerIDMap.read_excel`
+
+        .. py:attribute:: data
+            The formatted player ID map
+
+        .. py:attribute:: changelog
+            The formatted player ID map CHANGELOG
+        """
+        data: pd.DataFrame
+        changelog: pd.DataFrame
 
     class _DFReformat(typing.NamedTuple):
         """
@@ -78,6 +136,13 @@ class PlayerIDMap:
         )
         return reformat
 
+    @property
+    def sfbb(self) -> SFBBTools:
+        """
+        :return: The scraper for the redirect URLs of the player ID map
+        """
+        return self._sfbb
+
     @property
     def excel_download(self) -> str:
         """
@@ -115,17 +180,12 @@ class PlayerIDMap:
 
     def save_excel(self, path: str) -> str:
         """
-        Writes hte player ID map to an Excel workbook.
+        Writes the player ID map and CHANGELOG to an Excel workbook.
 
         :param path: Location to which the Excel workbook should be downloaded
-        :return: The aboluste file path to the downlaoded Excel workbook
+        :return: The absolute file path to the downloaded Excel workbook
         """
-        res = requests.get(self.excel_download, headers=HEADERS)
-
-        with open(path, "wb") as file:
-            file.write(res.content)
-
-        return os.path.abspath(path)
+        return _sfbb.download(self.excel_download, path)
 
     def save_csv(self, path: str) -> str:
         """
@@ -134,12 +194,7 @@ class PlayerIDMap:
         :param path: Location to which the CSV file should be downloaded
         :return: The absolute file path to the downloaded CSV file
         """
-        res = requests.get(self.csv_download, headers=HEADERS)
-
-        with open(path, "wb") as file:
-            file.write(res.content)
-
-        return os.path.abspath(path)
+        return _sfbb.download(self.csv_download, path)
 
     def save_changelog_csv(self, path: str) -> str:
         """
@@ -148,96 +203,176 @@ class PlayerIDMap:
         :param path: Location to which the CSV file should be downloaded
         :return: The absolute file path to the downloaded CSV file
         """
-        res = requests.get(self.changelog_csv_download, headers=HEADERS)
+        return _sfbb.download(self.changelog_csv_download, path)
 
-        with open(path, "wb") as file:
-            file.write(res.content)
+    def save_columnar(self, path: str, df: typing.Optional[pd.DataFrame] = None) -> str:
+        """
+        Writes the formatted player ID map to a memory-mappable columnar file, see
+        :py:mod:`mlbids._columnar`, which :py:meth:`PlayerIDMap.load_columnar` reads back without
+        re-parsing or re-formatting it.
+
+        :param path: Location of the directory to which the columnar file should be written
+        :param df: The formatted player ID map. Read by :py:meth:`PlayerIDMap.read_data` if
+            ``None``.
+        :return: The absolute path to the written directory
+        :raise ValueError: A column of *df* is of a type which cannot be stored
+        """
+        df = self.read_data() if df is None else df
+        with _instrument.stage("save_columnar", rows=len(df)):
+            return _columnar.save(df, path)
 
-        return os.path.abspath(path)
+    @staticmethod
+    def load_columnar(
+            path: str, columns: typing.Optional[typing.Sequence[str]] = None, mmap: bool = True
+    ) -> pd.DataFrame:
+        """
+        Reads a player ID map written by :py:meth:`PlayerIDMap.save_columnar`, with the same
+        column types as :py:meth:`PlayerIDMap.read_data`.
+
+        :param path: Location of the directory of the columnar file
+        :param columns: The columns to read. Every column is read if ``None``.
+        :param mmap: Whether to memory-map the numeric, Boolean and datetime columns read-only, so
+            that only the pages which are touched are read from disk
+        :return: The formatted player ID map
+        :raise FileNotFoundError: *path* is not a columnar file
+        :raise ValueError: *path* was written in another format version
+        :raise KeyError: A column of *columns* is not in the columnar file
+        """
+        with _instrument.stage("load_columnar", mmap=mmap) as stage:
+            df = _columnar.load(path, columns=columns, mmap=mmap)
+            stage.set(rows=len(df), columns=len(df.columns))
+        return df
 
     @staticmethod
-    def __reformat_birthdate(birthdate: str) -> datetime.datetime:
+    def _strip(column: pd.Series) -> pd.Series:
         """
-        Converts the *birthdate* string representation to a ``datetime.datetime`` object.
-        Used for formatting the **Birthdate** column of the ``DataFrame`` returned by
-        :py:meth:`PlayerIDMap.read_data` and :py:meth:`PlayerIDMap.read_csv`.
+        Strips surrounding whitespace from the string values of *column*.
 
-        :param birthdate: The string representation of the date
-        :return: The ``datetime.datetime`` representation of the date
-        :raise TypeError:
+        :param column: A ``DataFrame`` column
+        :return: The column with its string values stripped
         """
-        if not isinstance(birthdate, str):
-            if isinstance(birthdate, float) and math.isnan(birthdate):
-                return np.nan
-            raise TypeError
-        try:
-            return datetime.datetime.strptime(birthdate, "%m/%d/%Y")
-        except ValueError:
-            return datetime.datetime.strptime(birthdate, "%m/%d/%y")
+        inferred = pd.api.types.infer_dtype(column, skipna=True)
+        if inferred not in ("string", "mixed", "mixed-integer"):
+            return column
+        stripped = column.str.strip()
+        return stripped.where(stripped.notna(), column)
+
+    @staticmethod
+    def _reformat_dates(dates: pd.Series, formats: typing.Sequence[str]) -> pd.Series:
+        """
+        Converts the string representations of *dates* to ``datetime.datetime`` objects. Each
+        format of *formats* is tried in turn on the dates that the previous formats did not match.
+        Dates which are already ``datetime.date`` objects, as read from an Excel workbook, are
+        kept as they are.
+
+        :param dates: The string representations of the dates
+        :param formats: The ``strptime`` formats of the dates
+        :return: The ``datetime.datetime`` representations of the dates
+        :raise ValueError: A date matched none of *formats*
+        """
+        if pd.api.types.is_datetime64_any_dtype(dates.dtype):
+            return dates
+        native = None
+        if dates.dtype == object:
+            native = dates.map(lambda d: isinstance(d, datetime.date)).to_numpy(dtype=bool)
+            if native.any():
+                strings = dates.mask(native)
+            else:
+                native, strings = None, dates
+        else:
+            strings = dates
+
+        parsed = pd.to_datetime(strings, format=formats[0], errors="coerce")
+        for fmt in formats[1:]:
+            retry = parsed.isna() & strings.notna()
+            if not retry.any():
+                break
+            parsed[retry] = pd.to_datetime(strings[retry], format=fmt, errors="coerce")
+        if native is not None:
+            parsed[native] = pd.to_datetime(dates[native].tolist())
+
+        unmatched = parsed.isna() & dates.notna()
+        if unmatched.any():
+            raise ValueError(f"Unrecognized dates: {dates[unmatched].tolist()}")
+        return parsed
 
     @staticmethod
-    def __reformat_all_positions(all_positions: str) -> list[str]:
+    def _reformat_all_positions(all_positions: pd.Series) -> pd.Series:
         """
+        Splits the *all_positions* string representations into lists of positions.
+        Used for formatting the **AllPositions** column of the ``DataFrame`` returned by
+        :py:meth:`PlayerIDMap.read_data` and :py:meth:`PlayerIDMap.read_csv`.
 
-        :param all_positions:
-        :return:
-        :raise TypeError:
+        :param all_positions: The slash-separated positions of each player
+        :return: The list of positions of each player
         """
-        if not isinstance(all_positions, str):
-            if isinstance(all_positions, float) and math.isnan(all_positions):
-                return np.nan
-            raise TypeError
-        return all_positions.split("/")
+        return all_positions.astype(object).str.split("/")
 
     @staticmethod
-    def __reformat_active(active: str) -> bool:
+    def _reformat_active(active: pd.Series) -> pd.Series:
         """
-        Converts the *active* string representation to a Boolean.
+        Converts the *active* string representations to Booleans.
         Used for formatting the **Active** column of the ``DataFrame`` returned by
         :py:meth:`PlayerIDMap.read_data` and :py:meth:`PlayerIDMap.read_csv`.
 
-        :param active: The string representation of the active status
-        :return: The Boolean representatino of the active status
-        :raise TypeError:
-        :raise ValueError: The active status was not recognized
-        """
-        if not isinstance(active, str):
-            if isinstance(active, float) and math.isnan(active):
-                return np.nan
-            raise TypeError
-        active = active.upper()
-        if active == "Y":
-            return True
-        if active == "N":
-            return False
-        raise ValueError
+        :param active: The string representations of the active statuses
+        :return: The Boolean representations of the active statuses
+        :raise ValueError: An active status was not recognized
+        """
+        reformatted = active.astype(object).str.upper().map({"Y": True, "N": False})
+
+        unrecognized = reformatted.isna() & active.notna()
+        if unrecognized.any():
+            raise ValueError(f"Unrecognized active statuses: {active[unrecognized].tolist()}")
+        return reformatted
+
+    @staticmethod
+    def _reformat_integers(ids: pd.Series) -> pd.Series:
+        """
+        Converts the *ids* string representations to integers, with missing IDs set to ``0``.
+
+        :param ids: The string representations of the IDs
+        :return: The integer representations of the IDs
+        """
+        return pd.to_numeric(ids).astype("Int64").fillna(0).astype("int64")
+
+    @staticmethod
+    def _reformat_string_ids(ids: pd.Series) -> pd.Series:
+        """
+        Converts the *ids* read as numbers, such as the numeric **FanGraphsID** values of an Excel
+        workbook, to the string representations read from the CSV file.
+
+        :param ids: The IDs
+        :return: The string representations of the IDs, with missing IDs left missing
+        """
+        def to_str(value: typing.Any) -> str:
+            if isinstance(value, float) and value.is_integer():
+                return str(int(value))
+            return str(value)
+
+        return ids.astype(object).map(to_str, na_action="ignore")
 
     def _format_playeridmap_df(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         :param df: The raw ``DataFrame``
         :return: The reformatted ``DataFrame``
         """
-        reformat = self._playeridmap_reformat()
+        with _instrument.stage("format.playeridmap", rows=len(df)):
+            reformat = self._playeridmap_reformat()
 
-        df.rename(
-            index=lambda i: i - df.index[0], columns=reformat.column_map,
-            inplace=True
-        )
-        df = df.reindex(columns=reformat.columns)
+            df.rename(
+                index=lambda i: i - df.index[0], columns=reformat.column_map,
+                inplace=True
+            )
+            df = df.reindex(columns=reformat.columns)
 
-        df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-        df.loc[:, "Birthdate"] = df.loc[:, "Birthdate"].apply(
-            self.__reformat_birthdate
-        )
-        df.loc[:, "AllPositions"] = df.loc[:, "AllPositions"].apply(
-            self.__reformat_all_positions
-        )
-        df.loc[:, "Active"] = df.loc[:, "Active"].apply(
-            self.__reformat_active
-        )
-        df.loc[:, self._integer_columns] = df.loc[:, self._integer_columns].applymap(
-            lambda x: 0 if math.isnan(float(x)) else int(x)
-        )
+            for column in df.columns:
+                df[column] = self._strip(df[column])
+            df["Birthdate"] = self._reformat_dates(df["Birthdate"], ("%m/%d/%Y", "%m/%d/%y"))
+            df["AllPositions"] = self._reformat_all_positions(df["AllPositions"])
+            df["Active"] = self._reformat_active(df["Active"])
+            for column in self._integer_columns:
+                df[column] = self._reformat_integers(df[column])
 
         return df
 
@@ -246,15 +381,36 @@ class PlayerIDMap:
 
         :return:
         """
-        res = requests.get(self.web_view, headers=HEADERS)
-        df = pd.read_html(res.text)[0]
+        with _instrument.stage("read_data") as stage:
+            try:
+                with _sfbb.get(self.web_view, stream=True) as res:
+                    df = self._parse_data(_sfbb.body(res), _sfbb.charset(res))
+                    stage.set(source="web_view", bytes=res.raw.tell(), rows=len(df))
+            except _htmltable.NoTableError:
+                df = self.read_csv()
+                stage.set(source="csv", rows=len(df))
+        return df
 
-        df.rename(columns=df.iloc[0], inplace=True)
-        df.drop(
-            index=[df.index[0], df.index[1]], columns=[df.columns[0]],
-            inplace=True
-        )
-        df.dropna(axis=1, how="all", inplace=True)
+    def _parse_data(
+            self, html: typing.Union[str, bytes, typing.BinaryIO],
+            encoding: typing.Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        The first row of the sheet holds the column labels, the second is the frozen-row bar, and
+        the first column holds the row numbers.
+
+        :param html: The HTML document of :py:attr:`PlayerIDMap.web_view`, or a file-like object
+            which reads it
+        :param encoding: The character encoding of *html*, if it is not declared by the document
+        :return: The formatted player ID map
+        :raise _htmltable.NoTableError: The document contains no table
+        """
+        with _instrument.stage("parse.web_view") as stage:
+            df = _htmltable.read_table(
+                html, header=0, skip_rows=(1,), skip_columns=(0,), encoding=encoding
+            )
+            df.dropna(axis=1, how="all", inplace=True)
+            stage.set(rows=len(df))
 
         df = self._format_playeridmap_df(df)
 
@@ -265,35 +421,165 @@ class PlayerIDMap:
 
         :return:
         """
-        res = requests.get(self.csv_download, headers=HEADERS)
-        temp_path = f"temp-PlayerIDMap-{datetime.datetime.now().microsecond}.csv"
-        with open(temp_path, "wb") as file:
-            file.write(res.content)
+        with _instrument.stage("read_csv") as stage:
+            with _sfbb.get(self.csv_download, stream=True) as res:
+                df = self._parse_csv(_sfbb.body(res))
+                stage.set(bytes=res.raw.tell(), rows=len(df))
 
-        try:
-            df = pd.read_csv(temp_path)
-        finally:
-            os.remove(os.path.abspath(temp_path))
+        return df
 
-        df = self._format_playeridmap_df(df)
+    def _parse_csv(self, csv: typing.Union[typing.BinaryIO, typing.TextIO]) -> pd.DataFrame:
+        """
+        :param csv: A file-like object which reads the CSV file of
+            :py:attr:`PlayerIDMap.csv_download`
+        :return: The formatted player ID map
+        """
+        return self._format_playeridmap_df(pd.read_csv(csv))
 
-        return df
+    @staticmethod
+    def excel_engine() -> typing.Optional[str]:
+        """
+        :return: The ``pandas.read_excel`` engine used by :py:meth:`PlayerIDMap.read_excel`:
+            ``"calamine"`` if ``python-calamine`` is installed and supported by ``pandas``,
+            ``"openpyxl"`` if ``openpyxl`` is installed, and ``None`` otherwise
+        """
+        version = tuple(int(p) for p in pd.__version__.split(".")[:2])
+        if python_calamine is not None and version >= (2, 2):
+            return "calamine"
+        if openpyxl is not None:
+            return "openpyxl"
+        return None
+
+    def read_excel(self) -> ExcelData:
+        """
+        Downloads the Excel workbook once and reads both the player ID map and the CHANGELOG from
+        it, in one request instead of the two made by :py:meth:`PlayerIDMap.read_data` and
+        :py:meth:`PlayerIDMap.read_changelog_data`.
+
+        :return: The formatted player ID map and CHANGELOG
+        :raise ImportError: Neither ``python-calamine`` nor ``openpyxl`` is installed
+        """
+        engine = self.excel_engine()
+        if engine is None:
+            raise ImportError("Reading the Excel workbook requires python-calamine or openpyxl")
+
+        with _instrument.stage("read_excel", engine=engine) as stage:
+            with _sfbb.get(self.excel_download, stream=True) as res:
+                workbook = io.BytesIO(_sfbb.body(res).read())
+                stage.set(bytes=res.raw.tell())
+            data = self._parse_excel(workbook, engine)
+            stage.set(rows=len(data.data))
+        return data
+
+    def _parse_excel(self, workbook: typing.BinaryIO, engine: str) -> ExcelData:
+        """
+        The sheets are told apart by their column labels, so that renamed or reordered sheets are
+        still found.
+
+        :param workbook: The Excel workbook of :py:attr:`PlayerIDMap.excel_download`
+        :param engine: The ``pandas.read_excel`` engine
+        :return: The formatted player ID map and CHANGELOG
+        :raise ValueError: The workbook has no player ID map or no CHANGELOG sheet
+        """
+        with _instrument.stage("parse.excel", engine=engine):
+            sheets = pd.read_excel(workbook, sheet_name=None, dtype=object, engine=engine)
+
+        data = changelog = None
+        for sheet in sheets.values():
+            labels = {str(c).strip().upper() for c in sheet.columns}
+            if data is None and "IDPLAYER" in labels:
+                data = sheet
+            elif changelog is None and "DATE" in labels:
+                changelog = sheet
+        if data is None or changelog is None:
+            raise ValueError("The workbook has no player ID map or no CHANGELOG sheet")
+
+        for df in (data, changelog):
+            df.rename(columns=lambda c: str(c).strip(), inplace=True)
+            df.dropna(axis=0, how="all", inplace=True)
+            df.dropna(axis=1, how="all", inplace=True)
+
+        data = self._format_playeridmap_df(data)
+        for column in self._string_id_columns:
+            data[column] = self._reformat_string_ids(data[column])
+        changelog = self._format_changelog_df(changelog)
+        return self.ExcelData(data=data, changelog=changelog)
+
+    def _read_latest_change(self, res) -> typing.Optional[datetime.datetime]:
+        """
+        :param res: The response to a streamed request for
+            :py:attr:`PlayerIDMap.changelog_csv_download`
+        :return: The date of the first, and latest, CHANGELOG entry, read without reading the
+            rest of the response, or ``None`` if there is no entry
+        """
+        lines = io.TextIOWrapper(
+            _sfbb.body(res), encoding=_sfbb.charset(res) or "utf-8-sig", newline=""
+        )
+        rows = csv.reader(lines)
+        header, first = next(rows, None), next(rows, None)
+        if header is None or first is None:
+            return None
+
+        df = self._format_changelog_df(pd.DataFrame([first], columns=header))
+        date = df.loc[0, "Date"]
+        return None if pd.isna(date) else pd.Timestamp(date).to_pydatetime()
+
+    def check_for_update(self, since: typing.Optional[datetime.datetime] = None) -> UpdateStatus:
+        """
+        Checks whether a newer player ID map has been published, without downloading it. The
+        CHANGELOG CSV is requested conditionally, with the validators of the previous check, and
+        only its first entry is read.
+
+        :param since: The date of the player ID map in hand, such as
+            :py:attr:`mlbids.PIDMap.last_update`. If ``None``, the latest CHANGELOG date is
+            compared with that of the previous check instead.
+        :return: Whether the player ID map was updated, and the latest CHANGELOG date
+        """
+        previous = self._last_check
+        headers = {}
+        if previous is not None and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous is not None and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+        with _instrument.stage("check_for_update") as stage:
+            with _sfbb.get(self.changelog_csv_download, stream=True, headers=headers) as res:
+                not_modified = res.status_code == 304 and previous is not None
+                if not_modified:
+                    last_update = previous.last_update
+                else:
+                    last_update = self._read_latest_change(res)
+                etag = res.headers.get("ETag", previous.etag if not_modified else None)
+                last_modified = res.headers.get(
+                    "Last-Modified", previous.last_modified if not_modified else None
+                )
+                stage.set(status=res.status_code, bytes=res.raw.tell())
+
+        if since is not None:
+            updated = last_update is not None and last_update > since
+        else:
+            updated = previous is None or last_update != previous.last_update
+        status = self.UpdateStatus(
+            updated=updated, last_update=last_update, not_modified=not_modified, etag=etag,
+            last_modified=last_modified
+        )
+        self._last_check = status
+        return status
 
     def _format_changelog_df(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         :param df: The raw ``DataFrame``
         :return: The reformatted ``DataFrame``
         """
-        reformat = self._changelog_reformat()
+        with _instrument.stage("format.changelog", rows=len(df)):
+            reformat = self._changelog_reformat()
 
-        df.rename(
-            index=lambda i: i - df.index[0], columns=reformat.column_map,
-            inplace=True
-        )
-        df = df.reindex(columns=reformat.columns)
-        df.loc[:, "Date"] = df.loc[:, "Date"].apply(
-            lambda x: datetime.datetime.strptime(x, "%m/%d/%Y")
-        )
+            df.rename(
+                index=lambda i: i - df.index[0], columns=reformat.column_map,
+                inplace=True
+            )
+            df = df.reindex(columns=reformat.columns)
+            df["Date"] = self._reformat_dates(df["Date"], ("%m/%d/%Y",))
 
         return df
 
@@ -302,11 +588,30 @@ class PlayerIDMap:
 
         :return:
         """
-        res = requests.get(self.changelog_web_view, headers=HEADERS)
-        df = pd.read_html(res.text)[0]
+        with _instrument.stage("read_changelog_data") as stage:
+            try:
+                with _sfbb.get(self.changelog_web_view, stream=True) as res:
+                    df = self._parse_changelog_data(_sfbb.body(res), _sfbb.charset(res))
+                    stage.set(source="web_view", bytes=res.raw.tell(), rows=len(df))
+            except _htmltable.NoTableError:
+                df = self.read_changelog_csv()
+                stage.set(source="csv", rows=len(df))
+        return df
 
-        df.rename(columns=df.iloc[0], inplace=True)
-        df.drop(index=df.index[0], inplace=True)
+    def _parse_changelog_data(
+            self, html: typing.Union[str, bytes, typing.BinaryIO],
+            encoding: typing.Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        :param html: The HTML document of :py:attr:`PlayerIDMap.changelog_web_view`, or a
+            file-like object which reads it
+        :param encoding: The character encoding of *html*, if it is not declared by the document
+        :return: The formatted player ID map CHANGELOG
+        :raise _htmltable.NoTableError: The document contains no table
+        """
+        with _instrument.stage("parse.changelog_web_view") as stage:
+            df = _htmltable.read_table(html, header=0, encoding=encoding)
+            stage.set(rows=len(df))
 
         df = self._format_changelog_df(df)
 
@@ -317,16 +622,19 @@ class PlayerIDMap:
 
         :return:
         """
-        res = requests.get(self.changelog_csv_download, headers=HEADERS)
-        temp_path = f"temp-Changelog-{datetime.datetime.now().microsecond}.csv"
-        with open(temp_path, "wb") as file:
-            file.write(res.content)
-
-        try:
-            df = pd.read_csv(temp_path)
-        finally:
-            os.remove(os.path.abspath(temp_path))
-
-        df = self._format_changelog_df(df)
+        with _instrument.stage("read_changelog_csv") as stage:
+            with _sfbb.get(self.changelog_csv_download, stream=True) as res:
+                df = self._parse_changelog_csv(_sfbb.body(res))
+                stage.set(bytes=res.raw.tell(), rows=len(df))
 
         return df
+
+    def _parse_changelog_csv(
+            self, csv: typing.Union[typing.BinaryIO, typing.TextIO]
+    ) -> pd.DataFrame:
+        """
+        :param csv: A file-like object which reads the CSV file of
+            :py:attr:`PlayerIDMap.changelog_csv_download`
+        :return: The formatted player ID map CHANGELOG
+        """
+        return self._format_changelog_df(pd.read_csv(csv))
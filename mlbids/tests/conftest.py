@@ -0,0 +1,233 @@
+"""
+Offline fixtures for the unit tests of :py:mod:`mlbids`.
+"""
+
+import datetime
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+import urllib3
+
+import mlbids
+from mlbids import _sfbb
+from mlbids import playeridmap
+
+
+def make_playeridmap_df() -> pd.DataFrame:
+    """
+    :return: A small player ID map, formatted as by
+        :py:meth:`mlbids.playeridmap.PlayerIDMap._format_playeridmap_df`
+    """
+    rows = [
+        {
+            "LastName": "Acuna", "FirstName": "Ronald", "PlayerName": "Ronald Acuna Jr.",
+            "LastFirstName": "Acuna Jr., Ronald", "Birthdate": datetime.datetime(1997, 12, 18),
+            "PlayerID": "acunaro01", "Bats": "R", "Throws": "R", "Team": "ATL", "League": "NL",
+            "Position": "OF", "AllPositions": ["OF", "CF", "RF"], "Active": True,
+            "BaseballHQID": 0, "BaseballProspectusID": 106193,
+            "BaseballReferenceID": "acunaro01",
+            "CBSID": 2901324, "CBSName": "Ronald Acuna", "ClayDavenportID": "acunar001",
+            "DraftKingsName": "Ronald Acuna Jr.", "ESPNID": 36185, "ESPNName": "Ronald Acuna Jr.",
+            "FanDuelID": 14384, "FanDuelName": "Ronald Acuna Jr.", "FanGraphsID": "18401",
+            "FanGraphsName": "Ronald Acuña Jr.", "FantasyProsName": "Ronald Acuna Jr.",
+            "FantraxID": "*04fsr*", "FantraxName": "Acuna Jr., Ronald", "KFFLName": np.nan,
+            "MastersballName": "Ronald Acuna", "MLBID": 660670, "MLBName": "Ronald Acuña Jr.",
+            "NFBCID": 10220, "NFBCName": "Ronald Acuna", "NFBCLastFirstName": "Acuna, Ronald",
+            "OttoneuID": 25437, "RazzballName": "Ronald Acuna", "RetrosheetID": "acunr001",
+            "RotoWireID": 13278, "RotoWireName": "Ronald Acuna", "YahooID": 10590,
+            "YahooName": "Ronald Acuna Jr.",
+        },
+        {
+            "LastName": "Judge", "FirstName": "Aaron", "PlayerName": "Aaron Judge",
+            "LastFirstName": "Judge, Aaron", "Birthdate": datetime.datetime(1992, 4, 26),
+            "PlayerID": "judgeaa01", "Bats": "R", "Throws": "R", "Team": "NYY", "League": "AL",
+            "Position": "OF", "AllPositions": ["OF", "RF"], "Active": True,
+            "BaseballHQID": 5531, "BaseballProspectusID": 103939,
+            "BaseballReferenceID": "judgeaa01",
+            "CBSID": 2044511, "CBSName": "Aaron Judge", "ClayDavenportID": "judgea001",
+            "DraftKingsName": "Aaron Judge", "ESPNID": 33192, "ESPNName": "Aaron Judge",
+            "FanDuelID": 11491, "FanDuelName": "Aaron Judge", "FanGraphsID": "15640",
+            "FanGraphsName": "Aaron Judge", "FantasyProsName": "Aaron Judge",
+            "FantraxID": "*02sb8*", "FantraxName": "Judge, Aaron", "KFFLName": "Aaron Judge",
+            "MastersballName": "Aaron Judge", "MLBID": 592450, "MLBName": "Aaron Judge",
+            "NFBCID": 8519, "NFBCName": "Aaron Judge", "NFBCLastFirstName": "Judge, Aaron",
+            "OttoneuID": 18612, "RazzballName": "Aaron Judge", "RetrosheetID": "judga001",
+            "RotoWireID": 12082, "RotoWireName": "Aaron Judge", "YahooID": 9552,
+            "YahooName": "Aaron Judge",
+        },
+        {
+            "LastName": "Torres", "FirstName": "Gleyber", "PlayerName": "Gleyber Torres",
+            "LastFirstName": "Torres, Gleyber", "Birthdate": datetime.datetime(1996, 12, 13),
+            "PlayerID": "torregl01", "Bats": "R", "Throws": "R", "Team": "NYY", "League": "AL",
+            "Position": "2B", "AllPositions": ["2B", "SS"], "Active": True,
+            "BaseballHQID": 5896, "BaseballProspectusID": 105522,
+            "BaseballReferenceID": "torregl01",
+            "CBSID": 2210985, "CBSName": "Gleyber Torres", "ClayDavenportID": "torreg001",
+            "DraftKingsName": "Gleyber Torres", "ESPNID": 33967, "ESPNName": "Gleyber Torres",
+            "FanDuelID": 13227, "FanDuelName": "Gleyber Torres", "FanGraphsID": "16997",
+            "FanGraphsName": "Gleyber Torres", "FantasyProsName": "Gleyber Torres",
+            "FantraxID": "*03nrz*", "FantraxName": "Torres, Gleyber", "KFFLName": np.nan,
+            "MastersballName": "Gleyber Torres", "MLBID": 650402, "MLBName": "Gleyber Torres",
+            "NFBCID": 9460, "NFBCName": "Gleyber Torres", "NFBCLastFirstName": "Torres, Gleyber",
+            "OttoneuID": 23919, "RazzballName": "Gleyber Torres", "RetrosheetID": "torrg001",
+            "RotoWireID": 13070, "RotoWireName": "Gleyber Torres", "YahooID": 9877,
+            "YahooName": "Gleyber Torres",
+        },
+        {
+            "LastName": "Smith", "FirstName": "Will", "PlayerName": "Will Smith",
+            "LastFirstName": "Smith, Will", "Birthdate": datetime.datetime(1995, 3, 28),
+            "PlayerID": "smithwi05", "Bats": "R", "Throws": "R", "Team": "LAD", "League": "NL",
+            "Position": "C", "AllPositions": ["C"], "Active": True,
+            "BaseballHQID": 6067, "BaseballProspectusID": 106024,
+            "BaseballReferenceID": "smithwi05",
+            "CBSID": 2507357, "CBSName": "Will Smith", "ClayDavenportID": "smithw004",
+            "DraftKingsName": "Will Smith", "ESPNID": 35341, "ESPNName": "Will Smith",
+            "FanDuelID": 15183, "FanDuelName": "Will Smith", "FanGraphsID": "19197",
+            "FanGraphsName": "Will Smith", "FantasyProsName": "Will Smith",
+            "FantraxID": "*04gca*", "FantraxName": "Smith, Will", "KFFLName": np.nan,
+            "MastersballName": "Will Smith", "MLBID": 669257, "MLBName": "Will Smith",
+            "NFBCID": 9879, "NFBCName": "Will Smith", "NFBCLastFirstName": "Smith, Will",
+            "OttoneuID": 25905, "RazzballName": "Will Smith", "RetrosheetID": "smitw003",
+            "RotoWireID": 14108, "RotoWireName": "Will Smith", "YahooID": 10674,
+            "YahooName": "Will Smith",
+        },
+        {
+            "LastName": "Smith", "FirstName": "Will", "PlayerName": "Will Smith",
+            "LastFirstName": "Smith, Will", "Birthdate": datetime.datetime(1989, 7, 10),
+            "PlayerID": "smithwi04", "Bats": "R", "Throws": "L", "Team": "TEX", "League": "AL",
+            "Position": "RP", "AllPositions": ["P", "RP"], "Active": False,
+            "BaseballHQID": 3901, "BaseballProspectusID": 66961,
+            "BaseballReferenceID": "smithwi04",
+            "CBSID": 1741364, "CBSName": "Will Smith", "ClayDavenportID": "smithw001",
+            "DraftKingsName": "Will Smith", "ESPNID": 30961, "ESPNName": "Will Smith",
+            "FanDuelID": 0, "FanDuelName": np.nan, "FanGraphsID": "8048",
+            "FanGraphsName": "Will Smith", "FantasyProsName": "Will Smith",
+            "FantraxID": np.nan, "FantraxName": np.nan, "KFFLName": np.nan,
+            "MastersballName": "Will Smith", "MLBID": 519293, "MLBName": "Will Smith",
+            "NFBCID": 7053, "NFBCName": "Will Smith", "NFBCLastFirstName": "Smith, Will",
+            "OttoneuID": 11270, "RazzballName": "Will Smith", "RetrosheetID": "smitw002",
+            "RotoWireID": 9973, "RotoWireName": "Will Smith", "YahooID": 9552,
+            "YahooName": "Will Smith",
+        },
+    ]
+    df = pd.DataFrame(rows, columns=playeridmap.PlayerIDMap._playeridmap_reformat().columns)
+    df["Birthdate"] = pd.to_datetime(df["Birthdate"])
+    return df
+
+
+def make_changelog_df() -> pd.DataFrame:
+    """
+    :return: A small player ID map CHANGELOG, formatted as by
+        :py:meth:`mlbids.playeridmap.PlayerIDMap._format_changelog_df`
+    """
+    return pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2022-04-05", "2022-03-28", "2022-03-14"]),
+            "Description": ["Added players", "Updated teams", "Fixed IDs"],
+        }
+    )
+
+
+@pytest.fixture
+def playeridmap_df() -> pd.DataFrame:
+    """
+    :return: A small formatted player ID map
+    """
+    return make_playeridmap_df()
+
+
+@pytest.fixture
+def changelog_df() -> pd.DataFrame:
+    """
+    :return: A small formatted player ID map CHANGELOG
+    """
+    return make_changelog_df()
+
+
+@pytest.fixture
+def downloads(monkeypatch) -> dict:
+    """
+    Replaces the network reads of :py:class:`mlbids.playeridmap.PlayerIDMap` with offline
+    stand-ins which serve :py:func:`make_playeridmap_df` and :py:func:`make_changelog_df`.
+
+    :return: The number of calls made to the stand-ins of ``read_data`` and
+        ``read_changelog_data``. A call to the stand-in of ``read_excel`` counts as one of each.
+    """
+    calls = {"read_data": 0, "read_changelog_data": 0}
+
+    def read_data(self) -> pd.DataFrame:
+        calls["read_data"] += 1
+        return make_playeridmap_df()
+
+    def read_changelog_data(self) -> pd.DataFrame:
+        calls["read_changelog_data"] += 1
+        return make_changelog_df()
+
+    def read_excel(self) -> playeridmap.PlayerIDMap.ExcelData:
+        return playeridmap.PlayerIDMap.ExcelData(self.read_data(), self.read_changelog_data())
+
+    def check_for_update(self, since=None) -> playeridmap.PlayerIDMap.UpdateStatus:
+        last_update = make_changelog_df().loc[0, "Date"].to_pydatetime()
+        return playeridmap.PlayerIDMap.UpdateStatus(
+            updated=since is None or last_update > since, last_update=last_update,
+            not_modified=False, etag=None, last_modified=None
+        )
+
+    monkeypatch.setattr(playeridmap.PlayerIDMap, "read_data", read_data)
+    monkeypatch.setattr(playeridmap.PlayerIDMap, "check_for_update", check_for_update)
+    monkeypatch.setattr(playeridmap.PlayerIDMap, "read_changelog_data", read_changelog_data)
+    monkeypatch.setattr(playeridmap.PlayerIDMap, "read_excel", read_excel)
+    return calls
+
+
+@pytest.fixture
+def pidmap(downloads: dict) -> mlbids.PIDMap:
+    """
+    :return: A :py:class:`mlbids.PIDMap` built from the offline stand-ins
+    """
+    return mlbids.PIDMap()
+
+
+@pytest.fixture
+def responses(monkeypatch) -> dict:
+    """
+    Replaces the requests of the shared session of :py:mod:`mlbids._sfbb` with offline responses.
+    Add the body of the response for a URL to the returned dictionary to serve it.
+
+    :return: Mapping of URLs to response bodies
+    """
+    bodies = {}
+
+    def get(url: str, **kwargs) -> requests.Response:
+        res = requests.Response()
+        res.url = url
+        if url not in bodies:
+            res.status_code = 404
+            res.raw = io.BytesIO(b"")
+            return res
+        res.status_code = 200
+        res.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(bodies[url]), preload_content=False, decode_content=False
+        )
+        if not kwargs.get("stream"):
+            res.content  # pylint: disable=pointless-statement
+        return res
+
+    monkeypatch.setattr(_sfbb.get_session(), "get", get)
+    return bodies
+
+
+@pytest.fixture
+def playerid_map(monkeypatch) -> playeridmap.PlayerIDMap:
+    """
+    :return: A :py:class:`mlbids.playeridmap.PlayerIDMap` whose redirect URLs need no scrape
+    """
+    pid_map = playeridmap.PlayerIDMap()
+    monkeypatch.setattr(
+        type(pid_map.sfbb), "urls",
+        property(lambda self: self.URLs(*(f"https://example.com/{i}" for i in range(5))))
+    )
+    return pid_map
@@ -0,0 +1,246 @@
+"""
+Generates the offline fixtures of the SFBB pages used by the unit tests and benchmarks.
+
+The fixtures are synthetic: they follow the layout of the live pages, but hold made-up players.
+Run ``python -m mlbids.tests.fixtures.generate`` from the repository root to regenerate them.
+"""
+
+import csv
+import datetime
+import html
+import io
+import os
+import random
+import typing
+
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+COLUMNS = [
+    "IDPLAYER", "PLAYERNAME", "BIRTHDATE", "FIRSTNAME", "LASTNAME", "TEAM", "LG", "POS",
+    "IDFANGRAPHS", "FANGRAPHSNAME", "MLBID", "MLBNAME", "CBSID", "CBSNAME", "RETROID", "BREFID",
+    "NFBCID", "NFBCNAME", "ESPNID", "ESPNNAME", "KFFLNAME", "DAVENPORTID", "BPID", "YAHOOID",
+    "YAHOONAME", "MSTRBLLNAME", "BATS", "THROWS", "FANTPROSNAME", "LASTCOMMAFIRST", "ROTOWIREID",
+    "FANDUELNAME", "FANDUELID", "DRAFTKINGSNAME", "OTTONEUID", "HQID", "RAZZBALLNAME", "FANTRAXID",
+    "FANTRAXNAME", "ROTOWIRENAME", "ALLPOS", "NFBCLASTFIRST", "ACTIVE"
+]
+
+FIRST_NAMES = [
+    "Aaron", "Bryce", "Carlos", "Dylan", "Eloy", "Freddie", "Gerrit", "Hunter", "Ian", "José",
+    "Kyle", "Luis", "Max", "Nolan", "Ozzie", "Pete", "Rafael", "Shohei", "Trea", "Yordan",
+]
+LAST_NAMES = [
+    "Acuña", "Betts", "Correa", "Devers", "Escobar", "Freeman", "García", "Harper", "Iglesias",
+    "Judge", "Kershaw", "Lindor", "Machado", "Núñez", "Ohtani", "Pérez", "Ramírez", "Soto",
+    "Turner", "Álvarez",
+]
+TEAMS = {
+    "AL": ["BAL", "BOS", "CHW", "CLE", "DET", "HOU", "KC", "LAA", "MIN", "NYY", "OAK", "SEA",
+           "TB", "TEX", "TOR"],
+    "NL": ["ARI", "ATL", "CHC", "CIN", "COL", "LAD", "MIA", "MIL", "NYM", "PHI", "PIT", "SD",
+           "SF", "STL", "WSH"],
+}
+# Redirect URLs of the synthetic Tools page, in the order of :py:class:`mlbids._sfbb.SFBBTools.URLs`
+URLS = [
+    "https://example.com/excel", "https://example.com/webview", "https://example.com/csv",
+    "https://example.com/changelog-webview", "https://example.com/changelog-csv",
+]
+
+# File names of the fixtures of the pages linked by the Tools page, in the order of ``URLS[1:]``
+FILES = ["webview.html", "playeridmap.csv", "changelog.html", "changelog.csv"]
+TOOLS_FILE = "tools.html"
+
+CHANGELOG_COLUMNS = ["DATE", "DESCRIPTION OF CHANGE"]
+
+POSITIONS = [
+    ("C", "C"), ("1B", "1B"), ("2B", "2B/SS"), ("3B", "3B/1B"), ("SS", "SS/2B/3B"), ("OF", "OF"),
+    ("OF", "OF/LF/RF"), ("CF", "OF/CF"), ("DH", "DH/1B"), ("SP", "P/SP"), ("RP", "P/RP"),
+    ("SP", "P/SP/RP"),
+]
+
+
+def players(count: int = 300, seed: int = 2022) -> typing.List[typing.Dict[str, str]]:
+    """
+    :param count: The number of players
+    :param seed: Seed of the random number generator
+    :return: The raw cells of each row of the player ID map, by column label
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        ascii_name = name.encode("ascii", "ignore").decode() if rng.random() < 0.5 else name
+        league = rng.choice(["AL", "NL"])
+        position, all_positions = rng.choice(POSITIONS)
+        year = rng.randint(1975, 2003)
+        birthdate = f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/" + (
+            str(year) if rng.random() < 0.9 else str(year)[2:]
+        )
+        pid = f"{last[:5].lower()}{first[:2].lower()}{i:02d}"
+
+        def maybe(value: str, probability: float = 0.9) -> str:
+            return value if rng.random() < probability else ""
+
+        rows.append({
+            "IDPLAYER": pid, "PLAYERNAME": name, "BIRTHDATE": birthdate, "FIRSTNAME": first,
+            "LASTNAME": last, "TEAM": rng.choice(TEAMS[league]), "LG": league, "POS": position,
+            "IDFANGRAPHS": maybe(str(10000 + i) if rng.random() < 0.8 else f"sa{3000000 + i}"),
+            "FANGRAPHSNAME": name, "MLBID": str(500000 + i), "MLBNAME": name,
+            "CBSID": maybe(str(1600000 + i)), "CBSNAME": maybe(ascii_name),
+            "RETROID": maybe(f"{last[:4].lower()}{first[0].lower()}{i:03d}"),
+            "BREFID": maybe(pid), "NFBCID": maybe(str(5000 + i)), "NFBCNAME": maybe(ascii_name),
+            "ESPNID": maybe(str(30000 + i)), "ESPNNAME": maybe(name),
+            "KFFLNAME": maybe(ascii_name, 0.3),
+            "DAVENPORTID": maybe(f"{last[:5].lower()}{first[0].lower()}{i:03d}"),
+            "BPID": maybe(str(60000 + i)), "YAHOOID": maybe(str(7000 + i)),
+            "YAHOONAME": maybe(name), "MSTRBLLNAME": maybe(ascii_name),
+            "BATS": rng.choice("LRB"), "THROWS": rng.choice("LR"),
+            "FANTPROSNAME": maybe(ascii_name), "LASTCOMMAFIRST": f"{last}, {first}",
+            "ROTOWIREID": maybe(str(9000 + i)), "FANDUELNAME": maybe(name),
+            "FANDUELID": maybe(str(11000 + i), 0.7), "DRAFTKINGSNAME": maybe(name),
+            "OTTONEUID": maybe(str(18000 + i)), "HQID": maybe(str(3000 + i), 0.6),
+            "RAZZBALLNAME": maybe(ascii_name), "FANTRAXID": maybe(f"*0{i:04x}*"),
+            "FANTRAXNAME": maybe(f"{last}, {first}"), "ROTOWIRENAME": maybe(ascii_name),
+            "ALLPOS": all_positions, "NFBCLASTFIRST": maybe(f"{last}, {first}"),
+            "ACTIVE": "Y" if rng.random() < 0.8 else "N",
+        })
+    return rows
+
+
+def _column_letter(i: int) -> str:
+    """
+    :param i: The position of a spreadsheet column
+    :return: The letter label of the column
+    """
+    label = ""
+    i += 1
+    while i:
+        i, remainder = divmod(i - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+
+def sheet_html(title: str, columns: typing.List[str], rows: typing.List[typing.List[str]],
+               freeze: bool) -> str:
+    """
+    :param title: The title of the page
+    :param columns: The labels of the spreadsheet columns
+    :param rows: The cells of each spreadsheet row
+    :param freeze: Whether the first row of the spreadsheet is frozen
+    :return: The spreadsheet as published to the web by Google Sheets
+    """
+    width = len(columns) + (1 if freeze else 0)
+    lines = [
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8"><title>' + html.escape(title) + "</title>",
+        '<style type="text/css">.ritz .waffle .s0{background-color:#ffffff;}</style></head>',
+        '<body><div id="sheets-viewport"><div id="0" dir="ltr"><div class="ritz grid-container">',
+        '<table class="waffle" cellspacing="0" cellpadding="0"><thead><tr>',
+        '<th class="row-header freezebar-origin-ltr"></th>',
+    ]
+    lines.extend(
+        f'<th id="0C{i}" style="width:100px;" class="column-headers-background">'
+        f"{_column_letter(i)}</th>"
+        for i in range(width)
+    )
+    lines.append("</tr></thead><tbody>")
+
+    for i, row in enumerate([columns] + rows):
+        cells = "".join(f'<td class="s{min(i, 1)}">{html.escape(c)}</td>' for c in row)
+        if freeze:
+            cells += '<td class="freezebar-cell"></td>'
+        lines.append(
+            f'<tr style="height: 20px"><th id="0R{i}" style="height: 20px;" '
+            f'class="row-headers-background"><div class="row-header-wrapper" '
+            f'style="line-height: 20px">{i + 1}</div></th>{cells}</tr>'
+        )
+        if freeze and i == 0:
+            lines.append(
+                '<tr class="freezebar-row"><td class="freezebar-cell freezebar-horizontal-handle">'
+                f'</td><td class="freezebar-cell" colspan="{width}"></td></tr>'
+            )
+
+    lines.append("</tbody></table></div></div></div>")
+    lines.append('<div id="footer">Published by Google Sheets</div></body></html>')
+    return "\n".join(lines) + "\n"
+
+
+def changelog(count: int = 50, seed: int = 2022) -> typing.List[typing.List[str]]:
+    """
+    :param count: The number of CHANGELOG entries
+    :param seed: Seed of the random number generator
+    :return: The raw cells of each row of the CHANGELOG, newest first
+    """
+    rng = random.Random(seed)
+    date = datetime.date(2022, 4, 5)
+    rows = []
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        change = rng.choice(["Added", "Updated team for", "Fixed IDs for", "Removed"])
+        rows.append([f"{date.month}/{date.day}/{date.year}", f"{change} {name}"])
+        date -= datetime.timedelta(days=rng.randint(1, 14))
+    return rows
+
+
+def tools_html(urls: typing.List[str]) -> str:
+    """
+    :param urls: The redirect URLs, in the order of :py:class:`mlbids._sfbb.SFBBTools.URLs`
+    :return: The Tools page of the Smart Fantasy Baseball website
+    """
+    labels = ["Excel", "Web", "CSV", "CHANGELOG Web", "CHANGELOG CSV"]
+    links = "\n".join(f'<a href="{url}">{label}</a>' for url, label in zip(urls, labels))
+    return (
+        '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Tools</title></head><body>\n'
+        '<div class="entry-content"><div><table>\n'
+        "<tr><td><strong>PLAYER ID MAP</strong></td></tr>\n"
+        f"<tr><td>\n{links}\n</td></tr>\n"
+        "</table></div></div></body></html>\n"
+    )
+
+
+def csv_text(columns: typing.List[str], rows: typing.List[typing.List[str]]) -> str:
+    """
+    :param columns: The column labels
+    :param rows: The cells of each row
+    :return: The rows as a CSV document
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def pages(count: int = 200, urls: typing.List[str] = URLS) -> typing.Dict[str, bytes]:
+    """
+    :param count: The number of players in the player ID map
+    :param urls: The redirect URLs linked by the Tools page
+    :return: The body of each page, by fixture file name
+    """
+    rows = [[row[c] for c in COLUMNS] for row in players(count)]
+    changes = changelog()
+    return {
+        TOOLS_FILE: tools_html(urls).encode(),
+        "webview.html": sheet_html("SFBB Player ID Map", COLUMNS, rows, freeze=True).encode(),
+        "playeridmap.csv": csv_text(COLUMNS, rows).encode(),
+        "changelog.html":
+            sheet_html("CHANGELOG", CHANGELOG_COLUMNS, changes, freeze=False).encode(),
+        "changelog.csv": csv_text(CHANGELOG_COLUMNS, changes).encode(),
+    }
+
+
+def write(directory: str = DIRECTORY, count: int = 200) -> None:
+    """
+    Writes the fixtures.
+
+    :param directory: Directory to which the fixtures are written
+    :param count: The number of players in the player ID map
+    """
+    for name, body in pages(count).items():
+        with open(os.path.join(directory, name), "wb") as file:
+            file.write(body)
+
+
+if __name__ == "__main__":
+    write()
@@ -0,0 +1,31 @@
+"""
+Records the live SFBB pages, under the file names of the synthetic fixtures of
+:py:mod:`mlbids.tests.fixtures.generate`, so that the benchmarks can be run against real data.
+
+Run ``python -m mlbids.tests.fixtures.record DIRECTORY`` from the repository root, then point
+``MLBIDS_FIXTURES`` at *DIRECTORY* when running the benchmarks.
+"""
+
+import os
+import sys
+
+from mlbids import _sfbb
+from mlbids.tests.fixtures import generate
+
+
+def record(directory: str) -> None:
+    """
+    Downloads the Tools page and every page it links to, except the Excel workbook.
+
+    :param directory: Directory to which the pages are written
+    """
+    os.makedirs(directory, exist_ok=True)
+    sfbb = _sfbb.SFBBTools(ttl=0)
+    _sfbb.download(sfbb.base_address, os.path.join(directory, generate.TOOLS_FILE))
+    urls = sfbb.urls
+    for url, name in zip(urls[1:], generate.FILES):
+        _sfbb.download(url, os.path.join(directory, name))
+
+
+if __name__ == "__main__":
+    record(sys.argv[1])
@@ -0,0 +1,105 @@
+"""
+Unit tests for :py:mod:`mlbids._async`.
+"""
+
+import asyncio
+
+import pandas as pd
+
+from mlbids import _async
+from mlbids import _htmltable
+from mlbids import _instrument
+from mlbids import _sfbb
+from mlbids import playeridmap
+from mlbids.tests import test_format
+
+
+URLS = _sfbb.SFBBTools.URLs(
+    excel_download="https://example.com/excel", web_view="https://example.com/web",
+    csv_download="https://example.com/csv", changelog_web_view="https://example.com/changelog",
+    changelog_csv_download="https://example.com/changelog-csv"
+)
+
+
+class TestAsyncPlayerIDMap:
+    """
+    Unit tests for :py:class:`mlbids._async.AsyncPlayerIDMap`.
+    """
+    def make(self, monkeypatch, playeridmap_df: pd.DataFrame, changelog_df: pd.DataFrame):
+        """
+        :return: An :py:class:`AsyncPlayerIDMap` whose requests are served offline, and the URLs
+            requested so far
+        """
+        requested = []
+
+        async def get_text(self, url: str) -> str:
+            requested.append(url)
+            await asyncio.sleep(0.01)
+            return url
+
+        pid_map = playeridmap.PlayerIDMap()
+        monkeypatch.setattr(_async.AsyncPlayerIDMap, "_get_text", get_text)
+        monkeypatch.setattr(_sfbb.SFBBTools, "_url_cache", {})
+        monkeypatch.setattr(pid_map.sfbb, "update_urls", lambda html: URLS)
+        monkeypatch.setattr(pid_map, "_parse_data", lambda html: playeridmap_df)
+        monkeypatch.setattr(pid_map, "_parse_changelog_data", lambda html: changelog_df)
+        return _async.AsyncPlayerIDMap(pid_map), requested
+
+    def test_read_data(self, monkeypatch, playeridmap_df, changelog_df):
+        """
+        Unit test for :py:meth:`mlbids._async.AsyncPlayerIDMap.read_data`.
+        """
+        pid_map, requested = self.make(monkeypatch, playeridmap_df, changelog_df)
+
+        async def main():
+            return await asyncio.gather(*(pid_map.read_data() for _ in range(10)))
+
+        results = asyncio.run(main())
+        assert all(df is playeridmap_df for df in results)
+        assert requested == [pid_map.pid_map.sfbb.base_address, URLS.web_view]
+
+    def test_refresh(self, monkeypatch, playeridmap_df, changelog_df):
+        """
+        Unit test for :py:meth:`mlbids._async.AsyncPlayerIDMap.refresh`.
+        """
+        pid_map, requested = self.make(monkeypatch, playeridmap_df, changelog_df)
+
+        async def main():
+            await pid_map.read_changelog_data()
+            await pid_map.read_changelog_data()
+            return await pid_map.refresh()
+
+        data, changelog = asyncio.run(main())
+        assert data is playeridmap_df
+        assert changelog is changelog_df
+        assert requested.count(URLS.changelog_web_view) == 2
+        assert requested.count(URLS.web_view) == 1
+
+    def test_csv_fallback(self, monkeypatch, playeridmap_df, changelog_df):
+        """
+        Unit test for :py:meth:`mlbids._async.AsyncPlayerIDMap.read_data` when the web view has no
+        table.
+        """
+        pid_map, requested = self.make(monkeypatch, playeridmap_df, changelog_df)
+
+        def parse_data(html: str):
+            raise _htmltable.NoTableError(html)
+
+        async def get_text(self, url: str) -> str:
+            requested.append(url)
+            return test_format.RAW_CSV if url == URLS.csv_download else url
+
+        monkeypatch.setattr(pid_map.pid_map, "_parse_data", parse_data)
+        monkeypatch.setattr(_async.AsyncPlayerIDMap, "_get_text", get_text)
+        events = []
+        _instrument.add_hook(events.append)
+        try:
+            df = asyncio.run(pid_map.read_data())
+        finally:
+            _instrument.remove_hook(events.append)
+
+        assert df.loc[:, "PlayerID"].tolist() == ["judgeaa01", "smithwi04"]
+        assert requested[-2:] == [URLS.web_view, URLS.csv_download]
+        stages = {e.stage: e.attributes for e in events}
+        assert stages["read_data"]["source"] == "csv"
+        assert stages["read_csv"]["rows"] == 2
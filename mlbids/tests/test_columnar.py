@@ -0,0 +1,92 @@
+"""
+Unit tests for :py:mod:`mlbids._columnar`.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlbids import _columnar
+from mlbids import _schema
+from mlbids import playeridmap
+
+
+class TestColumnar:
+    """
+    Unit tests for :py:func:`mlbids._columnar.save` and :py:func:`mlbids._columnar.load`.
+    """
+    def test_round_trip(self, tmp_path, playeridmap_df: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.save_columnar` and
+        :py:meth:`mlbids.playeridmap.PlayerIDMap.load_columnar`.
+        """
+        playeridmap_df["Active"] = playeridmap_df["Active"].astype(object)
+        playeridmap_df.loc[4, "Active"] = np.nan
+        playeridmap_df.loc[2, "AllPositions"] = np.nan
+
+        pid_map = playeridmap.PlayerIDMap()
+        path = pid_map.save_columnar(str(tmp_path / "map"), playeridmap_df)
+        for mmap in (True, False):
+            df = pid_map.load_columnar(path, mmap=mmap)
+            pd.testing.assert_frame_equal(df, playeridmap_df)
+        assert df.loc[0, "AllPositions"] == ["OF", "CF", "RF"]
+
+        compact = _schema.compact(playeridmap_df)
+        path = pid_map.save_columnar(path, compact)
+        pd.testing.assert_frame_equal(pid_map.load_columnar(path), compact)
+
+        rows = playeridmap_df.iloc[[0, 0]]
+        path = pid_map.save_columnar(path, rows)
+        pd.testing.assert_frame_equal(pid_map.load_columnar(path), rows)
+
+    def test_columns(self, tmp_path, playeridmap_df: pd.DataFrame):
+        """
+        Unit test for :py:func:`mlbids._columnar.load` with *columns*.
+        """
+        path = _columnar.save(playeridmap_df.set_index("PlayerID"), str(tmp_path / "map"))
+        df = _columnar.load(path, columns=["MLBID", "PlayerName"])
+        assert df.columns.tolist() == ["MLBID", "PlayerName"]
+        assert df.index.name == "PlayerID"
+        assert df.loc["judgeaa01", "MLBID"] == 592450
+        assert not df["MLBID"].to_numpy().flags.writeable
+
+        with pytest.raises(KeyError):
+            _columnar.load(path, columns=["Missing"])
+
+    def test_format_version(self, tmp_path, playeridmap_df: pd.DataFrame):
+        """
+        Unit test for :py:func:`mlbids._columnar.load` with a file of another format version.
+        """
+        path = _columnar.save(playeridmap_df, str(tmp_path / "map"))
+        meta_path = os.path.join(path, "meta.json")
+        with open(meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        meta["format"] = 0
+        with open(meta_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+        with pytest.raises(ValueError):
+            _columnar.load(path)
+
+    def test_strings(self, tmp_path):
+        """
+        Unit test for :py:func:`mlbids._columnar.save` and :py:func:`mlbids._columnar.load` with a
+        column of strings.
+        """
+        df = pd.DataFrame({"Name": pd.Series(["Judge", "Acuña", np.nan, ""], dtype=object)})
+        path = _columnar.save(df, str(tmp_path / "map"))
+        assert np.load(os.path.join(path, "0.npy"), mmap_mode="r").dtype.kind == "U"
+        for mmap in (True, False):
+            pd.testing.assert_frame_equal(_columnar.load(path, mmap=mmap), df)
+
+    def test_unsupported(self, tmp_path):
+        """
+        Unit test for :py:func:`mlbids._columnar.save` with a column which cannot be stored.
+        """
+        df = pd.DataFrame({"Mixed": pd.Series([{"a": 1}, 1], dtype=object)})
+        with pytest.raises(ValueError):
+            _columnar.save(df, str(tmp_path / "map"))
+        assert not os.path.exists(tmp_path / "map")
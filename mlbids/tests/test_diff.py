@@ -0,0 +1,81 @@
+"""
+Unit tests for :py:mod:`mlbids._diff`.
+"""
+
+import pandas as pd
+
+from mlbids import _diff
+from mlbids import _schema
+
+from .conftest import make_playeridmap_df
+
+
+def make_new_version() -> pd.DataFrame:
+    """
+    :return: A new version of :py:func:`make_playeridmap_df`, in which Judge is removed, Acuna
+        changes team, Torres changes positions and a player is added
+    """
+    df = make_playeridmap_df()
+    df = df.loc[df.loc[:, "PlayerID"] != "judgeaa01"].reset_index(drop=True)
+    df.loc[df.loc[:, "PlayerID"] == "acunaro01", "Team"] = "SD"
+    df.at[1, "AllPositions"] = ["2B"]
+
+    added = df.iloc[[0]].copy()
+    added.loc[:, "PlayerID"] = "rookie01"
+    added.loc[:, "MLBID"] = 700000
+    return pd.concat([df, added], ignore_index=True)
+
+
+class TestDiff:
+    """
+    Unit tests for :py:func:`mlbids._diff.diff`.
+    """
+    def test_diff(self):
+        """
+        Unit test for :py:func:`mlbids._diff.diff`.
+        """
+        changes = _diff.diff(make_playeridmap_df(), make_new_version())
+        assert changes.added == ["rookie01"]
+        assert changes.removed == ["judgeaa01"]
+        assert changes.modified == {"acunaro01": ["Team"], "torregl01": ["AllPositions"]}
+        assert changes.players == {"rookie01", "judgeaa01", "acunaro01", "torregl01"}
+
+    def test_diff_unchanged(self):
+        """
+        Unit test for :py:func:`mlbids._diff.diff` between equal versions with missing values.
+        """
+        changes = _diff.diff(make_playeridmap_df(), make_playeridmap_df())
+        assert not changes.players
+
+
+class TestApply:
+    """
+    Unit tests for :py:func:`mlbids._diff.apply`.
+    """
+    def test_apply(self):
+        """
+        Unit test for :py:func:`mlbids._diff.apply`.
+        """
+        old, new = make_playeridmap_df(), make_new_version()
+        patch = _diff.apply(old, new, _diff.diff(old, new))
+
+        assert patch.data.loc[:, "PlayerID"].tolist() == [
+            "acunaro01", "torregl01", "smithwi05", "smithwi04", "rookie01"
+        ]
+        assert patch.remap.tolist() == [0, -1, 1, 2, 3]
+        assert patch.rows.tolist() == [0, 1, 4]
+        assert patch.data.at[0, "Team"] == "SD"
+        assert patch.data.at[1, "AllPositions"] == ["2B"]
+        assert patch.data.dtypes.equals(old.dtypes)
+        assert not _diff.diff(patch.data, new).players
+
+    def test_apply_compact(self):
+        """
+        Unit test for :py:func:`mlbids._diff.apply` on compact player ID maps.
+        """
+        old, new = _schema.compact(make_playeridmap_df()), _schema.compact(make_new_version())
+        patch = _diff.apply(old, new, _diff.diff(old, new))
+
+        assert isinstance(patch.data.loc[:, "Team"].dtype, pd.CategoricalDtype)
+        assert patch.data.at[0, "Team"] == "SD"
+        assert not _diff.diff(patch.data, new).players
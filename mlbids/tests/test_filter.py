@@ -0,0 +1,37 @@
+"""
+Unit tests for :py:mod:`mlbids._filter`.
+"""
+
+import numpy as np
+import pytest
+
+import mlbids
+
+
+class TestFilter:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.filter`.
+    """
+    def test_filter(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.filter` and :py:meth:`mlbids.PIDMap.filter_rows`.
+        """
+        df = pidmap.filter(position="RF", team="nyy", active=True)
+        assert df["PlayerID"].tolist() == ["judgeaa01"]
+
+        np.testing.assert_array_equal(pidmap.filter_rows(position=["C", "SS"]), [2, 3])
+        np.testing.assert_array_equal(pidmap.filter_rows(league="AL", active=False), [4])
+        np.testing.assert_array_equal(pidmap.filter_rows(), np.arange(5))
+        assert pidmap.filter(position="DH").empty
+        assert pidmap.filter_index().count(team=["NYY", "LAD"]) == 3
+
+        with pytest.raises(ValueError):
+            pidmap.filter_index().rows(bats="R")
+
+    def test_compact(self, downloads: dict):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.filter` in the compact schema.
+        """
+        pidmap = mlbids.PIDMap(compact=True)
+        np.testing.assert_array_equal(pidmap.filter_rows(position="of", league="NL"), [0])
+        np.testing.assert_array_equal(pidmap.filter_rows(position="P", active=False), [4])
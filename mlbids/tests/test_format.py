@@ -0,0 +1,199 @@
+"""
+Offline unit tests for the parsing and formatting of :py:class:`mlbids.playeridmap.PlayerIDMap`.
+"""
+
+import datetime
+import io
+import math
+import os
+
+import pandas as pd
+import pytest
+import requests
+
+from mlbids import playeridmap
+
+
+RAW_CSV = """IDPLAYER,PLAYERNAME,BIRTHDATE,FIRSTNAME,LASTNAME,TEAM,LG,POS,IDFANGRAPHS,FANGRAPHSNAME,\
+MLBID,MLBNAME,CBSID,CBSNAME,RETROID,BREFID,NFBCID,NFBCNAME,ESPNID,ESPNNAME,KFFLNAME,DAVENPORTID,\
+BPID,YAHOOID,YAHOONAME,MSTRBLLNAME,BATS,THROWS,FANTPROSNAME,LASTCOMMAFIRST,ROTOWIREID,FANDUELNAME,\
+FANDUELID,DRAFTKINGSNAME,OTTONEUID,HQID,RAZZBALLNAME,FANTRAXID,FANTRAXNAME,ROTOWIRENAME,ALLPOS,\
+NFBCLASTFIRST,ACTIVE
+judgeaa01,Aaron Judge,4/26/1992,Aaron,Judge,NYY,AL,OF,15640,Aaron Judge,592450,Aaron Judge,\
+2044511,Aaron Judge,judga001,judgeaa01,8519,Aaron Judge,33192,Aaron Judge,Aaron Judge,judgea001,\
+103939,9552,Aaron Judge,Aaron Judge,R,R,Aaron Judge,"Judge, Aaron",12082,Aaron Judge,11491,\
+Aaron Judge,18612,5531,Aaron Judge,*02sb8*,"Judge, Aaron",Aaron Judge,OF/RF,"Judge, Aaron",Y
+smithwi04,Will Smith,7/10/89,Will,Smith,TEX,AL,RP,8048,Will Smith,519293,Will Smith,1741364,\
+Will Smith,smitw002,smithwi04,7053,Will Smith,30961,Will Smith,,smithw001,66961,,Will Smith,\
+Will Smith,R,L,Will Smith,"Smith, Will",9973,,,Will Smith,11270,3901,Will Smith,,,Will Smith,\
+P/RP,"Smith, Will",n
+"""
+
+
+def reference_format(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Formats *df* cell by cell, as :py:meth:`PlayerIDMap._format_playeridmap_df` used to.
+    """
+    def birthdate(x):
+        if not isinstance(x, str):
+            return math.nan
+        try:
+            return datetime.datetime.strptime(x, "%m/%d/%Y")
+        except ValueError:
+            return datetime.datetime.strptime(x, "%m/%d/%y")
+
+    def all_positions(x):
+        return x.split("/") if isinstance(x, str) else math.nan
+
+    def active(x):
+        return {"Y": True, "N": False}[x.upper()] if isinstance(x, str) else math.nan
+
+    reformat = playeridmap.PlayerIDMap._playeridmap_reformat()
+    df = df.rename(columns=reformat.column_map).reindex(columns=reformat.columns)
+    df = df.astype(object)
+    df["Birthdate"] = pd.to_datetime(df["Birthdate"].map(birthdate))
+    df["AllPositions"] = df["AllPositions"].map(all_positions)
+    df["Active"] = df["Active"].map(active)
+    for col in playeridmap.PlayerIDMap._integer_columns:
+        df[col] = df[col].map(lambda x: 0 if math.isnan(float(x)) else int(x)).astype("int64")
+    return df
+
+
+class TestFormatPlayerIDMap:
+    """
+    Offline unit tests for :py:meth:`mlbids.playeridmap.PlayerIDMap._format_playeridmap_df`.
+    """
+    playerid_map = playeridmap.PlayerIDMap()
+
+    def test_format_playeridmap_df(self):
+        """
+        Unit test comparing :py:meth:`PlayerIDMap._format_playeridmap_df` with the cell-by-cell
+        formatting it replaced.
+        """
+        expected = reference_format(pd.read_csv(io.StringIO(RAW_CSV)))
+        df = self.playerid_map._format_playeridmap_df(pd.read_csv(io.StringIO(RAW_CSV)))
+
+        assert df.loc[:, "Birthdate"].tolist() == expected.loc[:, "Birthdate"].tolist()
+        assert df.loc[1, "Birthdate"] == datetime.datetime(1989, 7, 10)
+        assert df.loc[:, "AllPositions"].tolist() == [["OF", "RF"], ["P", "RP"]]
+        assert df.loc[:, "Active"].tolist() == [True, False]
+        for col in self.playerid_map._integer_columns:
+            assert df.loc[:, col].tolist() == expected.loc[:, col].tolist()
+            assert all(isinstance(x, int) for x in df.loc[:, col])
+        assert df.loc[1, "FanDuelID"] == 0
+        assert df.loc[:, "LastFirstName"].tolist() == ["Judge, Aaron", "Smith, Will"]
+
+    def test_format_playeridmap_df_strip(self):
+        """
+        Unit test for the whitespace stripping of :py:meth:`PlayerIDMap._format_playeridmap_df`.
+        """
+        raw = pd.read_csv(io.StringIO(RAW_CSV))
+        raw.loc[:, "PLAYERNAME"] = [" Aaron Judge ", "Will Smith\t"]
+        df = self.playerid_map._format_playeridmap_df(raw)
+        assert df.loc[:, "PlayerName"].tolist() == ["Aaron Judge", "Will Smith"]
+
+    def test_format_playeridmap_df_invalid(self):
+        """
+        Unit test for the validation of :py:meth:`PlayerIDMap._format_playeridmap_df`.
+        """
+        raw = pd.read_csv(io.StringIO(RAW_CSV))
+        raw.loc[:, "ACTIVE"] = ["Y", "maybe"]
+        with pytest.raises(ValueError):
+            self.playerid_map._format_playeridmap_df(raw)
+
+        raw = pd.read_csv(io.StringIO(RAW_CSV))
+        raw.loc[:, "BIRTHDATE"] = ["4/26/1992", "1992-04-26"]
+        with pytest.raises(ValueError):
+            self.playerid_map._format_playeridmap_df(raw)
+
+    def test_format_changelog_df(self):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap._format_changelog_df`.
+        """
+        raw = pd.DataFrame(
+            {"DATE": ["4/5/2022", "03/28/2022"], "DESCRIPTION OF CHANGE": ["Added", "Updated"]}
+        )
+        df = self.playerid_map._format_changelog_df(raw)
+        assert df.loc[:, "Date"].tolist() == [
+            datetime.datetime(2022, 4, 5), datetime.datetime(2022, 3, 28)
+        ]
+        assert df.loc[0, "Description"] == "Added"
+
+        raw = pd.DataFrame(
+            {
+                "DATE": [datetime.datetime(2022, 4, 5), "3/28/2022"],
+                "DESCRIPTION OF CHANGE": ["Added", "Updated"],
+            }
+        )
+        df = self.playerid_map._format_changelog_df(raw)
+        assert df.loc[:, "Date"].tolist() == [
+            datetime.datetime(2022, 4, 5), datetime.datetime(2022, 3, 28)
+        ]
+
+
+class TestReadCSV:
+    """
+    Offline unit tests for the CSV downloads of :py:class:`mlbids.playeridmap.PlayerIDMap`.
+    """
+    def test_read_csv(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_csv`.
+        """
+        responses[playerid_map.csv_download] = RAW_CSV.encode()
+        listing = os.listdir()
+        df = playerid_map.read_csv()
+        assert df.loc[:, "PlayerID"].tolist() == ["judgeaa01", "smithwi04"]
+        assert os.listdir() == listing
+
+    def test_read_changelog_csv(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_changelog_csv`.
+        """
+        responses[playerid_map.changelog_csv_download] = \
+            b"DATE,DESCRIPTION OF CHANGE\n4/5/2022,Added\n3/28/2022,Updated\n"
+        df = playerid_map.read_changelog_csv()
+        assert df.loc[0, "Date"] == datetime.datetime(2022, 4, 5)
+
+    def test_save_csv(self, playerid_map: playeridmap.PlayerIDMap, responses: dict, tmp_path):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.save_csv`.
+        """
+        responses[playerid_map.csv_download] = RAW_CSV.encode()
+        path = playerid_map.save_csv(str(tmp_path / "map.csv"))
+        with open(path, "r", encoding="utf-8") as file:
+            assert file.read() == RAW_CSV
+        assert os.listdir(tmp_path) == ["map.csv"]
+
+        with pytest.raises(requests.HTTPError):
+            playerid_map.save_changelog_csv(str(tmp_path / "changelog.csv"))
+        assert os.listdir(tmp_path) == ["map.csv"]
+
+
+class TestReadExcel:
+    """
+    Offline unit tests for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_excel`.
+    """
+    def test_read_excel(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_excel`.
+        """
+        pytest.importorskip("openpyxl")
+        raw = pd.read_csv(io.StringIO(RAW_CSV), dtype=object)
+        raw["BIRTHDATE"] = pd.to_datetime(["1992-04-26", "1989-07-10"])
+        raw["IDFANGRAPHS"] = pd.to_numeric(raw["IDFANGRAPHS"])
+        workbook = io.BytesIO()
+        with pd.ExcelWriter(workbook, engine="openpyxl") as writer:
+            pd.DataFrame(
+                {"DATE": ["4/5/2022", "3/28/2022"], "DESCRIPTION OF CHANGE": ["Added", "Updated"]}
+            ).to_excel(writer, sheet_name="CHANGELOG", index=False)
+            raw.to_excel(writer, sheet_name="PLAYERIDMAP", index=False)
+        responses[playerid_map.excel_download] = workbook.getvalue()
+        responses[playerid_map.csv_download] = RAW_CSV.encode()
+
+        data, changelog = playerid_map.read_excel()
+        expected = playerid_map.read_csv()
+        assert data.loc[:, "FanGraphsID"].tolist() == ["15640", "8048"]
+        assert data.loc[:, "Birthdate"].tolist() == expected.loc[:, "Birthdate"].tolist()
+        assert data.loc[:, "MLBID"].tolist() == expected.loc[:, "MLBID"].tolist()
+        assert data.loc[:, "AllPositions"].tolist() == expected.loc[:, "AllPositions"].tolist()
+        assert changelog.loc[0, "Date"] == datetime.datetime(2022, 4, 5)
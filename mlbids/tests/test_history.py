@@ -0,0 +1,159 @@
+"""
+Offline unit tests for :py:mod:`mlbids._history`.
+"""
+
+import datetime
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _history
+from mlbids import playeridmap
+from mlbids.tests import conftest
+
+
+def make_versions() -> list:
+    """
+    :return: Three successive versions of the player ID map, with their CHANGELOGs
+    """
+    changelog = conftest.make_changelog_df()
+    first = conftest.make_playeridmap_df()
+
+    second = first.copy()
+    second.loc[1, "Team"] = "SF"
+    second = pd.concat([second, first.iloc[[2]].assign(PlayerID="newpl01")], ignore_index=True)
+
+    third = second.loc[second["PlayerID"] != "smithwi04"].reset_index(drop=True)
+    third.loc[0, "FanGraphsID"] = "99999"
+
+    return [
+        (first, changelog),
+        (second, pd.concat([
+            pd.DataFrame({"Date": [pd.Timestamp("2022-04-12")], "Description": ["Moved"]}),
+            changelog
+        ], ignore_index=True)),
+        (third, pd.concat([
+            pd.DataFrame({"Date": [pd.Timestamp("2022-04-19")], "Description": ["Removed"]}),
+            pd.DataFrame({"Date": [pd.Timestamp("2022-04-12")], "Description": ["Moved"]}),
+            changelog
+        ], ignore_index=True)),
+    ]
+
+
+def _size(path: str) -> int:
+    """
+    :param path: A directory
+    :return: The total size of the files in *path*
+    """
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+class TestVersionStore:
+    """
+    Unit tests for :py:class:`mlbids._history.VersionStore`.
+    """
+    def test_as_of(self, tmp_path):
+        """
+        Unit test for :py:meth:`mlbids._history.VersionStore.as_of`.
+        """
+        store = _history.VersionStore(str(tmp_path), checkpoint_every=2)
+        versions = make_versions()
+        for data, changelog in versions:
+            assert store.record(data, changelog) is not None
+        assert store.record(*versions[1]) is None
+
+        assert [(v.checkpoint, v.rows) for v in store.versions] == [
+            (True, 5), (False, 2), (False, 1)
+        ]
+        assert _size(store._version_path(store.versions[2].version)) < \
+            _size(store._version_path(store.versions[0].version))
+        assert not any(name.endswith(".pkl") for name in os.listdir(tmp_path))
+
+        reopened = _history.VersionStore(str(tmp_path))
+        for date, (data, _) in zip(["2022-04-05", "2022-04-15", "2022-05-01"], versions):
+            pd.testing.assert_frame_equal(reopened.as_of(date), data)
+        with pytest.raises(ValueError):
+            reopened.as_of(datetime.date(2022, 4, 4))
+
+    def test_checkpoint(self, tmp_path):
+        """
+        Unit test for the checkpoints of :py:meth:`mlbids._history.VersionStore.record`.
+        """
+        store = _history.VersionStore(str(tmp_path), checkpoint_every=1)
+        for data, changelog in make_versions():
+            store.record(data, changelog)
+        assert [v.checkpoint for v in store.versions] == [True, False, True]
+
+        store.clear()
+        assert store.versions == []
+        assert os.listdir(tmp_path) == []
+
+    def test_unreadable(self, tmp_path):
+        """
+        Unit test for :py:class:`mlbids._history.VersionStore` with unreadable stored versions.
+        """
+        store = _history.VersionStore(str(tmp_path), checkpoint_every=2)
+        versions = make_versions()
+        for data, changelog in versions[:2]:
+            store.record(data, changelog)
+
+        with open(store._changes_path(store.versions[1].version), "w", encoding="utf-8") as file:
+            file.write("{")
+        reopened = _history.VersionStore(str(tmp_path))
+        pd.testing.assert_frame_equal(reopened.as_of("2022-04-05"), versions[0][0])
+        with pytest.raises(ValueError, match="unreadable"):
+            reopened.as_of("2022-04-15")
+
+        reopened.record(*versions[2])
+        assert reopened.versions[2].checkpoint
+        pd.testing.assert_frame_equal(reopened.as_of("2022-05-01"), versions[2][0])
+
+        shutil.rmtree(store._version_path(store.versions[0].version))
+        with pytest.raises(ValueError, match="unreadable"):
+            _history.VersionStore(str(tmp_path)).as_of("2022-04-05")
+
+        shutil.rmtree(store._changelog_path)
+        assert store.changelog is None
+
+
+class TestAsOf:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.as_of`.
+    """
+    def test_as_of(self, monkeypatch, tmp_path):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.as_of` after a refresh.
+        """
+        versions = iter(make_versions()[:2])
+        current = {}
+
+        def advance():
+            current["data"], current["changelog"] = next(versions)
+
+        advance()
+        monkeypatch.setattr(
+            playeridmap.PlayerIDMap, "read_data", lambda self: current["data"].copy()
+        )
+        monkeypatch.setattr(
+            playeridmap.PlayerIDMap, "read_changelog_data",
+            lambda self: current["changelog"].copy()
+        )
+
+        pidmap = mlbids.PIDMap(history=str(tmp_path))
+        assert pidmap.translate(592450, to="Team") == "NYY"
+        advance()
+        pidmap.refresh()
+        assert pidmap.translate(592450, to="Team") == "SF"
+
+        past = pidmap.as_of("2022-04-10")
+        assert past.translate(592450, to="Team") == "NYY"
+        assert past.last_update == datetime.datetime(2022, 4, 5)
+        assert len(past.data) == 5
+        assert pidmap.as_of(datetime.date(2022, 4, 12)).last_update == \
+            datetime.datetime(2022, 4, 12)
+
+        with pytest.raises(ValueError):
+            mlbids.PIDMap().as_of("2022-04-10")
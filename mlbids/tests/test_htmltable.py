@@ -0,0 +1,148 @@
+"""
+Offline unit tests for :py:mod:`mlbids._htmltable`.
+"""
+
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from mlbids import _htmltable
+from mlbids import playeridmap
+
+
+WEBVIEW_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "webview.html")
+
+
+def read_webview() -> bytes:
+    """
+    :return: The synthetic web view of the player ID map
+    """
+    with open(WEBVIEW_PATH, "rb") as file:
+        return file.read()
+
+
+class TestReadTable:
+    """
+    Unit tests for :py:func:`mlbids._htmltable.read_table`.
+    """
+    def test_spans(self):
+        """
+        Unit test for :py:func:`mlbids._htmltable.read_table` with cells spanning several columns
+        and rows.
+        """
+        html = """
+        <table>
+            <thead><tr><th>A</th><th>B</th><th>C</th></tr></thead>
+            <tr><td rowspan="2">1</td><td colspan="2">2</td></tr>
+            <tr><td>3</td><td> 4
+            5 </td></tr>
+        </table>
+        """
+        df = _htmltable.read_table(html)
+        assert df.values.tolist() == [["1", "2", "2"], ["1", "3", "4 5"]]
+
+    def test_header(self):
+        """
+        Unit test for :py:func:`mlbids._htmltable.read_table` with a header row, skipped rows and
+        columns, and missing cells.
+        """
+        html = """
+        <table>
+            <tr><th></th><td>x</td><td>y</td></tr>
+            <tr><th>1</th><td colspan="2"></td></tr>
+            <tr><th>2</th><td>a</td><td>N/A</td></tr>
+            <tr><th>3</th><td>b</td></tr>
+        </table>
+        """
+        df = _htmltable.read_table(html, header=0, skip_rows=(1,), skip_columns=(0,))
+        assert df.columns.tolist() == ["x", "y"]
+        assert df.loc[:, "x"].tolist() == ["a", "b"]
+        assert df.loc[:, "y"].isna().all()
+
+    def test_first_table(self):
+        """
+        Unit test for :py:func:`mlbids._htmltable.read_table` with nested and subsequent tables.
+        """
+        html = """
+        <p>Before</p>
+        <table>
+            <tr><td><table><tr><td>nested</td></tr></table></td><td>1</td></tr>
+        </table>
+        <table><tr><td>second</td></tr></table>
+        """
+        df = _htmltable.read_table(html.encode())
+        assert df.values.tolist() == [["nested", "1"]]
+
+    def test_no_table(self):
+        """
+        Unit test for :py:func:`mlbids._htmltable.read_table` with a document without a table.
+        """
+        with pytest.raises(_htmltable.NoTableError):
+            _htmltable.read_table("<html><body><p>Sign in</p></body></html>")
+
+    def test_matches_read_html(self):
+        """
+        Unit test for :py:func:`mlbids._htmltable.read_table` against ``pandas.read_html`` on the
+        web view of the player ID map.
+        """
+        html = read_webview()
+        expected = pd.read_html(io.BytesIO(html))[0]
+        expected.rename(columns=expected.iloc[0], inplace=True)
+        expected.drop(
+            index=[expected.index[0], expected.index[1]], columns=[expected.columns[0]],
+            inplace=True
+        )
+        expected.dropna(axis=1, how="all", inplace=True)
+
+        df = _htmltable.read_table(
+            io.BytesIO(html), header=0, skip_rows=(1,), skip_columns=(0,)
+        ).dropna(axis=1, how="all")
+
+        pd.testing.assert_frame_equal(
+            df, expected.reset_index(drop=True).astype(object), check_column_type=False
+        )
+
+
+class TestReadData:
+    """
+    Offline unit tests for the web view downloads of :py:class:`mlbids.playeridmap.PlayerIDMap`.
+    """
+    def test_read_data(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_data`.
+        """
+        responses[playerid_map.web_view] = read_webview()
+        df = playerid_map.read_data()
+        assert len(df) == 200
+        assert df.columns.tolist() == playerid_map._playeridmap_reformat().columns
+        assert df.loc[:, "MLBID"].dtype == "int64"
+        assert df.loc[:, "PlayerName"].str.contains("ñ").any()
+
+    def test_read_data_fallback(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_data` when the web view holds
+        no table.
+        """
+        responses[playerid_map.web_view] = b"<html><body><p>Sign in</p></body></html>"
+        responses[playerid_map.csv_download] = \
+            b"IDPLAYER,PLAYERNAME,MLBID,ALLPOS,ACTIVE\njudgeaa01,Aaron Judge,592450,OF/RF,Y\n"
+        df = playerid_map.read_data()
+        assert df.loc[:, "PlayerID"].tolist() == ["judgeaa01"]
+
+    def test_read_changelog_data(self, playerid_map: playeridmap.PlayerIDMap, responses: dict):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.read_changelog_data`.
+        """
+        responses[playerid_map.changelog_web_view] = b"""
+        <table>
+            <thead><tr><th>A</th><th>B</th></tr></thead>
+            <tr><td>DATE</td><td>DESCRIPTION OF CHANGE</td></tr>
+            <tr><td>4/5/2022</td><td>Added</td></tr>
+            <tr><td>3/28/2022</td><td>Updated</td></tr>
+        </table>
+        """
+        df = playerid_map.read_changelog_data()
+        assert df.loc[:, "Date"].tolist() == [pd.Timestamp(2022, 4, 5), pd.Timestamp(2022, 3, 28)]
+        assert df.loc[:, "Description"].tolist() == ["Added", "Updated"]
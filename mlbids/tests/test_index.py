@@ -0,0 +1,142 @@
+"""
+Unit tests for :py:mod:`mlbids._index`.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _index
+
+
+class TestIDIndex:
+    """
+    Unit tests for :py:class:`mlbids._index.IDIndex`.
+    """
+    def test_integer(self):
+        """
+        Unit test for :py:class:`mlbids._index.IDIndex` over an integer ID column.
+        """
+        index = _index.IDIndex(pd.Series([10, 0, 30, 10, np.nan]), integer=True)
+        assert len(index) == 2
+        assert index.get(10) == 0
+        assert index.get("30") == 2
+        assert index.get(0) is None
+        assert index.get(20) is None
+        assert index.get_all(10) == [0, 3]
+        assert index.duplicates == {10: [0, 3]}
+
+    def test_string(self):
+        """
+        Unit test for :py:class:`mlbids._index.IDIndex` over a string ID column.
+        """
+        index = _index.IDIndex(pd.Series(["18401", " sa123 ", np.nan, "", 15640.0]), integer=False)
+        assert len(index) == 3
+        assert index.get(18401) == 0
+        assert index.get("sa123") == 1
+        assert index.get("15640") == 4
+        assert "" not in index
+        assert index.get_all("missing") == []
+
+    def test_update(self):
+        """
+        Unit test for :py:meth:`mlbids._index.IDIndex.update`.
+        """
+        index = _index.IDIndex(pd.Series([10, 20, 10, 30, 0]), integer=True)
+        values = pd.Series([10, 10, 40, 0, 20])
+        index.update(values, remap=np.array([0, -1, 1, 2, 3]), rows=np.array([2, 4]))
+
+        expected = _index.IDIndex(values, integer=True)
+        assert index.duplicates == expected.duplicates == {10: [0, 1]}
+        for value in (10, 20, 30, 40):
+            assert index.get_all(value) == expected.get_all(value)
+        assert index.get_indexer([40, 30, 20, 10]).tolist() == [2, -1, 4, 0]
+
+
+class TestTranslate:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.translate`.
+    """
+    def test_translate(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate`.
+        """
+        assert pidmap.translate(592450) == "15640"
+        assert pidmap.translate("15640", from_="FanGraphsID", to="YahooID") == 9552
+        assert pidmap.translate(592450, to="PlayerName") == "Aaron Judge"
+        assert pidmap.translate(123, default="x") == "x"
+
+    def test_translate_missing(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate` when the target ID is missing.
+        """
+        assert pidmap.translate(519293, to="FanDuelID") is None
+        assert pidmap.translate(519293, to="FantraxID") is None
+
+    def test_translate_duplicate(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate` when the source ID is duplicated.
+        """
+        assert pidmap.translate(9552, from_="YahooID", to="MLBID") == 592450
+        assert pidmap.index("YahooID").get_all(9552) == [1, 4]
+
+    def test_translate_coercion(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate` with IDs of other types, which must be
+        looked up as by :py:meth:`mlbids.PIDMap.translate_many`.
+        """
+        values = [
+            592450.0, "592450.0", " 592450 ", 592450.9, "1.5", "inf", "abc", 0, np.int64(592450)
+        ]
+        expected = pidmap.translate_many(values, to="PlayerID").tolist()
+        assert [pidmap.translate(v, to="PlayerID") for v in values] == expected
+        assert expected == [
+            "judgeaa01", "judgeaa01", "judgeaa01", None, None, None, None, None, "judgeaa01"
+        ]
+
+        values = [15640.0, "15640", " 15640 ", 15640.5, "x", np.int64(15640)]
+        expected = pidmap.translate_many(values, from_="FanGraphsID", to="PlayerID").tolist()
+        assert [pidmap.translate(v, from_="FanGraphsID", to="PlayerID") for v in values] == expected
+        assert expected == ["judgeaa01", "judgeaa01", "judgeaa01", None, None, "judgeaa01"]
+
+    def test_index(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.index`.
+        """
+        assert pidmap.index("MLBID") is pidmap.index("MLBID")
+        with pytest.raises(ValueError):
+            pidmap.index("PlayerName")
+
+
+class TestTranslateMany:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.translate_many`.
+    """
+    def test_translate_many(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate_many`.
+        """
+        values = pd.Series([592450, 1, np.nan, 660670], index=list("abcd"))
+        result = pidmap.translate_many(values, from_="MLBID", to="FanGraphsID")
+        assert result.index.tolist() == list("abcd")
+        assert result.tolist() == ["15640", None, None, "18401"]
+
+    def test_translate_many_array(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.translate_many` with an array and a sentinel.
+        """
+        values = np.array(["15640", "8048", "0", "18401"], dtype=object)
+        result = pidmap.translate_many(values, from_="FanGraphsID", to="FanDuelID", missing=-1)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype.kind == "i"
+        assert result.tolist() == [11491, -1, -1, 14384]
+
+    def test_translate_many_agrees(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test comparing :py:meth:`mlbids.PIDMap.translate_many` with
+        :py:meth:`mlbids.PIDMap.translate`.
+        """
+        values = pidmap.data.loc[:, "YahooID"].tolist() + [0, 12345]
+        result = pidmap.translate_many(values, from_="YahooID", to="PlayerID")
+        assert result.tolist() == [pidmap.translate(v, "YahooID", "PlayerID") for v in values]
@@ -0,0 +1,132 @@
+"""
+Unit tests for :py:mod:`mlbids._instrument`.
+"""
+
+import contextlib
+import os
+import typing
+
+import pytest
+
+import mlbids
+from mlbids import _instrument
+from mlbids import playeridmap
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def events() -> typing.List[_instrument.Event]:
+    """
+    :return: The events of the stages finished while the fixture is active
+    """
+    collected = []
+    _instrument.reset_counters()
+    _instrument.add_hook(collected.append)
+    yield collected
+    _instrument.remove_hook(collected.append)
+    _instrument.reset_counters()
+
+
+class _Span:
+    """
+    Stands in for an OpenTelemetry span.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.attributes = {}
+
+    def set_attributes(self, attributes: dict) -> None:
+        """
+        :param attributes: The attributes of the span
+        """
+        self.attributes.update(attributes)
+
+
+class _Tracer:
+    """
+    Stands in for an OpenTelemetry tracer.
+    """
+    def __init__(self):
+        self.spans = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str):
+        """
+        :param name: The name of the span
+        """
+        span = _Span(name)
+        self.spans.append(span)
+        yield span
+
+
+class TestStage:
+    """
+    Unit tests for :py:func:`mlbids._instrument.stage`.
+    """
+    def test_disabled(self):
+        """
+        Unit test for :py:func:`mlbids._instrument.stage` with instrumentation disabled.
+        """
+        assert not _instrument.enabled()
+        assert _instrument.stage("parse", rows=1) is _instrument._NULL_STAGE
+
+        _instrument.reset_counters()
+        _instrument.count("translate")
+        assert not _instrument.counters()
+
+    def test_hooks(self, events: list, responses: dict, playerid_map: playeridmap.PlayerIDMap):
+        """
+        Unit test for :py:func:`mlbids._instrument.add_hook`.
+        """
+        with open(os.path.join(FIXTURES, "playeridmap.csv"), "rb") as file:
+            responses[playerid_map.csv_download] = file.read()
+        df = playerid_map.read_csv()
+
+        stages = {e.stage: e for e in events}
+        assert list(stages) == ["http.get", "format.playeridmap", "read_csv"]
+        assert stages["http.get"].attributes["status"] == 200
+        assert stages["read_csv"].attributes["rows"] == len(df)
+        assert stages["read_csv"].attributes["bytes"] == len(responses[playerid_map.csv_download])
+        assert all(e.duration >= 0 for e in events)
+
+    def test_error(self, events: list):
+        """
+        Unit test for :py:func:`mlbids._instrument.stage` with a failed stage.
+        """
+        with pytest.raises(KeyError):
+            with _instrument.stage("parse"):
+                raise KeyError("ID")
+        assert events[0].attributes == {"error": "KeyError"}
+
+    def test_tracing(self):
+        """
+        Unit test for :py:func:`mlbids._instrument.enable_tracing`.
+        """
+        tracer = _Tracer()
+        _instrument.enable_tracing(tracer)
+        try:
+            with _instrument.stage("parse", url="https://example.com") as stage:
+                stage.set(rows=3, columns=["ID"])
+        finally:
+            _instrument.disable_tracing()
+
+        assert [s.name for s in tracer.spans] == ["parse"]
+        assert tracer.spans[0].attributes == {"url": "https://example.com", "rows": 3}
+
+
+class TestCount:
+    """
+    Unit tests for :py:func:`mlbids._instrument.count`.
+    """
+    def test_lookups(self, events: list, pidmap: mlbids.PIDMap):
+        """
+        Unit test for the lookup counters of :py:class:`mlbids.PIDMap`.
+        """
+        pidmap.translate(592450, from_="MLBID", to="PlayerID")
+        pidmap.translate_many([592450, 1], from_="MLBID", to="PlayerID")
+
+        assert _instrument.counters() == {
+            "translate": 1, "translate_many.values": 2, "translate_many.misses": 1
+        }
+        assert [e.attributes["column"] for e in events if e.stage == "index.build"] == ["MLBID"]
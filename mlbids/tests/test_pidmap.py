@@ -0,0 +1,118 @@
+"""
+Unit tests for :py:class:`mlbids.PIDMap`.
+"""
+
+import datetime
+
+import pandas as pd
+
+import mlbids
+from mlbids import playeridmap
+
+from .conftest import make_changelog_df
+from .test_diff import make_new_version
+
+
+class TestPIDMap:
+    """
+    Unit tests for :py:class:`mlbids.PIDMap`.
+    """
+    def test_lazy(self, downloads: dict):
+        """
+        Unit test for the lazy loading of :py:class:`mlbids.PIDMap`.
+        """
+        pidmap = mlbids.PIDMap()
+        assert pidmap.loaded == (False, False)
+        assert downloads == {"read_data": 0, "read_changelog_data": 0}
+
+        assert pidmap.last_update == datetime.datetime(2022, 4, 5)
+        assert pidmap.loaded == (False, True)
+        assert downloads == {"read_data": 0, "read_changelog_data": 1}
+
+        assert len(pidmap.mlb) == 5
+        assert pidmap.loaded == (True, True)
+        assert downloads == {"read_data": 1, "read_changelog_data": 1}
+
+    def test_prefetch(self, downloads: dict):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.prefetch`.
+        """
+        pidmap = mlbids.PIDMap().prefetch()
+        assert pidmap.loaded == (True, True)
+        pidmap.prefetch()
+        assert downloads == {"read_data": 1, "read_changelog_data": 1}
+
+    def test_prefetch_excel(self, monkeypatch, downloads: dict):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.prefetch` with *excel*.
+        """
+        read_excel = playeridmap.PlayerIDMap.read_excel
+        workbooks = []
+
+        def count_read_excel(self) -> playeridmap.PlayerIDMap.ExcelData:
+            workbooks.append(self)
+            return read_excel(self)
+
+        monkeypatch.setattr(playeridmap.PlayerIDMap, "read_excel", count_read_excel)
+        mlbids.PIDMap().prefetch()
+        assert not workbooks
+
+        pidmap = mlbids.PIDMap().prefetch(excel=True)
+        assert pidmap.loaded == (True, True)
+        assert workbooks == [pidmap.pid_map]
+        assert downloads == {"read_data": 2, "read_changelog_data": 2}
+
+    def test_refresh(self, monkeypatch, downloads: dict):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.refresh`.
+        """
+        pidmap = mlbids.PIDMap()
+        assert pidmap.translate(592450, to="PlayerID") == "judgeaa01"
+        assert pidmap.last_update == datetime.datetime(2022, 4, 5)
+
+        changes = pidmap.refresh()
+        assert not changes.players
+        assert downloads == {"read_data": 1, "read_changelog_data": 2}
+
+        changelog = make_changelog_df()
+        changelog.loc[-1] = [pd.Timestamp(2022, 4, 12), "Added rookies"]
+        changelog = changelog.sort_index().reset_index(drop=True)
+        monkeypatch.setattr(
+            playeridmap.PlayerIDMap, "read_changelog_data", lambda self: changelog
+        )
+        monkeypatch.setattr(playeridmap.PlayerIDMap, "read_data", lambda self: make_new_version())
+
+        changes = pidmap.refresh()
+        assert changes.added == ["rookie01"]
+        assert changes.removed == ["judgeaa01"]
+        assert pidmap.last_update == datetime.datetime(2022, 4, 12)
+        assert pidmap.translate(592450, to="PlayerID") is None
+        assert pidmap.translate(700000, to="PlayerID") == "rookie01"
+        assert pidmap.translate(660670, to="Team") == "SD"
+
+    def test_views(self, monkeypatch, pidmap: mlbids.PIDMap):
+        """
+        Unit test for the memoized views of :py:class:`mlbids.PIDMap`.
+        """
+        for site, columns in mlbids._SITE_COLUMNS.items():
+            view = getattr(pidmap, site)
+            assert view.columns.tolist() == pidmap.general.columns.tolist() + columns
+            memoized = pidmap._views[site][1]
+            assert getattr(pidmap, site) is not view
+            assert pidmap._views[site][1] is memoized
+        assert pidmap.info.columns.tolist()[-1] == "PlayerID"
+
+        fangraphs = pidmap.fangraphs
+        fangraphs.loc[:, "FanGraphsID"] = "0"
+        fangraphs.loc[0, "FanGraphsName"] = "Nobody"
+        fangraphs["Extra"] = 1
+        assert pidmap.data.loc[:, "FanGraphsID"].tolist()[0] == "18401"
+        assert pidmap.fangraphs.loc[:, "FanGraphsID"].tolist()[0] == "18401"
+        assert pidmap.fangraphs.loc[0, "FanGraphsName"] != "Nobody"
+        assert "Extra" not in pidmap.fangraphs
+        assert pidmap.translate("18401", from_="FanGraphsID", to="MLBID") == 660670
+
+        monkeypatch.setattr(playeridmap.PlayerIDMap, "read_data", lambda self: make_new_version())
+        pidmap.refresh(force=True)
+        assert pidmap.fangraphs is not fangraphs
+        assert "rookie01" in pidmap.fangraphs.loc[:, "PlayerID"].tolist()
@@ -0,0 +1,74 @@
+"""
+Unit tests for :py:mod:`mlbids._resolve`.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlbids
+
+KEYS = ["MLBID", ("MLBName", "Birthdate"), ("LastFirstName", "Team")]
+
+
+@pytest.fixture
+def feed() -> pd.DataFrame:
+    """
+    :return: A vendor feed whose rows each need a different key to be matched
+    """
+    return pd.DataFrame(
+        {
+            "MLBID": [592450, np.nan, 0, np.nan, 1],
+            "MLBName": ["Aaron Judge", "Ronald Acuna Jr", "Will Smith", "Will Smith", None],
+            "Birthdate": [None, "1997-12-18", None, None, None],
+            "LastFirstName": [None, None, "Smith, Will", "Smith, Will", None],
+            "Team": [None, None, "lad", None, None],
+        },
+        index=list("abcde")
+    )
+
+
+class TestResolve:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.resolve`.
+    """
+    def test_resolve(self, pidmap: mlbids.PIDMap, feed: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.resolve`.
+        """
+        df = pidmap.resolve(feed, KEYS)
+        assert df.index.tolist() == list("abcde")
+        assert df["PlayerID"].tolist() == ["judgeaa01", "acunaro01", "smithwi05", None, None]
+        assert df["MatchRule"].tolist() == [
+            "MLBID", "MLBName+Birthdate", "LastFirstName+Team", None, None
+        ]
+
+    def test_ambiguous(self, pidmap: mlbids.PIDMap, feed: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.resolve` with keys shared by several players.
+        """
+        df = pidmap.resolve(feed, ["LastFirstName", "MLBName"])
+        assert df["PlayerID"].tolist() == ["judgeaa01", "acunaro01", None, None, None]
+        assert df["MatchRule"].tolist() == ["MLBName", "MLBName", None, None, None]
+
+    def test_mapping(self, pidmap: mlbids.PIDMap, feed: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.resolve` with differently named columns.
+        """
+        feed = feed.rename(columns={"MLBID": "mlb_id", "MLBName": "name"})
+        df = pidmap.resolve(feed, [{"mlb_id": "MLBID"}, {"name": "PlayerName", "Team": "Team"}])
+        assert df["PlayerID"].tolist() == ["judgeaa01", None, "smithwi05", None, None]
+        assert df["MatchRule"].tolist() == ["MLBID", None, "PlayerName+Team", None, None]
+
+        with pytest.raises(ValueError):
+            pidmap.resolve(feed, ["MLBID"])
+        with pytest.raises(ValueError):
+            pidmap.resolve(feed, [{"name": "Nickname"}])
+
+    def test_compact(self, downloads: dict, feed: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.resolve` in the compact schema.
+        """
+        pidmap = mlbids.PIDMap(compact=True)
+        df = pidmap.resolve(feed, KEYS)
+        assert df["PlayerID"].tolist() == ["judgeaa01", "acunaro01", "smithwi05", None, None]
@@ -0,0 +1,105 @@
+"""
+Unit tests for :py:mod:`mlbids._schema`.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _schema
+
+
+class TestSchema:
+    """
+    Unit tests for :py:func:`mlbids._schema.load_schema`.
+    """
+    def test_load_schema(self):
+        """
+        Unit test for :py:func:`mlbids._schema.load_schema`.
+        """
+        path = os.path.join("mlbids", "data", "playeridmap_columns.json")
+        with open(path, "r", encoding="utf-8") as file:
+            columns = json.load(file)
+
+        schema = _schema.load_schema()
+        assert list(schema.dtypes) == columns
+        assert set(schema.dtypes.values()) <= {
+            "string", "category", "id", "boolean", "datetime", "positions"
+        }
+        assert len(schema.positions) == len(set(schema.positions))
+
+
+class TestPositionCodec:
+    """
+    Unit tests for :py:class:`mlbids._schema.PositionCodec`.
+    """
+    def test_roundtrip(self):
+        """
+        Unit test for :py:meth:`mlbids._schema.PositionCodec.encode` and
+        :py:meth:`mlbids._schema.PositionCodec.decode`.
+        """
+        positions = pd.Series([["OF", "CF"], ["C"], np.nan, ["P", "XX"]], index=[5, 6, 7, 8])
+        codec = _schema.PositionCodec.fit(positions, ["C", "P", "OF"])
+        assert codec.vocabulary == ("C", "P", "OF", "CF", "XX")
+
+        masks = codec.encode(positions)
+        assert masks.dtype == np.uint32
+        assert masks.tolist() == [0b01100, 0b00001, 0, 0b10010]
+        assert masks[0] & codec.bit("CF")
+
+        decoded = codec.decode(masks)
+        assert decoded.iloc[0] == ["OF", "CF"]
+        assert decoded.iloc[1] == ["C"]
+        assert decoded.isna().iloc[2]
+
+    def test_unknown(self):
+        """
+        Unit test for :py:meth:`mlbids._schema.PositionCodec.encode` with unknown positions.
+        """
+        with pytest.raises(KeyError):
+            _schema.PositionCodec(["C"]).encode(pd.Series([["1B"]]))
+
+
+class TestCompact:
+    """
+    Unit tests for :py:func:`mlbids._schema.compact`.
+    """
+    def test_compact(self, playeridmap_df: pd.DataFrame):
+        """
+        Unit test for :py:func:`mlbids._schema.compact`.
+        """
+        df = _schema.compact(playeridmap_df)
+        assert list(df.columns) == list(playeridmap_df.columns)
+        assert df.loc[:, "Team"].dtype == "category"
+        assert df.loc[:, "MLBID"].dtype == np.int32
+        assert df.loc[:, "Active"].dtype == "boolean"
+        assert df.loc[:, "Active"].tolist() == playeridmap_df.loc[:, "Active"].tolist()
+        assert df.loc[:, "MLBID"].tolist() == playeridmap_df.loc[:, "MLBID"].tolist()
+
+        codec = _schema.PositionCodec(df.attrs["AllPositions"])
+        decoded = codec.decode(df.loc[:, "AllPositions"])
+        assert [set(x) for x in decoded] == [set(x) for x in playeridmap_df.loc[:, "AllPositions"]]
+
+    def test_memory_report(self, playeridmap_df: pd.DataFrame):
+        """
+        Unit test for :py:func:`mlbids._schema.memory_report`.
+        """
+        df = pd.concat([playeridmap_df] * 200, ignore_index=True)
+        report = _schema.memory_report(df)
+        assert list(report.index) == list(df.columns) + ["Total"]
+        assert report.loc["Total", "compact_bytes"] < report.loc["Total", "bytes"]
+        assert report.loc["AllPositions", "saving"] > 0.5
+
+    def test_pidmap_compact(self, downloads: dict):
+        """
+        Unit test for the *compact* parameter of :py:class:`mlbids.PIDMap`.
+        """
+        pidmap = mlbids.PIDMap(compact=True)
+        assert pidmap.compact
+        assert pidmap.translate(592450, to="FanGraphsID") == "15640"
+        decoded = pidmap.decode_positions(pidmap.data.loc[:, "AllPositions"])
+        assert decoded.iloc[0] == ["CF", "RF", "OF"]
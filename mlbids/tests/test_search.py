@@ -0,0 +1,98 @@
+"""
+Unit tests for :py:mod:`mlbids._search`.
+"""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _search
+
+
+class TestFold:
+    """
+    Unit tests for :py:func:`mlbids._search.fold`.
+    """
+    def test_fold(self):
+        """
+        Unit test for :py:func:`mlbids._search.fold`.
+        """
+        assert _search.fold("Ronald Acuña Jr.") == "acuna ronald"
+        assert _search.fold("Acuna Jr., Ronald") == "acuna ronald"
+        assert _search.fold("A.J. O'Neill") == "aj oneill"
+        assert _search.fold("Jr.") == "jr"
+
+
+class TestNameIndex:
+    """
+    Unit tests for :py:class:`mlbids._search.NameIndex`.
+    """
+    def test_search(self):
+        """
+        Unit test for :py:meth:`mlbids._search.NameIndex.search`.
+        """
+        names = pd.DataFrame({
+            "PlayerName": ["José Ramírez", "Jose Abreu", "Aaron Judge"],
+            "ESPNName": ["Jose Ramirez", None, "Aaron Judge"],
+        })
+        index = _search.NameIndex(names)
+        assert len(index) == 3
+
+        matches = index.search("Ramirez, Jose")
+        assert matches[0] == _search.Match(0, "PlayerName", "José Ramírez", 1.0)
+        assert index.search("Jose Ramirez", columns=["ESPNName"])[0].column == "ESPNName"
+        assert index.search("Aron Judg")[0].row == 2
+        assert index.search("Mookie Betts") == []
+        with pytest.raises(ValueError):
+            index.search("Aaron Judge", columns=["YahooName"])
+
+
+class TestSearchName:
+    """
+    Unit tests for :py:meth:`mlbids.PIDMap.search_name` and :py:meth:`mlbids.PIDMap.search_names`.
+    """
+    def test_search_name(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.search_name`.
+        """
+        df = pidmap.search_name("Ronald Acuña")
+        assert df.loc[:, "PlayerID"].tolist() == ["acunaro01"]
+        assert df.loc[:, "Score"].tolist() == [1.0]
+
+        df = pidmap.search_name("Will Smith")
+        assert sorted(df.loc[:, "PlayerID"].tolist()) == ["smithwi04", "smithwi05"]
+        assert pidmap.search_name("Will Smith", team="LAD").loc[:, "PlayerID"].tolist() == \
+            ["smithwi05"]
+        assert pidmap.search_name(
+            "Will Smith", birthdate=datetime.date(1989, 7, 10)
+        ).loc[:, "PlayerID"].tolist() == ["smithwi04"]
+
+        assert pidmap.search_name("Acuna, Ronald", site="nfbc").loc[:, "Column"].tolist() == \
+            ["NFBCName"]
+        with pytest.raises(ValueError):
+            pidmap.search_name("Aaron Judge", site="ottoneu")
+
+    def test_search_name_matches(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.search_name_matches`.
+        """
+        df = pidmap.search_name("Will Smith")
+        matches = pidmap.search_name_matches("Will Smith")
+        assert [m.row for m in matches] == df.index.tolist()
+        assert [m.player_id for m in matches] == df.loc[:, "PlayerID"].tolist()
+        assert [m.team for m in matches] == df.loc[:, "Team"].tolist()
+        assert [m.birthdate for m in matches] == df.loc[:, "Birthdate"].tolist()
+        assert [m.score for m in matches] == df.loc[:, "Score"].tolist()
+        assert pidmap.search_name_matches("Nobody At All") == []
+
+    def test_search_names(self, pidmap: mlbids.PIDMap):
+        """
+        Unit test for :py:meth:`mlbids.PIDMap.search_names`.
+        """
+        queries = pd.Series(["Aaron Judge", "Gleyber Torres", "Nobody", None], index=list("abcd"))
+        df = pidmap.search_names(queries)
+        assert df.index.tolist() == list("abcd")
+        assert df.loc[["a", "b"], "PlayerID"].tolist() == ["judgeaa01", "torregl01"]
+        assert df.loc[["c", "d"], "PlayerID"].isna().all()
@@ -0,0 +1,197 @@
+"""
+Offline unit tests for :py:mod:`mlbids._server`.
+"""
+
+import datetime
+import http.client
+import json
+import socket
+import threading
+
+import pandas as pd
+import pytest
+import requests
+
+import mlbids
+from mlbids import _server
+from mlbids import playeridmap
+from mlbids.tests import conftest
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over a Unix domain socket.
+    """
+    def __init__(self, path: str):
+        super().__init__("localhost")
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+@pytest.fixture
+def service(downloads: dict) -> _server.Service:
+    """
+    :return: A lookup service of the offline player ID map, which never refreshes on its own
+    """
+    return _server.Service(refresh_interval=0).start()
+
+
+@pytest.fixture
+def base_url(service: _server.Service) -> str:
+    """
+    :return: The URL of a lookup daemon serving *service* on a free port
+    """
+    httpd = _server.make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://{}:{}".format(*httpd.server_address[:2])
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+class TestServer:
+    """
+    Unit tests for the endpoints of :py:mod:`mlbids._server`.
+    """
+    def test_translate(self, base_url: str):
+        """
+        Unit test for the ``/translate`` endpoint.
+        """
+        with requests.Session() as session:
+            res = session.post(f"{base_url}/translate", json={
+                "from": "MLBID", "to": "PlayerID", "ids": [592450, 1, "669257"]
+            })
+            assert res.json() == {"results": ["judgeaa01", None, "smithwi05"]}
+
+            res = session.post(f"{base_url}/translate", json={
+                "from": "FanGraphsID", "to": ["MLBID", "FanDuelID"], "ids": ["15640", "8048"]
+            })
+            assert res.json() == {
+                "results": {"MLBID": [592450, 519293], "FanDuelID": [11491, None]}
+            }
+
+            res = session.get(f"{base_url}/translate?from=YahooID&to=FanGraphsID&id=10590")
+            assert res.json() == {"results": ["18401"]}
+
+            res = session.post(f"{base_url}/translate", json={"from": "PlayerName", "ids": []})
+            assert res.status_code == 400
+            assert session.post(f"{base_url}/translate", data=b"{").status_code == 400
+            assert session.get(f"{base_url}/missing").status_code == 404
+
+            stats = session.get(f"{base_url}/stats").json()["endpoints"]["/translate"]
+            assert stats["requests"] == 5
+            assert stats["errors"] == 2
+            assert stats["items"] == 6
+
+    def test_search(self, base_url: str):
+        """
+        Unit test for the ``/search`` endpoint.
+        """
+        res = requests.post(f"{base_url}/search", json={"names": ["Aaron Judge", "Nobody"]})
+        results = res.json()["results"]
+        assert results[0]["PlayerID"] == "judgeaa01"
+        assert results[1]["PlayerID"] is None
+
+        res = requests.get(f"{base_url}/search", params={"q": "Will Smith", "limit": 2})
+        assert sorted(r["PlayerID"] for r in res.json()["results"]) == ["smithwi04", "smithwi05"]
+
+        res = requests.get(f"{base_url}/search", params={"q": "Will Smith", "limit": "two"})
+        assert res.status_code == 400
+        res = requests.get(f"{base_url}/search", params={"q": "Will Smith", "limit": -1})
+        assert res.status_code == 400
+
+    @pytest.mark.parametrize(
+        "path, request_",
+        [
+            ("/translate", {"from": ["MLBID"], "to": "PlayerID", "ids": [592450]}),
+            ("/translate", {"from": "MLBID", "to": "PlayerID", "ids": [[592450]]}),
+            ("/translate", {"from": "MLBID", "to": "PlayerID", "ids": [{"id": 592450}]}),
+            ("/search", {"names": ["Aaron Judge"], "threshold": "high"}),
+            ("/search", {"names": ["Aaron Judge"], "threshold": 2}),
+            ("/search", {"names": ["Aaron Judge"], "teams": "NYY"}),
+            ("/search", {"names": ["Aaron Judge"], "birthdates": ["1992-04-26", None]}),
+            ("/search", {"names": ["Aaron Judge"], "site": ["espn"]}),
+            ("/search", {"names": [["Aaron Judge"]]}),
+        ]
+    )
+    def test_bad_request(self, base_url: str, path: str, request_: dict):
+        """
+        Unit test for the endpoints of :py:mod:`mlbids._server` with malformed requests.
+        """
+        res = requests.post(f"{base_url}{path}", json=request_)
+        assert res.status_code == 400
+        assert "error" in res.json()
+
+    def test_translate_lists(self, base_url: str):
+        """
+        Unit test for the ``/translate`` endpoint with a list-valued column.
+        """
+        res = requests.post(f"{base_url}/translate", json={
+            "from": "MLBID", "to": "AllPositions", "ids": [592450, 1]
+        })
+        assert res.status_code == 200
+        assert res.json() == {"results": [["OF", "RF"], None]}
+
+    def test_unix_socket(self, tmp_path, service: _server.Service):
+        """
+        Unit test for :py:class:`mlbids._server.UnixHTTPServer`.
+        """
+        path = str(tmp_path / "mlbids.sock")
+        httpd = _server.make_server(service, unix_socket=path)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            connection = _UnixConnection(path)
+            for _ in range(2):
+                connection.request("GET", "/health")
+                body = json.loads(connection.getresponse().read())
+                assert body["status"] == "ok"
+                assert body["last_update"] == "2022-04-05T00:00:00"
+            connection.close()
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+            thread.join()
+
+
+class TestService:
+    """
+    Unit tests for :py:class:`mlbids._server.Service`.
+    """
+    def test_refresh(self, monkeypatch, service: _server.Service):
+        """
+        Unit test for :py:meth:`mlbids._server.Service.refresh`.
+        """
+        service.translate({"from": "MLBID", "to": "PlayerID", "ids": [592450]})
+        current = service.pid_map
+        assert not service.refresh()
+        assert service.pid_map is current
+
+        changelog = conftest.make_changelog_df()
+        changelog.loc[-1] = [pd.Timestamp("2022-04-12"), "Added players"]
+        changelog = changelog.sort_index().reset_index(drop=True)
+        monkeypatch.setattr(
+            playeridmap.PlayerIDMap, "read_changelog_data", lambda self: changelog.copy()
+        )
+        checked = []
+
+        def check_for_update(self, since=None):
+            checked.append(self)
+            return playeridmap.PlayerIDMap.UpdateStatus(
+                updated=True, last_update=datetime.datetime(2022, 4, 12), not_modified=False,
+                etag=None, last_modified=None
+            )
+
+        monkeypatch.setattr(playeridmap.PlayerIDMap, "check_for_update", check_for_update)
+        assert service.refresh()
+        assert service.pid_map is not current
+        assert service.pid_map.last_update == datetime.datetime(2022, 4, 12)
+        assert "MLBID" in service.pid_map._indexes
+        assert isinstance(service.pid_map, mlbids.PIDMap)
+
+        assert not service.refresh()
+        assert checked == [current.pid_map, current.pid_map]
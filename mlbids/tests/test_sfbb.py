@@ -2,7 +2,10 @@
 Unit tests for :py:mod:`mlbids._sfbb`.
 """
 
+import os
 
+import bs4
+import pytest
 import requests
 
 from mlbids import _sfbb
@@ -36,8 +39,7 @@ class TestSFBBData:
         """
         Unit test for :py:meth:`mlbids.playerids.SFBBTools._element`.
         """
-        css = "div.entry-content > div > table tr:nth-child(2) > td:first-child"
-        assert len(self.sfbb_data._soup.select(css)) == 1
+        assert len(self.sfbb_data._soup.select(_sfbb.SFBBTools._urls_css)) == 1
 
     def test_urls(self):
         """
@@ -50,3 +52,123 @@ class TestSFBBData:
         for url in self.sfbb_data.urls:
             res = requests.get(url, headers=_sfbb.HEADERS)
             assert res.status_code == 200
+
+
+TOOLS_PAGE = """
+<html><body><div class="entry-content"><div><table>
+<tr><td>Header</td></tr>
+<tr><td>
+<a href="https://example.com/excel">Excel</a>
+<a href="https://example.com/web">Web</a>
+<a href="https://example.com/csv">CSV</a>
+<a href="https://example.com/changelog-web">Changelog Web</a>
+<a href="https://example.com/changelog-csv">Changelog CSV</a>
+</td></tr>
+</table></div></div></body></html>
+"""
+
+
+class TestSFBBToolsCache:
+    """
+    Unit tests for the URL cache of :py:class:`mlbids._sfbb.SFBBTools`.
+    """
+    @pytest.fixture
+    def scrapes(self, monkeypatch) -> list:
+        """
+        Replaces :py:func:`mlbids._sfbb.get_soup` with an offline stand-in which records each call.
+        """
+        calls = []
+
+        def get_soup(url: str) -> bs4.BeautifulSoup:
+            calls.append(url)
+            return bs4.BeautifulSoup(TOOLS_PAGE, features="lxml")
+
+        monkeypatch.setattr(_sfbb, "get_soup", get_soup)
+        monkeypatch.setattr(_sfbb.SFBBTools, "_url_cache", {})
+        return calls
+
+    def test_urls_memory_cache(self, scrapes: list):
+        """
+        Unit test for :py:attr:`mlbids._sfbb.SFBBTools.urls`.
+        """
+        urls = _sfbb.SFBBTools().urls
+        assert urls.csv_download == "https://example.com/csv"
+        assert _sfbb.SFBBTools().urls == urls
+        assert len(scrapes) == 1
+
+    def test_urls_ttl(self, scrapes: list):
+        """
+        Unit test for :py:attr:`mlbids._sfbb.SFBBTools.ttl`.
+        """
+        sfbb = _sfbb.SFBBTools(ttl=0)
+        assert sfbb.urls == sfbb.urls
+        assert len(scrapes) == 2
+
+    def test_urls_disk_cache(self, scrapes: list, tmp_path):
+        """
+        Unit test for :py:attr:`mlbids._sfbb.SFBBTools.cache_path`.
+        """
+        path = str(tmp_path / "urls.json")
+        urls = _sfbb.SFBBTools(cache_path=path).urls
+        assert os.path.exists(path)
+
+        _sfbb.SFBBTools._url_cache.clear()
+        assert _sfbb.SFBBTools(cache_path=path).urls == urls
+        assert len(scrapes) == 1
+
+    def test_invalidate(self, scrapes: list, tmp_path):
+        """
+        Unit test for :py:meth:`mlbids._sfbb.SFBBTools.invalidate`.
+        """
+        path = str(tmp_path / "urls.json")
+        sfbb = _sfbb.SFBBTools(cache_path=path)
+        assert sfbb.urls
+        sfbb.invalidate()
+        assert not os.path.exists(path)
+        assert sfbb.urls
+        assert len(scrapes) == 2
+
+    def test_update_urls_invalid(self, scrapes: list):
+        """
+        Unit test for :py:meth:`mlbids._sfbb.SFBBTools.update_urls` with a page which does not
+        contain the redirect URLs.
+        """
+        sfbb = _sfbb.SFBBTools()
+        with pytest.raises(ValueError, match="No element"):
+            sfbb.update_urls("<html><body></body></html>")
+        with pytest.raises(ValueError, match="Expected 5"):
+            sfbb.update_urls(TOOLS_PAGE.replace('<a href="https://example.com/csv">CSV</a>', ""))
+        assert sfbb.cached_urls is None
+
+
+class TestSession:
+    """
+    Unit tests for :py:func:`mlbids._sfbb.get_session` and :py:func:`mlbids._sfbb.get`.
+    """
+    def test_get_session(self):
+        """
+        Unit test for :py:func:`mlbids._sfbb.get_session`.
+        """
+        session = _sfbb.get_session()
+        assert session is _sfbb.get_session()
+        assert session.headers["User-Agent"] == _sfbb.HEADERS["User-Agent"]
+        assert session.get_adapter("https://example.com").max_retries.total == 3
+
+    def test_get(self, monkeypatch):
+        """
+        Unit test for :py:func:`mlbids._sfbb.get`.
+        """
+        calls = []
+
+        def get(url: str, **kwargs) -> requests.Response:
+            calls.append((url, kwargs))
+            res = requests.Response()
+            res.status_code = 503 if "error" in url else 200
+            res.url = url
+            return res
+
+        monkeypatch.setattr(_sfbb.get_session(), "get", get)
+        assert _sfbb.get("https://example.com").status_code == 200
+        assert calls == [("https://example.com", {"timeout": _sfbb.TIMEOUT})]
+        with pytest.raises(requests.HTTPError):
+            _sfbb.get("https://example.com/error")
@@ -0,0 +1,125 @@
+"""
+Unit tests for :py:mod:`mlbids._shared`.
+"""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlbids
+from mlbids import _shared
+
+
+def _translate_in_worker(name: str) -> list:
+    """
+    :param name: The name of a published shared memory block
+    :return: The **PlayerID** of each player, translated from **MLBID** in another process
+    """
+    with _shared.SharedIDMap.attach(name) as shared:
+        return shared.translate_many([660670, 592450, 1], from_="MLBID", to="PlayerID").tolist()
+
+
+def _run(script: str, *args: str) -> subprocess.CompletedProcess:
+    """
+    Runs a script in a new Python process, which stops its resource tracker before exiting, so
+    that the output of the tracker is included in *stderr*.
+
+    :param script: The Python source of the script
+    :param args: The command line arguments of the script
+    :return: The completed process, with its *stdout* and *stderr*
+    """
+    script += (
+        "from multiprocessing import resource_tracker\n"
+        "resource_tracker._resource_tracker._stop()\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script, *args], capture_output=True, check=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(_shared.__file__))
+    )
+
+
+@pytest.fixture
+def shared(pidmap: mlbids.PIDMap) -> _shared.SharedIDMap:
+    """
+    :return: The ID columns of the offline player ID map, published to shared memory
+    """
+    with pidmap.share() as shared:
+        yield shared
+
+
+class TestSharedIDMap:
+    """
+    Unit tests for :py:class:`mlbids._shared.SharedIDMap`.
+    """
+    def test_translate(self, pidmap: mlbids.PIDMap, shared: _shared.SharedIDMap):
+        """
+        Unit test for :py:meth:`mlbids._shared.SharedIDMap.translate_many`.
+        """
+        values = pd.Series(["15640", " 19197 ", 19197.0, None, "99999"], index=list("abcde"))
+        expected = pidmap.translate_many(values, from_="FanGraphsID", to="FanDuelID", missing=-1)
+        result = shared.translate_many(values, from_="FanGraphsID", to="FanDuelID", missing=-1)
+        pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+        assert shared.translate(9552, from_="YahooID", to="PlayerID") == "judgeaa01"
+        assert shared.translate(519293, from_="MLBID", to="FantraxID", default="") == ""
+        with pytest.raises(ValueError):
+            shared.translate(592450, from_="PlayerName")
+
+    def test_attach(self, shared: _shared.SharedIDMap):
+        """
+        Unit test for :py:meth:`mlbids._shared.SharedIDMap.attach`.
+        """
+        with _shared.SharedIDMap.attach(shared.name) as attached:
+            assert not attached.owner
+            assert len(attached) == len(shared) == 5
+            column = attached.column("MLBID")
+            assert not column.flags.writeable
+            np.testing.assert_array_equal(column, shared.column("MLBID"))
+            del column
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            result = pool.apply(_translate_in_worker, (shared.name,))
+        assert result == ["acunaro01", "judgeaa01", None]
+        assert shared.translate(592450, to="PlayerID") == "judgeaa01"
+
+    def test_attach_fork(self):
+        """
+        Unit test for :py:meth:`mlbids._shared.SharedIDMap.attach` in forked workers, which share
+        the resource tracker of the publisher and must leave its registration of the block.
+        """
+        result = _run(
+            "import multiprocessing\n"
+            "from mlbids import _shared\n"
+            "from mlbids.tests.conftest import make_playeridmap_df\n"
+            "from mlbids.tests.test_shared import _translate_in_worker\n"
+            "shared = _shared.SharedIDMap.publish(make_playeridmap_df())\n"
+            "with multiprocessing.get_context('fork').Pool(1) as pool:\n"
+            "    print(pool.apply(_translate_in_worker, (shared.name,)))\n"
+            "shared.close()\n"
+            "shared.unlink()\n"
+        )
+        assert result.stdout.strip() == "['acunaro01', 'judgeaa01', None]"
+        assert "KeyError" not in result.stderr
+
+    def test_attach_process(self, shared: _shared.SharedIDMap):
+        """
+        Unit test for :py:meth:`mlbids._shared.SharedIDMap.attach` in an unrelated process, whose
+        own resource tracker must not unlink the block when the process exits.
+        """
+        result = _run(
+            "import sys\n"
+            "from mlbids import _shared\n"
+            "with _shared.SharedIDMap.attach(sys.argv[1]) as shared:\n"
+            "    print(shared.translate(592450, to='PlayerID'))\n",
+            shared.name
+        )
+        assert result.stdout.strip() == "judgeaa01"
+        assert "leaked" not in result.stderr
+        with _shared.SharedIDMap.attach(shared.name) as attached:
+            assert len(attached) == 5
@@ -0,0 +1,78 @@
+"""
+Unit tests for :py:mod:`mlbids._snapshot`.
+"""
+
+import datetime
+import os
+import pickle
+
+import pandas as pd
+
+import mlbids
+from mlbids import _snapshot
+
+
+class TestSnapshotStore:
+    """
+    Unit tests for :py:class:`mlbids._snapshot.SnapshotStore`.
+    """
+    def test_default_directory(self, monkeypatch, tmp_path):
+        """
+        Unit test for :py:func:`mlbids._snapshot.default_directory`.
+        """
+        monkeypatch.setenv("MLBIDS_CACHE_DIR", str(tmp_path))
+        assert _snapshot.SnapshotStore().directory == str(tmp_path)
+
+    def test_save_load(self, tmp_path, playeridmap_df: pd.DataFrame, changelog_df: pd.DataFrame):
+        """
+        Unit test for :py:meth:`mlbids._snapshot.SnapshotStore.save` and
+        :py:meth:`mlbids._snapshot.SnapshotStore.load`.
+        """
+        store = _snapshot.SnapshotStore(str(tmp_path))
+        assert store.load() is None
+        assert store.is_stale(changelog_df)
+
+        store.save(playeridmap_df, changelog_df)
+        snapshot = store.load()
+        assert snapshot.version == datetime.datetime(2022, 4, 5)
+        pd.testing.assert_frame_equal(snapshot.data, playeridmap_df)
+        pd.testing.assert_frame_equal(snapshot.changelog, changelog_df)
+        assert not store.is_stale(changelog_df)
+
+        newer = pd.concat(
+            [pd.DataFrame({"Date": [pd.Timestamp("2022-05-01")], "Description": ["New"]}),
+             changelog_df],
+            ignore_index=True
+        )
+        assert store.is_stale(newer)
+
+        store.clear()
+        assert store.load() is None
+
+    def test_pidmap_snapshot(self, tmp_path, downloads: dict):
+        """
+        Unit test for the *snapshot* parameter of :py:class:`mlbids.PIDMap`.
+        """
+        first = mlbids.PIDMap(snapshot=str(tmp_path)).data
+        second = mlbids.PIDMap(snapshot=str(tmp_path)).data
+        assert downloads == {"read_data": 1, "read_changelog_data": 1}
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_unreadable(self, tmp_path, downloads: dict):
+        """
+        Unit test for :py:meth:`mlbids._snapshot.SnapshotStore.load` with snapshots which cannot
+        be unpickled.
+        """
+        store = _snapshot.SnapshotStore(str(tmp_path))
+        mlbids.PIDMap(snapshot=store.directory).prefetch()
+        path = os.path.join(store.directory, "playeridmap.pkl")
+        assert store.load() is not None
+
+        foreign = b"\x80\x04cmlbids_missing_module\nFrame\n)\x81."
+        for contents in (b"\x80\x04corrupt", foreign, pickle.dumps(["not", "a", "frame"])):
+            with open(path, "wb") as file:
+                file.write(contents)
+            assert store.load() is None
+
+        assert len(mlbids.PIDMap(snapshot=store.directory).data) == 5
+        assert downloads == {"read_data": 2, "read_changelog_data": 2}
@@ -0,0 +1,92 @@
+"""
+Offline unit tests for :py:mod:`mlbids._transport`.
+"""
+
+import os
+
+import pytest
+import requests
+
+from mlbids import _sfbb
+from mlbids import _transport
+from mlbids import playeridmap
+from mlbids.tests.fixtures import generate
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch) -> str:
+    """
+    Lays out the fixture pages for :py:class:`mlbids._transport.DirectoryTransport`, under the
+    origin URLs of the synthetic Tools page, and empties the in-memory cache of redirect URLs.
+
+    :return: The directory holding the pages
+    """
+    names = {_sfbb.SFBBTools().base_address: generate.TOOLS_FILE}
+    names.update(zip(generate.URLS[1:], generate.FILES))
+    for url, name in names.items():
+        with open(os.path.join(FIXTURES, name), "rb") as source:
+            (tmp_path / _transport.key(url)).write_bytes(source.read())
+
+    monkeypatch.setattr(_sfbb.SFBBTools, "_url_cache", {})
+    yield str(tmp_path)
+    _transport.set_transport(None)
+
+
+class TestTransport:
+    """
+    Unit tests for the transports of :py:mod:`mlbids._transport`.
+    """
+    def test_directory(self, directory: str):
+        """
+        Unit test for :py:class:`mlbids._transport.DirectoryTransport`.
+        """
+        _transport.set_transport(_transport.DirectoryTransport(directory))
+        df = playeridmap.PlayerIDMap().read_data()
+        assert len(df) == 200
+
+        with pytest.raises(requests.HTTPError):
+            _sfbb.get("https://example.com/missing")
+
+    def test_stand_in_server(self, directory: str):
+        """
+        Unit test for :py:class:`mlbids._transport.StandInServer` with
+        :py:class:`mlbids._transport.MirrorTransport`.
+        """
+        with _transport.StandInServer(directory) as server:
+            _transport.set_transport(_transport.from_location(server.url))
+            pid_map = playeridmap.PlayerIDMap()
+            assert len(pid_map.read_csv()) == 200
+            assert len(pid_map.read_changelog_data()) == 50
+
+            with pytest.raises(requests.HTTPError):
+                _sfbb.get("https://example.com/missing")
+
+    def test_mirror_fallback(self, responses: dict):
+        """
+        Unit test for :py:attr:`mlbids._transport.MirrorTransport.fallback`.
+        """
+        mirror = _transport.MirrorTransport("https://mirror.example.com", fallback=True)
+        responses["https://example.com/page"] = b"origin"
+        responses[mirror.url("https://example.com/cached")] = b"mirror"
+
+        _transport.set_transport(mirror)
+        try:
+            assert _sfbb.get("https://example.com/page").content == b"origin"
+            assert _sfbb.get("https://example.com/cached").content == b"mirror"
+        finally:
+            _transport.set_transport(None)
+
+    def test_environment(self, monkeypatch, tmp_path):
+        """
+        Unit test for :py:func:`mlbids._transport.get_transport` with ``MLBIDS_MIRROR`` set.
+        """
+        monkeypatch.setenv("MLBIDS_MIRROR", str(tmp_path))
+        _transport.set_transport(None)
+        try:
+            transport = _transport.get_transport()
+            assert isinstance(transport, _transport.DirectoryTransport)
+            assert transport.directory == str(tmp_path)
+        finally:
+            _transport.set_transport(None)
@@ -0,0 +1,77 @@
+"""
+Offline unit tests for :py:meth:`mlbids.playeridmap.PlayerIDMap.check_for_update`.
+"""
+
+import datetime
+import io
+import os
+
+import pytest
+import requests
+import urllib3
+
+from mlbids import _sfbb
+from mlbids import playeridmap
+
+CHANGELOG_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "changelog.csv")
+
+
+@pytest.fixture
+def requests_made(monkeypatch, playerid_map: playeridmap.PlayerIDMap) -> list:
+    """
+    Serves the synthetic CHANGELOG CSV with an ``ETag``, and answers requests which send that
+    ``ETag`` back with ``304 Not Modified``.
+
+    :return: The headers of each request made
+    """
+    with open(CHANGELOG_PATH, "rb") as file:
+        body = file.read()
+    made = []
+
+    def get(url: str, headers=None, **kwargs) -> requests.Response:
+        assert url == playerid_map.changelog_csv_download
+        made.append(dict(headers or {}))
+        res = requests.Response()
+        res.url = url
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            res.status_code = 304
+            res.raw = urllib3.HTTPResponse(body=io.BytesIO(b""), preload_content=False)
+        else:
+            res.status_code = 200
+            res.raw = urllib3.HTTPResponse(
+                body=io.BytesIO(body), preload_content=False, decode_content=False
+            )
+        res.headers["ETag"] = '"v1"'
+        return res
+
+    monkeypatch.setattr(_sfbb.get_session(), "get", get)
+    return made
+
+
+class TestCheckForUpdate:
+    """
+    Unit tests for :py:meth:`mlbids.playeridmap.PlayerIDMap.check_for_update`.
+    """
+    def test_since(self, requests_made: list, playerid_map: playeridmap.PlayerIDMap):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.check_for_update` with *since*.
+        """
+        status = playerid_map.check_for_update(since=datetime.datetime(2022, 4, 1))
+        assert status.updated
+        assert status.last_update == datetime.datetime(2022, 4, 5)
+        assert not status.not_modified
+        assert status.etag == '"v1"'
+        assert requests_made == [{}]
+
+        status = playerid_map.check_for_update(since=datetime.datetime(2022, 4, 5))
+        assert not status.updated
+        assert status.not_modified
+        assert status.last_update == datetime.datetime(2022, 4, 5)
+        assert requests_made[1] == {"If-None-Match": '"v1"'}
+
+    def test_previous_check(self, requests_made: list, playerid_map: playeridmap.PlayerIDMap):
+        """
+        Unit test for :py:meth:`mlbids.playeridmap.PlayerIDMap.check_for_update` without *since*.
+        """
+        assert playerid_map.check_for_update().updated
+        assert not playerid_map.check_for_update().updated